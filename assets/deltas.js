@@ -0,0 +1,92 @@
+// Clientside callbacks that apply the patches sent by
+// tutorial.utils.figure_diff to the figure already on the page, and the
+// changes sent from a tutorial.utils.elements.ElementStore to the elements
+// of a Cytoscape graph.
+(function() {
+	function setIn(value, path, op) {
+		// copies the containers along `path` and shares everything else
+		var copy = Array.isArray(value) ? value.slice() : Object.assign({}, value);
+		var key = path[0];
+		if (path.length > 1) {
+			copy[key] = setIn(value[key], path.slice(1), op);
+		} else if (op.op === 'delete') {
+			delete copy[key];
+		} else {
+			copy[key] = op.value;
+		}
+		return copy;
+	}
+
+	function applyPatch(value, patch) {
+		patch.forEach(function(op) {
+			value = op.path.length ? setIn(value, op.path, op) : op.value;
+		});
+		return value;
+	}
+
+	function applyChanges(elements, operations) {
+		// same as tutorial.utils.elements.apply_changes
+		var merged = elements.slice();
+		var index = {};
+		merged.forEach(function(element, i) {
+			index[element.data.id] = i;
+		});
+		operations.forEach(function(op) {
+			var i = index[op.id];
+			if (op.op === 'add') {
+				index[op.id] = i === undefined ? merged.length : i;
+				merged[index[op.id]] = op.element;
+			} else if (op.op === 'remove') {
+				if (i !== undefined) {
+					merged[i] = null;
+					delete index[op.id];
+				}
+			} else {
+				var element = Object.assign({}, merged[i], op.element);
+				element.data = Object.assign(
+					{}, merged[i].data, op.element.data
+				);
+				merged[i] = element;
+			}
+		});
+		return merged.filter(function(element) {
+			return element !== null;
+		});
+	}
+
+	window.dash_clientside = Object.assign({}, window.dash_clientside, {
+		deltas: {
+			figure: function(delta, figure, key) {
+				if (!delta || delta.key === key) {
+					return [figure, key];
+				}
+				if (delta.figure) {
+					return [delta.figure, delta.key];
+				}
+				if (delta.base !== key) {
+					// not a patch of this figure: forget the key so that
+					// the next update sends the whole figure
+					return [figure, null];
+				}
+				return [applyPatch(figure, delta.patch), delta.key];
+			},
+			elements: function(changes, elements, version) {
+				if (!changes || changes.version === version) {
+					return [elements, version];
+				}
+				if (changes.elements) {
+					return [changes.elements, changes.version];
+				}
+				if (changes.since !== version) {
+					// changes to another version: forget the version so
+					// that the next update sends all of the elements
+					return [elements, null];
+				}
+				return [
+					applyChanges(elements, changes.operations),
+					changes.version
+				];
+			}
+		}
+	});
+})();
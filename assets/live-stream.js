@@ -0,0 +1,63 @@
+// Clientside callback that subscribes a graph to a stream of server-sent
+// events registered with tutorial.utils.push.add_stream_route, instead of
+// polling with dcc.Interval. Each event is an `extendData` value that is
+// appended to the graph. Nothing runs until a page has a stream to follow.
+(function() {
+	var streams = {};
+
+	function flush(stream) {
+		var graph = document.getElementById(stream.graph);
+		if (!graph) {
+			// the graph was removed from the page
+			close(stream);
+			return;
+		}
+		if (!graph.data || !window.Plotly) {
+			// events can arrive before plotly.js has drawn the graph
+			if (!stream.retry) {
+				stream.retry = setTimeout(function() {
+					stream.retry = null;
+					flush(stream);
+				}, 100);
+			}
+			return;
+		}
+		while (stream.pending.length) {
+			var update = stream.pending.shift();
+			window.Plotly.extendTraces(graph, update[0], update[1], update[2]);
+		}
+	}
+
+	function close(stream) {
+		stream.source.close();
+		clearTimeout(stream.retry);
+		if (streams[stream.graph] === stream) {
+			delete streams[stream.graph];
+		}
+	}
+
+	window.dash_clientside = Object.assign({}, window.dash_clientside, {
+		stream: {
+			subscribe: function(url, graph) {
+				if (streams[graph]) {
+					close(streams[graph]);
+				}
+				if (!url || !window.EventSource) {
+					return '';
+				}
+				var stream = {
+					graph: graph,
+					source: new EventSource(url),
+					pending: [],
+					retry: null
+				};
+				stream.source.onmessage = function(event) {
+					stream.pending.push(JSON.parse(event.data));
+					flush(stream);
+				};
+				streams[graph] = stream;
+				return url;
+			}
+		}
+	});
+})();
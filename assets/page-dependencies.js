@@ -0,0 +1,30 @@
+// Clientside callback of the router of tutorial.utils.page_dependencies:
+// the renderer only fetches _dash-dependencies when the app loads, so the
+// callbacks of each page are sent when the pathname changes and put in
+// place of the previous ones here, before the page itself is requested.
+(function() {
+	window.dash_clientside = Object.assign({}, window.dash_clientside, {
+		pages: {
+			install: function(route) {
+				if (!route) {
+					return null;
+				}
+				if (route.dependencies) {
+					var dependencies = JSON.parse(route.dependencies);
+					// the store of dash-renderer, which the renderer
+					// exposes on window; both actions are the ones it
+					// dispatches itself when the app loads
+					window.store.dispatch({
+						type: 'dependenciesRequest',
+						payload: {status: 200, content: dependencies}
+					});
+					window.store.dispatch({
+						type: 'COMPUTE_GRAPHS',
+						payload: dependencies
+					});
+				}
+				return route.pathname;
+			}
+		}
+	});
+})();
@@ -0,0 +1,56 @@
+'''
+The callbacks that the chapters register, by owner (the example that
+`tools.load_example` ran, or the chapter module), and the time to answer
+`_dash-dependencies`: Dash's view, which serializes the whole callback map
+on every request, versus `tutorial.utils.callback_registry`, which
+serializes it once.
+
+Chapters that can't be imported here are skipped.
+
+    python -m benchmarks.callback_registry [repeat, default 100]
+'''
+import json
+import sys
+import time
+
+import dash_html_components as html
+
+from benchmarks.highlight import CHAPTERS, chapter_modules
+from server import app, callback_registry
+
+
+def run(repeat=100):
+    modules = chapter_modules()
+    # Dash only answers once the app has a layout
+    app.layout = html.Div()
+    print('{} chapters of {} loaded, {} callbacks from {} owners'.format(
+        len(modules), len(CHAPTERS), len(callback_registry.callbacks),
+        len(callback_registry.owners)))
+    print('{} identical registrations skipped, {} ids shared by owners'.format(
+        len(callback_registry.skipped), len(callback_registry.conflicts)))
+
+    client = app.server.test_client()
+    with app.server.test_request_context():
+        dash_json = app.dependencies().get_data()
+    registry_json = client.get('/_dash-dependencies').data
+    assert json.loads(registry_json) == json.loads(dash_json)
+
+    print('{:<12} {:>8} {:>10}'.format('view', 'kB', 'ms'))
+    with app.server.test_request_context():
+        start = time.time()
+        for _ in range(repeat):
+            app.dependencies()
+        elapsed = (time.time() - start) / repeat
+    print('{:<12} {:>8.1f} {:>10.3f}'.format(
+        'dash', len(dash_json) / 1000., 1000 * elapsed))
+    with app.server.test_request_context():
+        start = time.time()
+        for _ in range(repeat):
+            callback_registry.serve_dependencies()
+        elapsed = (time.time() - start) / repeat
+    print('{:<12} {:>8.1f} {:>10.3f}'.format(
+        'registry', len(registry_json) / 1000., 1000 * elapsed))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,84 @@
+'''
+Cost of building every `ComponentBlock` of the docs: the literal snippets
+of the component chapters plus the ones `generate_code_container` writes
+for the DAQ gallery. The first pass parses, compiles and runs each
+snippet; later ones (another page build, another worker importing the
+chapter) reuse the memoized blocks. For comparison, the previous
+evaluator, which rewrote `dcc.` into `component = dcc.` and ran the
+snippet again on every call.
+
+    python -m benchmarks.component_block [passes, default 5]
+'''
+import ast
+import sys
+import time
+from textwrap import dedent
+
+from tutorial.utils import component_block
+from tutorial.utils.component_block import ComponentBlock
+from tutorial.utils.simple_doc_generator import generate_code_container
+
+CHAPTERS = [
+    'tutorial/core_component_examples.py',
+    'tutorial/daq_component_examples.py',
+    'tutorial/core_components.py'
+]
+
+
+def chapter_snippets(path):
+    # the first argument of each ComponentBlock call, without running
+    # the rest of the chapter
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    snippets = []
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and node.args and
+                getattr(node.func, 'id', None) == 'ComponentBlock'):
+            expression = ast.Expression(body=node.args[0])
+            snippets.append(eval(compile(expression, path, 'eval'),
+                                 {'s': dedent}))
+    return snippets
+
+
+def daq_snippets():
+    from tutorial.daq import dash_daq_components
+    return [
+        generate_code_container(name, 'dash-daq', 'daq', **props)[3]
+        .children[0].children
+        for name, props in dash_daq_components.items()
+    ]
+
+
+def rewrite(example_string):
+    scope = {}
+    exec(example_string.replace('dcc.', 'component = dcc.').replace(
+        'daq.', 'component = daq.'), scope)
+    return scope['component']
+
+
+def run(passes=5):
+    snippets = daq_snippets()
+    for path in CHAPTERS:
+        snippets += chapter_snippets(path)
+    # import the component libraries the snippets use before timing
+    for snippet in snippets:
+        rewrite(snippet)
+    component_block._compiled.clear()
+    component_block._blocks.clear()
+
+    print('{:<12} {:>8} {:>12} {:>12}'.format(
+        'evaluator', 'snippets', 'first ms', 'next ms'))
+    for name, build in [('rewrite', rewrite), ('ast', ComponentBlock)]:
+        times = []
+        for _ in range(passes):
+            start = time.time()
+            for snippet in snippets:
+                build(snippet)
+            times.append(time.time() - start)
+        print('{:<12} {:>8} {:>12.1f} {:>12.2f}'.format(
+            name, len(snippets), 1000 * times[0],
+            1000 * sum(times[1:]) / max(passes - 1, 1)))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,93 @@
+'''
+Bytes and server time for one "add a node" click on a Cytoscape graph of
+N elements, when the callback
+
+- takes the elements as `State` and returns the new list (`state`),
+- keeps the graph in `tutorial.utils.elements.ElementStore` and returns
+  the full list, serialized once per version (`store`),
+- returns only the store's changes since the client's version with
+  `ElementStore.delta`, as `tutorial/examples/cytoscape/elements_callbacks.py`
+  does (`delta`).
+
+    python -m benchmarks.cytoscape_elements [elements, default 50000]
+'''
+import json
+import sys
+import time
+
+from tutorial.utils.elements import ElementStore, apply_changes
+
+CLICKS = 20
+
+
+def make_elements(n):
+    nodes = [{'data': {'id': 'n{}'.format(i), 'label': 'Node {}'.format(i)},
+              'position': {'x': i % 250 * 10, 'y': i // 250 * 10}}
+             for i in range(n // 2)]
+    edges = [{'data': {'id': 'e{}'.format(i), 'source': 'n{}'.format(i),
+                       'target': 'n{}'.format(i + 1)}}
+             for i in range(n // 2 - 1)]
+    return nodes + edges
+
+
+def new_node(i):
+    return {'data': {'id': 'new{}'.format(i)}, 'position': {'x': 0, 'y': 0}}
+
+
+def state(elements):
+    request = json.dumps(elements)
+    elapsed = 0
+    for i in range(CLICKS):
+        start = time.time()
+        response = json.dumps(json.loads(request) + [new_node(i)])
+        elapsed += time.time() - start
+        request = response
+    return len(request), len(response), elapsed / CLICKS
+
+
+def store(elements):
+    elements_store = ElementStore(elements)
+    elapsed = 0
+    for i in range(CLICKS):
+        request = json.dumps({'version': elements_store.version})
+        start = time.time()
+        elements_store.add(new_node(i))
+        response = elements_store.to_json()
+        elapsed += time.time() - start
+    return len(request), len(response), elapsed / CLICKS
+
+
+def delta(elements):
+    elements_store = ElementStore(elements)
+    client = elements_store.elements()
+    version = elements_store.token()
+    elapsed = 0
+    for i in range(CLICKS):
+        request = json.dumps({'version': version})
+        start = time.time()
+        elements_store.add(new_node(i))
+        response = json.dumps(
+            elements_store.delta(json.loads(request)['version']))
+        elapsed += time.time() - start
+        changes = json.loads(response)
+        client = apply_changes(client, changes['operations'])
+        version = changes['version']
+    # the client ends up with the same graph as the server
+    assert json.dumps(client) == elements_store.to_json()
+    return len(request), len(response), elapsed / CLICKS
+
+
+def run(n=50000):
+    elements = make_elements(n)
+    print('{:<8} {:>10} {:>14} {:>16} {:>12}'.format(
+        'callback', 'elements', 'request bytes', 'response bytes',
+        'ms per click'))
+    for name, strategy in [('state', state), ('store', store),
+                           ('delta', delta)]:
+        request, response, elapsed = strategy(elements)
+        print('{:<8} {:>10} {:>14} {:>16} {:>12.1f}'.format(
+            name, n, request, response, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1,82 @@
+'''
+Time to build the sections of the DAQ gallery (`tutorial/daq.py`): the
+previous generator, which formatted a source string and then executed it
+with `ComponentBlock` to get the component, versus `generate_docs`
+building the source and the component from the same props, cold and
+from its per-library-version cache.
+
+Both cold builds spend nearly all of their time constructing the same
+Dash components, so they take about as long: only the cached builds are
+faster. What the template removes is the exec and the source rewriting.
+
+    python -m benchmarks.daq_docs [repeat, default 20]
+'''
+import sys
+import time
+from textwrap import dedent
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from tutorial.daq import dash_daq_components
+from tutorial.utils import component_block, simple_doc_generator
+from tutorial.utils.simple_doc_generator import generate_docs
+
+
+def previous_section(component_name, library_name, library_short,
+                     description='', props=None):
+    # the previous generator: format the source, then run it
+    prop_string = '\n  id=\'my-{}-{}\', '.format(
+        library_short, component_name.lower())
+    for key in (props or {}):
+        value = props[key]
+        if isinstance(value, (dict, str)):
+            value = repr(value)
+        prop_string += '{}={}, '.format(key, value)
+    prop_string = prop_string.replace(', ', ',\n  ')[:-4] + '\n'
+    example_string = '''import {} as {}
+
+{}.{}({})'''.format(library_name.replace('-', '_'), library_short,
+                    library_short, component_name, prop_string)
+    return [
+        html.Hr(),
+        html.H3(dcc.Link(component_name, href='/{}/{}'.format(
+            library_name, component_name.lower()))),
+        dcc.Markdown(dedent(description)),
+        component_block.example_block(
+            example_string, component_block.evaluate(example_string)),
+        html.Br(),
+        dcc.Link('More {} Examples and Reference'.format(component_name),
+                 href='/{}/{}'.format(library_name, component_name.lower()))
+    ]
+
+
+def executed(components):
+    component_block._compiled.clear()
+    for name, spec in components.items():
+        previous_section(name, 'dash-daq', 'daq', **spec)
+
+
+def template(components):
+    simple_doc_generator._sections.clear()
+    generate_docs('dash-daq', 'daq', dcc.Markdown(''), components)
+
+
+def cached(components):
+    generate_docs('dash-daq', 'daq', dcc.Markdown(''), components)
+
+
+def run(repeat=20):
+    print('{:<12} {:>12} {:>12}'.format('generator', 'components', 'ms'))
+    for name, build in [('exec', executed), ('template', template),
+                        ('cached', cached)]:
+        start = time.time()
+        for _ in range(repeat):
+            build(dash_daq_components)
+        print('{:<12} {:>12} {:>12.2f}'.format(
+            name, len(dash_daq_components),
+            1000 * (time.time() - start) / repeat))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,73 @@
+'''
+Initial payload of the chapters with collapsed sections, with the
+sections inline (as before) and deferred with
+`tutorial.utils.deferred.DeferredSections`, and the round trips deferring
+costs: the renderer calls each section's callback once when the chapter
+is shown (`initial`, answered without an update), and again when it is
+opened. Then the time to answer the request that opens a section, the
+first time (encoded) and afterwards (cached JSON).
+
+    python -m benchmarks.deferred_sections
+'''
+import importlib
+import json
+import time
+
+import dash_html_components as html
+import plotly
+
+from tutorial.tools import deferred_sections
+
+CHAPTERS = [
+    'tutorial.cytoscape.applications_chapter',
+    'tutorial.cytoscape.callbacks_chapter',
+    'tutorial.cytoscape.elements_chapter',
+    'tutorial.cytoscape.events_chapter',
+    'tutorial.cytoscape.layout_chapter',
+    'tutorial.cytoscape.styling_chapter',
+    'tutorial.dash_deployment_server_examples'
+]
+
+
+def size(tree):
+    return len(json.dumps(tree, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def run():
+    print('{:<45} {:>10} {:>10} {:>10}'.format(
+        'chapter', 'inline kB', 'lazy kB', 'initial'))
+    totals = [0, 0, 0]
+    for name in CHAPTERS:
+        try:
+            module = importlib.import_module(name)
+        except Exception:
+            continue
+        layouts = [value for value in vars(module).values()
+                   if isinstance(value, html.Div)]
+        sizes = [sum(size(deferred_sections.inline(tree)) for tree in layouts),
+                 sum(size(tree) for tree in layouts)]
+        requests = len([
+            component for tree in layouts for component in tree.traverse()
+            if getattr(component, 'id', None) in deferred_sections.sections
+        ])
+        totals = [total + s for total, s in zip(totals, sizes + [requests])]
+        print('{:<45} {:>10.1f} {:>10.1f} {:>10}'.format(
+            name, sizes[0] / 1000., sizes[1] / 1000., requests))
+    print('{:<45} {:>10.1f} {:>10.1f} {:>10}'.format(
+        'total', totals[0] / 1000., totals[1] / 1000., totals[2]))
+
+    callbacks = deferred_sections.app.callback_map
+    times = [0, 0]
+    for section_id in deferred_sections.sections:
+        serve = callbacks['{}-body.children'.format(section_id)]['callback']
+        for i in range(2):
+            start = time.time()
+            serve(1, None)
+            times[i] += time.time() - start
+    print('{} sections, opening all of them: {:.1f} ms the first time, '
+          '{:.1f} ms after'.format(len(deferred_sections.sections),
+                                   1000 * times[0], 1000 * times[1]))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,98 @@
+'''
+Payload size and round-trip time of the crossfiltering callbacks, which
+send their figures through `tutorial.utils.figure_diff.FigureDeltas`:
+the bytes of the whole figures against the bytes of the responses.
+
+Each session keeps its figure like the browser does, applying the patches
+with `apply_patch`, and checks it against the figure of a fresh session.
+Examples that can't be loaded here are skipped.
+
+Run from the repository root:
+
+    python -m benchmarks.figure_diff
+'''
+import json
+import time
+
+from server import app
+from tutorial import tools
+from tutorial.utils.figure_diff import apply_patch
+
+
+def selection(points, x_range=None, y_range=None):
+    selected = {'points': [{'customdata': p} for p in points]}
+    if x_range is not None:
+        selected['range'] = {'x': x_range, 'y': y_range}
+    return selected
+
+
+def scenarios():
+    crossfilter = [
+        [None, None, None],
+        [selection(range(0, 10), [0, 1], [10, 11]), None, None],
+        [selection(range(5, 15), [0.2, 0.8], [10, 11]), None, None],
+        [None, selection(range(3, 8), [20, 21], [30, 31]), None],
+        [None, None, None],
+    ]
+    gapminder = [
+        [1952, None, None],
+        [1952, None, {'points': [{'customdata': 'Canada'}]}],
+        [1952, {'points': [{'customdata': c}
+                           for c in ['Canada', 'Chile', 'China']]}, None],
+        [1957, None, None],
+    ]
+    return [
+        ('tutorial/examples/crossfilter_recipe.py', [
+            ('g1', crossfilter),
+            ('g2', [[s[1], s[0], s[2]] for s in crossfilter]),
+            ('g3', [[s[2], s[0], s[1]] for s in crossfilter]),
+        ]),
+        ('tutorial/examples/graph_callbacks_crossfiltering.py', [
+            ('graph-left', gapminder),
+            ('graph-right', gapminder),
+        ]),
+    ]
+
+
+def send(callback, args, key):
+    # the `data` of the delta store and the size of the response
+    response = callback(*(list(args) + [key]))
+    return json.loads(response)['response']['props']['data'], len(response)
+
+
+def run(sessions=20):
+    print('{:<14} {:>6} {:>12} {:>12} {:>7} {:>10}'.format(
+        'graph', 'calls', 'full (B)', 'sent (B)', 'ratio', 'rtt (ms)'))
+    for path, callbacks in scenarios():
+        try:
+            tools.load_example(path)
+        except Exception:
+            continue
+        for graph_id, calls in callbacks:
+            callback = app.callback_map[
+                '{}-figure-delta.data'.format(graph_id)]['callback']
+            full_bytes = sent_bytes = 0
+            elapsed = 0.0
+            for session in range(sessions):
+                key = figure = None
+                for args in calls:
+                    start = time.time()
+                    data, size = send(callback, args, key)
+                    elapsed += time.time() - start
+                    if 'figure' in data:
+                        figure = data['figure']
+                    else:
+                        assert data['base'] == key
+                        figure = apply_patch(figure, data['patch'])
+                    key = data['key']
+                    assert figure == send(callback, args, None)[0]['figure']
+                    full_bytes += len(json.dumps(figure))
+                    sent_bytes += size
+            print('{:<14} {:>6} {:>12} {:>12} {:>7.3f} {:>10.2f}'.format(
+                graph_id, sessions * len(calls), full_bytes, sent_bytes,
+                float(sent_bytes) / full_bytes,
+                1000 * elapsed / (sessions * len(calls))))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,106 @@
+'''
+Filtering a gapminder-like frame with `tutorial.utils.filter_expressions`:
+the time to compile each expression (`compile`), to get it again from the
+memo (`memo`) and to evaluate it (`evaluate`), against the `str.split`
+loop that the table examples used to run on every callback (`split`,
+only for the expressions it understands). Both results are checked
+against `DataFrame.query`.
+
+    python -m benchmarks.filter_expressions [rows, default 1000000]
+'''
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from tutorial.utils import filter_expressions
+
+# (expression, the same for `DataFrame.query`); the first ones are those
+# that the old `split_filter` understands
+SPLIT_EXPRESSIONS = 3
+EXPRESSIONS = [
+    ('continent eq Asia', 'continent == "Asia"'),
+    ('gdpPercap > 5000 && lifeExp < 80',
+     'gdpPercap > 5000 and lifeExp < 80'),
+    ('continent eq Europe && pop > 1e6 && gdpPercap < 20000',
+     'continent == "Europe" and pop > 1e6 and gdpPercap < 20000'),
+    ('"country" contains "an"', 'country.str.contains("an")'),
+    ('"continent" in (Asia, Europe) && "lifeExp" between 60 and 70',
+     'continent in ["Asia", "Europe"] and 60 <= lifeExp <= 70'),
+    ('("continent" eq Africa || "pop" >= 5e7) && !("gdpPercap" < 1000)',
+     '(continent == "Africa" or pop >= 5e7) and not gdpPercap < 1000'),
+]
+
+
+def split_filter(df, filtering_settings):
+    # what the examples did before
+    filtering_expressions = filtering_settings.split(' && ')
+    dff = df
+    for filter in filtering_expressions:
+        if ' eq ' in filter:
+            col_name = filter.split(' eq ')[0]
+            filter_value = filter.split(' eq ')[1]
+            dff = dff.loc[dff[col_name] == filter_value]
+        if ' > ' in filter:
+            col_name = filter.split(' > ')[0]
+            filter_value = float(filter.split(' > ')[1])
+            dff = dff.loc[dff[col_name] > filter_value]
+        if ' < ' in filter:
+            col_name = filter.split(' < ')[0]
+            filter_value = float(filter.split(' < ')[1])
+            dff = dff.loc[dff[col_name] < filter_value]
+    return dff
+
+
+def gapminder(rows):
+    random = np.random.RandomState(0)
+    countries = ['Afghanistan', 'Albania', 'Algeria', 'Angola', 'Argentina',
+                 'Australia', 'Austria', 'Bahrain', 'Bangladesh', 'Belgium',
+                 'Bosnia and Herzegovina', 'Guinea-Bissau', 'United States']
+    return pd.DataFrame({
+        'country': random.choice(countries, rows),
+        'continent': random.choice(
+            ['Africa', 'Americas', 'Asia', 'Europe', 'Oceania'], rows),
+        'year': np.full(rows, 2007),
+        'pop': random.lognormal(16, 1.5, rows),
+        'lifeExp': random.uniform(40, 83, rows),
+        'gdpPercap': random.lognormal(8.5, 1.2, rows),
+    })
+
+
+def timed(f, repeat=1):
+    start = time.time()
+    for _ in range(repeat):
+        result = f()
+    return result, (time.time() - start) / repeat
+
+
+def run(rows=1000000):
+    df = gapminder(rows)
+    print('{} rows'.format(rows))
+    print('{:<66} {:>8} {:>8} {:>10} {:>10} {:>10}'.format(
+        'expression', 'rows', 'split ms', 'compile ms', 'memo ms',
+        'evaluate ms'))
+    for i, (expression, query) in enumerate(EXPRESSIONS):
+        expected = df.query(query)
+        split = '-'
+        if i < SPLIT_EXPRESSIONS:
+            result, elapsed = timed(lambda: split_filter(df, expression), 3)
+            assert result.index.equals(expected.index)
+            split = '{:.2f}'.format(1000 * elapsed)
+
+        filter_expressions._compiled.clear()
+        predicate, compile_time = timed(lambda: filter_expressions.
+                                        compile_filter(expression, df.dtypes))
+        _, memo_time = timed(lambda: filter_expressions.compile_filter(
+            expression, df.dtypes), 100)
+        result, evaluate_time = timed(lambda: df[predicate(df)], 3)
+        assert result.index.equals(expected.index)
+        print('{:<66} {:>8} {:>8} {:>10.3f} {:>10.3f} {:>10.2f}'.format(
+            expression, len(result), split, 1000 * compile_time,
+            1000 * memo_time, 1000 * evaluate_time))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,60 @@
+'''
+Server-side layout times from `tutorial.utils.graph_layout` on random
+sparse graphs (a random tree plus 10% extra edges): computed cold, read
+back from the on-disk cache and from the in-memory cache. Cached times are
+mostly hashing the elements to find the cache key.
+
+    python -m benchmarks.graph_layout [nodes ..., default 10000 100000]
+'''
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from tutorial.utils import graph_layout
+
+
+def random_graph(n, seed=0):
+    rng = np.random.RandomState(seed)
+    parent = (rng.rand(n - 1) * np.arange(1, n)).astype(np.int64)
+    extra = rng.randint(0, n, (n // 10, 2))
+    pairs = np.concatenate([np.column_stack([parent, np.arange(1, n)]),
+                            extra])
+    return (
+        [{'data': {'id': 'n{}'.format(i)}} for i in range(n)] +
+        [{'data': {'source': 'n{}'.format(a), 'target': 'n{}'.format(b)}}
+         for a, b in pairs.tolist()]
+    )
+
+
+def timed(func, *args, **kwargs):
+    start = time.time()
+    func(*args, **kwargs)
+    return time.time() - start
+
+
+def run(sizes=(10000, 100000)):
+    cache_dir = tempfile.mkdtemp()
+    print('{:<14} {:>8} {:>10} {:>10} {:>12}'.format(
+        'layout', 'nodes', 'cold (s)', 'disk (s)', 'memory (s)'))
+    try:
+        for n in sizes:
+            elements = random_graph(n)
+            for name in ['hierarchical', 'force']:
+                cold = timed(graph_layout.positions, elements, name,
+                             cache_dir=cache_dir)
+                graph_layout._cache.clear()
+                disk = timed(graph_layout.positions, elements, name,
+                             cache_dir=cache_dir)
+                memory = timed(graph_layout.positions, elements, name,
+                               cache_dir=cache_dir)
+                print('{:<14} {:>8} {:>10.2f} {:>10.2f} {:>12.2f}'.format(
+                    name, n, cold, disk, memory))
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    run([int(n) for n in sys.argv[1:]] or (10000, 100000))
@@ -0,0 +1,103 @@
+'''
+Server-side cost of highlighting the code blocks of the chapters with
+`tutorial.utils.highlight`: a cold build (every block tokenized by
+Pygments and written to the disk cache), a restart (fragments read back
+from disk) and a warm process (memory cache). In exchange, the browser
+no longer tokenizes these blocks on every visit.
+
+Chapters that can't be imported here (e.g. those that download data) are
+skipped.
+
+    python -m benchmarks.highlight
+'''
+import importlib
+import shutil
+import tempfile
+import time
+
+import dash_core_components as dcc
+from dash.development.base_component import Component
+
+from tutorial.utils import highlight
+
+CHAPTERS = [
+    'auth', 'core_component_examples', 'core_components', 'd3',
+    'dash_cytoscape_index', 'dash_deployment_server',
+    'dash_deployment_server_examples', 'dash_table_index', 'daq',
+    'daq_component_examples', 'deployment', 'external_css_and_js',
+    'gallery', 'canvas', 'getting_started_part_1', 'getting_started_part_2',
+    'faqs', 'graphing', 'html_components', 'installation', 'introduction',
+    'live_updates', 'performance', 'plugins', 'sharing_state', 'state',
+    'support', 'urls', 'react_for_python_developers', 'devtools',
+    'loading_states', 'integrating_dash'
+]
+
+
+def chapter_modules():
+    modules = []
+    for name in CHAPTERS:
+        try:
+            modules.append(importlib.import_module('tutorial.' + name))
+        except Exception:
+            continue
+    return modules
+
+
+def static_components(module, component_type):
+    # components of `component_type` without an id in the module's layouts
+    found = {}
+    for value in vars(module).values():
+        trees = value if isinstance(value, list) else [value]
+        for tree in trees:
+            if not isinstance(tree, Component):
+                continue
+            for component in [tree] + list(tree.traverse()):
+                if (isinstance(component, component_type) and
+                        getattr(component, 'id', None) is None):
+                    found[id(component)] = component
+    return list(found.values())
+
+
+def code_blocks(module):
+    blocks = []
+    for component in static_components(module, dcc.SyntaxHighlighter):
+        code = component.children
+        if isinstance(code, (list, tuple)):
+            code = ''.join(code)
+        blocks.append((
+            code, getattr(component, 'language', None),
+            highlight.THEMES[getattr(component, 'theme', None) or 'light']))
+    return blocks
+
+
+def build(blocks, cache_dir):
+    start = time.time()
+    size = sum(len(highlight.highlight(code, language, style, cache_dir))
+               for code, language, style in blocks)
+    return time.time() - start, size
+
+
+def run():
+    modules = chapter_modules()
+    blocks = [block for module in modules for block in code_blocks(module)]
+    print('{} chapters of {} loaded, {} code blocks, {:.0f} kB of code'.format(
+        len(modules), len(CHAPTERS), len(blocks),
+        sum(len(code) for code, _, _ in blocks) / 1000.))
+
+    cache_dir = tempfile.mkdtemp()
+    print('{:<12} {:>10} {:>12}'.format('build', 'ms', 'markup kB'))
+    try:
+        for name in ['cold', 'restart', 'warm']:
+            if name != 'warm':
+                highlight._cache.clear()
+            if name == 'cold':
+                shutil.rmtree(cache_dir)
+            elapsed, size = build(blocks, cache_dir)
+            print('{:<12} {:>10.1f} {:>12.0f}'.format(
+                name, 1000 * elapsed, size / 1000.))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,64 @@
+'''
+How much `tutorial.utils.interning.Interner` deduplicates in the chapters
+(as run.py uses it, after pre-rendering the code and Markdown): how many
+components and bytes of JSON are shared, the memory the layouts take
+before and after interning, and the time to serialize them all with
+Dash's encoder versus `Interner.dumps`, which reuses the JSON of shared
+components.
+
+Chapters that can't be imported here are skipped.
+
+    python -m benchmarks.interning
+'''
+import copy
+import gc
+import json
+import time
+import tracemalloc
+
+import plotly
+from dash.development.base_component import Component
+
+from benchmarks.highlight import chapter_modules
+from tutorial.utils import highlight, interning, markdown_html
+
+
+def run():
+    # the layouts of the chapters and the fragments they are made from
+    layouts = [
+        markdown_html.prerender(highlight.prerender(value))
+        for module in chapter_modules() for value in vars(module).values()
+        if isinstance(value, Component) or (
+            isinstance(value, list) and value and
+            isinstance(value[0], Component))
+    ]
+
+    tracemalloc.start()
+    layouts = copy.deepcopy(layouts)
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    interner = interning.Interner()
+    layouts = interner.intern(layouts)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    for name, value in sorted(interner.report().items()):
+        print('{:<20} {:>10}'.format(name, value))
+    print('{:<20} {:>10.0f}'.format('memory kB before', before / 1000.))
+    print('{:<20} {:>10.0f}'.format('memory kB after', after / 1000.))
+
+    print('{:<12} {:>10} {:>10}'.format('encoder', 'ms', 'kB'))
+    for name, dumps in [
+            ('dash', lambda value: json.dumps(
+                value, cls=plotly.utils.PlotlyJSONEncoder)),
+            ('interned', interner.dumps),
+            ('interned', interner.dumps)]:
+        start = time.time()
+        size = len(dumps(layouts))
+        print('{:<12} {:>10.1f} {:>10.0f}'.format(
+            name, 1000 * (time.time() - start), size / 1000.))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,106 @@
+'''
+Load test of the satellite live-update example
+(`tutorial/examples/live_updates_satellite.py`): CPU time per interval tick
+for N simulated viewers when every viewer recomputes the 180-sample
+history (the previous example) versus calling the example's callbacks,
+which read from the ring buffer of its shared producer, and the bytes sent
+per tick for a full figure versus the example's `extendData` update.
+
+    python -m benchmarks.live_updates [viewers, default 500]
+'''
+import datetime
+import json
+import runpy
+import sys
+import time
+from multiprocessing.pool import ThreadPool
+
+import plotly
+from pyorbital.orbital import Orbital
+
+EXAMPLE = 'tutorial/examples/live_updates_satellite.py'
+N_SAMPLES = 180
+# the per-viewer path is slow, so time it on this many viewers and scale
+PER_VIEWER_SAMPLE = 10
+
+
+def per_viewer_tick():
+    satellite = Orbital('TERRA')
+    data = {'time': [], 'Latitude': [], 'Longitude': [], 'Altitude': []}
+    for i in range(N_SAMPLES):
+        t = datetime.datetime.utcnow() - datetime.timedelta(seconds=i * 20)
+        lon, lat, alt = satellite.get_lonlatalt(t)
+        data['Longitude'].append(lon)
+        data['Latitude'].append(lat)
+        data['Altitude'].append(alt)
+        data['time'].append(t)
+    return data
+
+
+def figure(data):
+    return {
+        'data': [
+            {'x': data['time'], 'y': data['Altitude']},
+            {'x': data['Longitude'], 'y': data['Latitude']}
+        ]
+    }
+
+
+def encode(value):
+    return json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def callback(example, output):
+    for key, value in example['app'].callback_map.items():
+        if output in key:
+            return value['callback']
+
+
+def run(viewers=500, ticks=5):
+    start = time.time()
+    for _ in range(PER_VIEWER_SAMPLE):
+        figure(per_viewer_tick())
+    per_viewer = (time.time() - start) / PER_VIEWER_SAMPLE * viewers
+
+    example = runpy.run_path(EXAMPLE)
+    history, current = example['history'], example['current']
+    update_graph = callback(example, 'live-update-graph.extendData')
+    update_text = callback(example, 'live-update-text.children')
+    history.tick()  # backfill, if the producer thread hasn't yet
+    current.tick()
+
+    def view(viewer):
+        update_text(0)
+        response = json.loads(update_graph(0, sequences[viewer]))
+        sequences[viewer] = response['response']['last-sequence']['data']
+
+    # every viewer has already received the whole buffer
+    sequences = [history.buffer.sequence] * viewers
+    pool = ThreadPool(16)
+    start = time.time()
+    for _ in range(ticks):
+        history.tick()
+        current.tick()
+        pool.map(view, range(viewers))
+    shared = (time.time() - start) / ticks
+    pool.terminate()
+
+    sequence = history.buffer.sequence
+    history.tick()
+    extend_bytes = len(update_graph(0, sequence))
+    full_bytes = len(encode(figure(history.buffer.snapshot()[1])))
+
+    print('{:<12} {:>8} {:>16}'.format('path', 'viewers', 'ms per tick'))
+    print('{:<12} {:>8} {:>16.1f}'.format(
+        'per-viewer', viewers, per_viewer * 1000))
+    print('{:<12} {:>8} {:>16.1f}'.format('shared', viewers, shared * 1000))
+    print('{:<12} {:>8} {:>16.3f}'.format(
+        'per viewer', 1, shared * 1000 / viewers))
+    print('')
+    print('{:<12} {:>16}'.format('payload', 'bytes per tick'))
+    print('{:<12} {:>16}'.format('figure', full_bytes))
+    print('{:<12} {:>16}'.format('extendData', extend_bytes))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,73 @@
+'''
+Server-side cost of rendering the `dcc.Markdown` blocks of the chapters
+to HTML with `tutorial.utils.markdown_html`: a cold build (every block
+parsed and written to the disk cache), a restart (HTML read back from
+disk), a restart after editing one block (only that one is rendered
+again) and a warm process. In exchange, the browser no longer parses
+these blocks on every visit. Only the blocks that `prerender` would
+replace, the ones without GitHub Flavored Markdown syntax, are counted.
+
+Chapters that can't be imported here are skipped.
+
+    python -m benchmarks.markdown
+'''
+import shutil
+import tempfile
+import time
+
+import dash_core_components as dcc
+
+from benchmarks.highlight import CHAPTERS, chapter_modules, static_components
+from tutorial.utils import markdown_html
+
+
+def markdown_blocks(module):
+    blocks = []
+    for component in static_components(module, dcc.Markdown):
+        text = component.children
+        if isinstance(text, (list, tuple)):
+            text = '\n'.join(text)
+        if not markdown_html.is_commonmark(text):
+            continue
+        blocks.append((text, bool(
+            getattr(component, 'dangerously_allow_html', None))))
+    return blocks
+
+
+def build(blocks, cache_dir):
+    start = time.time()
+    size = sum(len(markdown_html.render(text, allow_html, cache_dir))
+               for text, allow_html in blocks)
+    return time.time() - start, size
+
+
+def run():
+    modules = chapter_modules()
+    blocks = [block for module in modules
+              for block in markdown_blocks(module)]
+    total = sum(len(static_components(module, dcc.Markdown))
+                for module in modules)
+    print('{} chapters of {} loaded, {} of {} blocks pre-rendered, '
+          '{:.0f} kB of Markdown'.format(
+              len(modules), len(CHAPTERS), len(blocks), total,
+              sum(len(text) for text, _ in blocks) / 1000.))
+
+    edited = list(blocks)
+    edited[0] = (edited[0][0] + '\n\nEdited.', edited[0][1])
+    cache_dir = tempfile.mkdtemp()
+    print('{:<12} {:>10} {:>10}'.format('build', 'ms', 'HTML kB'))
+    try:
+        shutil.rmtree(cache_dir)
+        for name, version in [('cold', blocks), ('restart', blocks),
+                              ('one edit', edited), ('warm', edited)]:
+            if name != 'warm':
+                markdown_html._cache.clear()
+            elapsed, size = build(version, cache_dir)
+            print('{:<12} {:>10.1f} {:>10.0f}'.format(
+                name, 1000 * elapsed, size / 1000.))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,161 @@
+'''
+What sending each chapter only its own callbacks saves
+(`tutorial.utils.page_dependencies`): the size of the dependencies
+each chapter gets, against those of every callback, and the time the
+renderer spends on them: building its dependency graphs (`build`), once
+per chapter with a different set, and `InputGraph.overallOrder()`,
+which it walks on every property change that triggers a callback
+(`walk`).
+
+The times are measured with the `dependency-graph` code bundled in
+dash-renderer, run by node; they are left out when node isn't installed.
+Chapters that can't be imported here are skipped.
+
+    python -m benchmarks.page_dependencies [repeat, default 100]
+'''
+import importlib
+import io
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+import dash_renderer
+
+from benchmarks.highlight import CHAPTERS, chapter_modules
+from server import callback_registry
+from tutorial.tools import deferred_sections
+from tutorial.utils.page_dependencies import partition
+
+# what the renderer does with the response, see src/reducers/dependencyGraph.js
+GRAPHS_JS = '''
+var module = {exports: {}};
+(function(module, exports) {%s})(module, module.exports);
+var DepGraph = module.exports.DepGraph;
+
+function graphs(dependencies) {
+    var inputGraph = new DepGraph();
+    var multiGraph = new DepGraph();
+    dependencies.forEach(function(dependency) {
+        var output = dependency.output;
+        var outputs = output.startsWith('..') ?
+            output.slice(2, -2).split('...') : [output];
+        outputs.forEach(function(out) {
+            multiGraph.addNode(out);
+            dependency.inputs.forEach(function(i) {
+                var inputId = i.id + '.' + i.property;
+                if (!multiGraph.hasNode(inputId)) {
+                    multiGraph.addNode(inputId);
+                }
+                multiGraph.addDependency(inputId, out);
+            });
+        });
+        dependency.inputs.forEach(function(i) {
+            var inputId = i.id + '.' + i.property;
+            inputGraph.addNode(output);
+            if (!inputGraph.hasNode(inputId)) {
+                inputGraph.addNode(inputId);
+            }
+            inputGraph.addDependency(inputId, output);
+        });
+    });
+    return inputGraph;
+}
+
+function time(f, repeat) {
+    var start = process.hrtime();
+    for (var i = 0; i < repeat; i++) {
+        f();
+    }
+    var elapsed = process.hrtime(start);
+    return (elapsed[0] * 1e3 + elapsed[1] / 1e6) / repeat;
+}
+
+var input = JSON.parse(require('fs').readFileSync(0, 'utf-8'));
+console.log(JSON.stringify(input.payloads.map(function(payload) {
+    var dependencies = JSON.parse(payload);
+    var inputGraph = graphs(dependencies);
+    return [
+        time(function() { graphs(dependencies); }, input.repeat),
+        time(function() { inputGraph.overallOrder(); }, input.repeat)
+    ];
+})));
+'''
+
+
+def dep_graph_source():
+    # the `dependency-graph` module out of the webpack bundle
+    path = os.path.join(os.path.dirname(dash_renderer.__file__),
+                        'dash_renderer.dev.js')
+    with io.open(path, encoding='utf-8') as f:
+        bundle = f.read()
+    start = bundle.index('"./node_modules/dependency-graph/lib/dep_graph.js"')
+    start = bundle.index('(function(module, exports) {', start)
+    end = bundle.index('\n/***/ })', start)
+    return bundle[start + len('(function(module, exports) {'):end]
+
+
+def renderer_times(payloads, repeat):
+    try:
+        process = subprocess.Popen(
+            ['node', '-e', GRAPHS_JS % dep_graph_source()],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    except OSError:
+        return [(None, None)] * len(payloads)
+    output, _ = process.communicate(json.dumps(
+        {'payloads': payloads, 'repeat': repeat}).encode('utf-8'))
+    return json.loads(output.decode('utf-8'))
+
+
+def page_modules():
+    # the chapters, and the sub-chapters of the cytoscape and table guides
+    modules = chapter_modules()
+    for package in ['cytoscape', 'table']:
+        path = os.path.join(os.path.dirname(__file__), '..', 'tutorial',
+                            package)
+        for _, name, _ in pkgutil.iter_modules([path]):
+            if name.endswith('_chapter'):
+                try:
+                    modules.append(importlib.import_module(
+                        'tutorial.{}.{}'.format(package, name)))
+                except Exception:
+                    continue
+    return [module for module in modules if hasattr(module, 'layout')]
+
+
+def run(repeat=100):
+    modules = page_modules()
+    pages, _ = partition(
+        callback_registry,
+        dict((module.__name__, module.layout) for module in modules),
+        deferred_sections.bodies
+    )
+    pages['all'] = frozenset(callback_registry.callbacks)
+    everywhere = frozenset.intersection(*[
+        pages[module.__name__] for module in modules])
+    print('{} chapters of {} and {} sub-chapters loaded, {} callbacks, '
+          '{} of them on every page'.format(
+              len([m for m in modules if m.__name__.count('.') == 1]),
+              len(CHAPTERS),
+              len([m for m in modules if m.__name__.count('.') == 2]),
+              len(callback_registry.callbacks), len(everywhere)))
+
+    names = [module.__name__ for module in modules] + ['all']
+    payloads = [
+        callback_registry.dependencies_json(pages[name])
+        for name in names
+    ]
+    times = renderer_times(payloads, repeat)
+
+    print('{:<44} {:>10} {:>8} {:>10} {:>10}'.format(
+        'page', 'callbacks', 'kB', 'build ms', 'walk ms'))
+    for name, payload, (build, walk) in zip(names, payloads, times):
+        print('{:<44} {:>10} {:>8.1f} {:>10} {:>10}'.format(
+            name, len(json.loads(payload)), len(payload) / 1000.,
+            '-' if build is None else '{:.3f}'.format(build),
+            '-' if walk is None else '{:.3f}'.format(walk)))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
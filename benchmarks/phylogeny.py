@@ -0,0 +1,80 @@
+'''
+Time to turn a phylogeny tree into Cytoscape elements with the recursive
+`generate_elements` of the usage-phylogeny example versus the iterative
+compiler in `tutorial.utils.phylogeny`, cold and from its file cache.
+
+Trees are random binary trees with the given number of leaves; a
+caterpillar tree of the same size shows the recursion limit.
+
+    python -m benchmarks.phylogeny [leaves, default 100000]
+'''
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from Bio import Phylo
+from Bio.Phylo.PhyloXML import Clade, Phylogeny
+
+from tutorial.utils import phylogeny
+
+EXAMPLE = 'tutorial/examples/cytoscape/usage-phylogeny.py'
+
+
+def example_generate_elements():
+    # only the part of the example that defines `generate_elements`
+    with open(EXAMPLE) as f:
+        source = f.read()
+    scope = {}
+    exec(source[:source.index('# path = ')], scope)
+    return scope['generate_elements']
+
+
+def random_tree(leaves, caterpillar=False):
+    clades = [Clade(branch_length=random.random(), name='taxon{}'.format(i))
+              for i in range(leaves)]
+    while len(clades) > 1:
+        if caterpillar:
+            a, b = clades.pop(), clades.pop()
+        else:
+            a = clades.pop(random.randrange(len(clades)))
+            b = clades.pop(random.randrange(len(clades)))
+        clades.append(Clade(branch_length=random.random(), clades=[a, b]))
+    return Phylogeny(root=clades[0], rooted=True)
+
+
+def timed(func, *args):
+    start = time.time()
+    try:
+        func(*args)
+    except RuntimeError as e:  # RecursionError on Python 3
+        return type(e).__name__
+    return '{:.2f}'.format(time.time() - start)
+
+
+def run(leaves=100000):
+    recursive = example_generate_elements()
+    cache_dir = tempfile.mkdtemp()
+    print('{:<12} {:>8} {:>16} {:>12} {:>12}'.format(
+        'tree', 'leaves', 'recursive (s)', 'cold (s)', 'cached (s)'))
+    try:
+        for name, caterpillar in [('random', False), ('caterpillar', True)]:
+            tree = random_tree(leaves, caterpillar)
+            path = '{}/{}.xml'.format(cache_dir, name)
+            Phylo.write(tree, path, 'phyloxml')
+
+            def compile_tree():
+                phylogeny.load_elements(path, cache_dir=cache_dir)
+
+            print('{:<12} {:>8} {:>16} {:>12} {:>12}'.format(
+                name, leaves,
+                timed(recursive, tree),
+                timed(compile_tree),
+                timed(compile_tree)))
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
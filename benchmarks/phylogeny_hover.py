@@ -0,0 +1,70 @@
+'''
+Cost of one hover in the usage-phylogeny example: the `source *=` substring
+selector built from path-like clade ids versus the `cladeOrder` range
+selector from the preorder interval labels.
+
+For each selector this reports the stylesheet payload sent back by the
+callback and the time to match it against every edge, which is the work
+the browser does on each hover (done here in Python, so only the ratio
+is meaningful).
+
+    python -m benchmarks.phylogeny_hover [leaves, default 100000]
+'''
+import json
+import random
+import sys
+import time
+
+from benchmarks.phylogeny import example_generate_elements, random_tree
+
+STYLE = {'line-color': 'blue'}
+HOVERS = 50
+
+
+def substring_hover(edge_data):
+    if 's' in edge_data['source']:
+        val = edge_data['source'].split('s')[0]
+    else:
+        val = edge_data['source']
+    selector = 'edge[source *= "{}"]'.format(val)
+    return selector, lambda data: val in data['source']
+
+
+def range_hover(edge_data):
+    start, end = edge_data['cladeOrder'], edge_data['cladeEnd']
+    selector = 'edge[cladeOrder >= {}][cladeOrder < {}]'.format(start, end)
+    return selector, lambda data: start <= data['cladeOrder'] < end
+
+
+def measure(hover, edges, hovered):
+    payload = 0
+    matched = 0
+    start = time.time()
+    for edge in hovered:
+        selector, matches = hover(edge['data'])
+        payload += len(json.dumps([{'selector': selector, 'style': STYLE}]))
+        matched += sum(1 for e in edges if matches(e['data']))
+    elapsed = (time.time() - start) / len(hovered)
+    return elapsed, payload // len(hovered), matched
+
+
+def run(leaves=100000):
+    # the recursive example is fine with random trees, which are shallow
+    tree = random_tree(leaves)
+    _, edges = example_generate_elements()(tree)
+    hovered = random.sample(edges, HOVERS)
+
+    print('{:<10} {:>8} {:>14} {:>16}'.format(
+        'selector', 'leaves', 'ms per hover', 'payload (bytes)'))
+    counts = []
+    for name, hover in [('substring', substring_hover),
+                        ('range', range_hover)]:
+        elapsed, payload, matched = measure(hover, edges, hovered)
+        counts.append(matched)
+        print('{:<10} {:>8} {:>14.1f} {:>16}'.format(
+            name, leaves, elapsed * 1000, payload))
+    assert counts[0] == counts[1], 'selectors matched different edges'
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,127 @@
+'''
+Server cost of one live-update tick for N viewers: every viewer polling an
+update endpoint (as `dcc.Interval` does) versus one update published to N
+Server-Sent Events subscribers through `tutorial.utils.push`, as the
+push version of the live-updates example
+(`tutorial/examples/live_updates_push.py`) does.
+
+    python -m benchmarks.push [viewers, default 500]
+'''
+import json
+import sys
+import threading
+import time
+
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+import numpy as np
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+from tutorial.utils.live import Producer, RingBuffer, extend_data
+from tutorial.utils.push import Broadcaster, event_stream, stream_producer
+
+N_SAMPLES = 180
+TRACES = [{'x': 'time', 'y': 'value'}]
+
+
+def make_producer():
+    def sample(times):
+        seconds = times.astype('int64') / 1000.0
+        return {'time': times, 'value': np.sin(seconds / 60.0)}
+
+    return Producer(
+        RingBuffer(N_SAMPLES, {'time': 'datetime64[ms]', 'value': 'float64'}),
+        sample,
+        1
+    )
+
+
+def polling(producer, viewers, ticks):
+    # the `dcc.Interval` version of the example: every viewer requests the
+    # samples it hasn't seen yet on every tick
+    app = dash.Dash(__name__)
+    app.layout = html.Div([
+        dcc.Graph(id='graph'),
+        dcc.Store(id='sequence'),
+        dcc.Interval(id='interval')
+    ])
+
+    @app.callback([Output('graph', 'extendData'),
+                   Output('sequence', 'data')],
+                  [Input('interval', 'n_intervals')],
+                  [State('sequence', 'data')])
+    def update(n, since):
+        sequence, value = extend_data(
+            producer.buffer, since or 0, TRACES, N_SAMPLES)
+        if value is None:
+            raise PreventUpdate
+        return value, sequence
+
+    client = app.server.test_client()
+    sequences = [producer.buffer.sequence] * viewers
+    start = time.time()
+    for n in range(ticks):
+        producer.tick()
+        for viewer in range(viewers):
+            response = client.post(
+                '/_dash-update-component',
+                data=json.dumps({
+                    'output': '..graph.extendData...sequence.data..',
+                    'inputs': [{'id': 'interval', 'property': 'n_intervals',
+                                'value': n}],
+                    'state': [{'id': 'sequence', 'property': 'data',
+                               'value': sequences[viewer]}]
+                }),
+                content_type='application/json')
+            sequences[viewer] = json.loads(
+                response.data)['response']['sequence']['data']
+    return (time.time() - start) / ticks, viewers
+
+
+def pushing(producer, viewers, ticks):
+    broadcaster = Broadcaster()
+    catch_up = stream_producer(producer, broadcaster, TRACES, N_SAMPLES)
+    received = [0] * viewers
+    done = threading.Event()
+
+    def viewer(i):
+        for chunk in event_stream(broadcaster, catch_up, None, heartbeat=1):
+            if chunk.startswith('id:'):
+                received[i] += 1
+            if done.is_set():
+                break
+
+    threads = [threading.Thread(target=viewer, args=(i,))
+               for i in range(viewers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    # every viewer has received the whole buffer
+    while sum(received) < viewers:
+        time.sleep(0.01)
+
+    start = time.time()
+    for _ in range(ticks):
+        producer.tick()
+    while sum(received) < viewers * (ticks + 1):
+        time.sleep(0.001)
+    elapsed = (time.time() - start) / ticks
+    done.set()
+    return elapsed, 0
+
+
+def run(viewers=500, ticks=5):
+    print('{:<10} {:>8} {:>14} {:>20}'.format(
+        'transport', 'viewers', 'ms per tick', 'requests per tick'))
+    for name, transport in [('polling', polling), ('push', pushing)]:
+        producer = make_producer()
+        producer.tick()
+        elapsed, requests = transport(producer, viewers, ticks)
+        print('{:<10} {:>8} {:>14.1f} {:>20}'.format(
+            name, viewers, elapsed * 1000, requests))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,85 @@
+'''
+Latency of each new stroke on a 4K (3840x2160) image for the canvas
+segmentation callback: the `dash_canvas.utils` pipeline on the whole
+image and all the strokes (parse, watershed, `label2rgb`, PNG), versus a
+`tutorial.utils.segmentation.SegmentationSession` that only rasterizes
+the new stroke and re-floods the labels it touched, plus fast PNG.
+
+    python -m benchmarks.segmentation [strokes, default 12]
+'''
+import json
+import sys
+import time
+
+import numpy as np
+from dash_canvas.utils import (array_to_data_url, parse_jsonstring,
+                               watershed_segmentation)
+from scipy import ndimage
+from skimage import color, img_as_ubyte
+
+from tutorial.utils.segmentation import (SegmentationSession, png_data_url,
+                                         prepare_image)
+
+SHAPE = (2160, 3840)
+
+
+def make_image(seed=0):
+    # smooth blobs, like cells on a microscopy image
+    rng = np.random.RandomState(seed)
+    image = ndimage.gaussian_filter(rng.rand(*SHAPE), 40)
+    return (image - image.min()) / (image.max() - image.min())
+
+
+def make_strokes(count, shape=SHAPE, seed=0):
+    rng = np.random.RandomState(seed)
+    strokes = []
+    for _ in range(count):
+        x = rng.randint(100, shape[1] - 100)
+        y = rng.randint(100, shape[0] - 100)
+        points = [[x + dx, y + dy]
+                  for dx, dy in rng.randint(-60, 60, (8, 2)).tolist()]
+        path = ([['M'] + points[0]] +
+                [['Q'] + a + b for a, b in zip(points[:-1], points[1:])] +
+                [['L'] + points[-1]])
+        strokes.append({'type': 'path', 'scaleX': 1, 'strokeWidth': 10,
+                        'path': path})
+    return strokes
+
+
+def json_data(strokes):
+    return json.dumps({'objects': [{'type': 'image', 'scaleX': 1}] + strokes})
+
+
+def full(image, strings):
+    for string in strings:
+        mask = parse_jsonstring(string, image.shape)
+        labels = watershed_segmentation(image, mask)
+        array_to_data_url(img_as_ubyte(color.label2rgb(labels, image=image)))
+        yield
+
+
+def incremental(image, strings):
+    session = SegmentationSession(*prepare_image(image))
+    for string in strings:
+        png_data_url(session.update(string))
+        yield
+
+
+def run(count=12):
+    image = make_image()
+    strokes = make_strokes(count)
+    strings = [json_data(strokes[:i + 1]) for i in range(count)]
+    print('{:<12} {:>8} {:>16} {:>16}'.format(
+        'pipeline', 'strokes', 'mean ms/stroke', 'last ms/stroke'))
+    for name, pipeline in [('full', full), ('incremental', incremental)]:
+        times = []
+        start = time.time()
+        for _ in pipeline(image, strings):
+            times.append(time.time() - start)
+            start = time.time()
+        print('{:<12} {:>8} {:>16.0f} {:>16.0f}'.format(
+            name, count, 1000 * np.mean(times), 1000 * times[-1]))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 12)
@@ -0,0 +1,67 @@
+'''
+Time for a callback to read a cached 1M-row DataFrame: the JSON round trip
+that the caching examples used to do versus `SessionDatasetStore`, which
+they use now, with the memory and filesystem backends.
+
+    python -m benchmarks.session_store [rows, default 1000000]
+'''
+import io
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from tutorial.utils.session_store import (
+    FileSystemBackend, MemoryBackend, SessionDatasetStore
+)
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        'a': np.random.randint(0, 100, size=rows),
+        'b': np.random.rand(rows),
+        'c': np.random.rand(rows),
+        'time': pd.date_range('2019-01-01', periods=rows, freq='s')
+    })
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def run(rows=1000000):
+    df = make_frame(rows)
+    directory = tempfile.mkdtemp()
+    try:
+        serialized = df.to_json(date_format='iso', orient='split')
+        results = [
+            ('json', best_of(
+                lambda: pd.read_json(io.StringIO(serialized), orient='split'),
+                3))
+        ]
+        for name, backend in [
+                ('memory', MemoryBackend()),
+                ('filesystem', FileSystemBackend(directory))]:
+            store = SessionDatasetStore(backend)
+            store.get('session', 'df', lambda: df)
+            results.append((name, best_of(
+                lambda: store.get('session', 'df', lambda: df))))
+
+        print('{:<12} {:>12} {:>10}'.format('read', 'ms', 'speedup'))
+        for name, seconds in results:
+            print('{:<12} {:>12.2f} {:>10.1f}'.format(
+                name, seconds * 1000, results[0][1] / seconds))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
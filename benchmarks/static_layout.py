@@ -0,0 +1,74 @@
+'''
+Time to serialize the response of `display_content` for every chapter:
+Dash's generic encoder versus a `tutorial.utils.static_layout.StaticLayout`
+that encodes the subtrees no callback touches once, on the first request
+(`first`), and splices their JSON into later responses (`next`). The
+last line is the whole set at once, as for the `/all` page.
+
+Chapters that can't be imported here are skipped.
+
+    python -m benchmarks.static_layout [repeat, default 10]
+'''
+import json
+import sys
+import time
+
+import dash_html_components as html
+import plotly
+
+from benchmarks.highlight import CHAPTERS, chapter_modules
+from server import app
+from tutorial.utils import static_layout
+
+
+def page(content, pathname):
+    # what display_content wraps around a chapter on each request
+    return {'response': {'props': {'children': html.Div([
+        html.Div(content), html.Hr(),
+        html.Div(id='wait-for-page-{}'.format(pathname))
+    ])}}}
+
+
+def run(repeat=10):
+    modules = [module for module in chapter_modules()
+               if hasattr(module, 'layout')]
+    layout = static_layout.StaticLayout(static_layout.callback_ids(app))
+    for module in modules:
+        layout.compile(module.layout)
+    print('{} chapters of {} loaded'.format(len(modules), len(CHAPTERS)))
+
+    responses = [(module.__name__, page(module.layout, module.__name__))
+                 for module in modules]
+    responses.append(('all', page([module.layout for module in modules],
+                                  'all')))
+
+    def generic(response):
+        return json.dumps(response, cls=plotly.utils.PlotlyJSONEncoder)
+
+    print('{:<40} {:>8} {:>10} {:>10} {:>10}'.format(
+        'chapter', 'kB', 'dash ms', 'first ms', 'next ms'))
+    totals = [0, 0, 0]
+    for name, response in responses:
+        start = time.time()
+        for _ in range(repeat):
+            expected = generic(response)
+        times = [(time.time() - start) / repeat]
+        start = time.time()
+        layout.dumps(response)
+        times.append(time.time() - start)
+        start = time.time()
+        for _ in range(repeat):
+            encoded = layout.dumps(response)
+        times.append((time.time() - start) / repeat)
+        assert json.loads(encoded) == json.loads(expected)
+
+        if name != 'all':
+            totals = [total + t for total, t in zip(totals, times)]
+        print('{:<40} {:>8.0f} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+            name, len(encoded) / 1000., *[1000 * t for t in times]))
+    print('{:<40} {:>8} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+        'total', '', *[1000 * t for t in totals]))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,85 @@
+'''
+Wall-clock time of processing a 20-file `multiple=True` upload serially
+(as the upload examples used to) versus with
+`tutorial.utils.uploads.BatchUploadProcessor`, as they do now.
+
+    python -m benchmarks.upload_batch
+'''
+import base64
+import io
+import time
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from tutorial.utils.uploads import BatchUploadProcessor, read_upload
+
+
+def csv_upload(rows):
+    df = pd.DataFrame({
+        'a': np.arange(rows),
+        'b': np.random.rand(rows),
+        'c': ['label-{}'.format(i % 100) for i in range(rows)]
+    })
+    return 'data:text/csv;base64,' + base64.b64encode(
+        df.to_csv(index=False).encode('utf-8')).decode('ascii')
+
+
+def image_upload(width, height):
+    pixels = (np.random.rand(height, width, 3) * 255).astype('uint8')
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, 'PNG')
+    return 'data:image/png;base64,' + base64.b64encode(
+        out.getvalue()).decode('ascii')
+
+
+def timed(func, *args):
+    start = time.time()
+    result = func(*args)
+    return time.time() - start, result
+
+
+def thumbnail(contents, size=(400, 400)):
+    # what upload-image.py's `save_upload` does, without storing it
+    image = Image.open(io.BytesIO(base64.b64decode(contents.split(',')[1])))
+    image.thumbnail(size)
+    out = io.BytesIO()
+    image.convert('RGB').save(out, 'JPEG')
+    return out.getvalue()
+
+
+def report(name, files, largest, serial, batch):
+    print('{:<12} {:>6} {:>14.2f} {:>12.2f} {:>12.2f}'.format(
+        name, files, largest, serial, batch))
+
+
+def run(files=20):
+    processor = BatchUploadProcessor(threads=4)
+    print('{:<12} {:>6} {:>14} {:>12} {:>12}'.format(
+        'kind', 'files', 'largest (s)', 'serial (s)', 'batch (s)'))
+
+    sizes = [20000 * (i + 1) for i in range(files)]
+    contents = [csv_upload(rows) for rows in sizes]
+    names = ['file-{}.csv'.format(i) for i in range(files)]
+    largest, _ = timed(read_upload, contents[-1], names[-1])
+    serial, _ = timed(
+        lambda: [read_upload(c, n) for c, n in zip(contents, names)])
+    processor.parse(contents[:1], names[:1])  # start the workers
+    batch, frames = timed(processor.parse, contents, names)
+    assert [len(df) for df in frames] == sizes
+    report('csv', files, largest, serial, batch)
+
+    contents = [image_upload(400 + 100 * i, 300 + 75 * i)
+                for i in range(files)]
+    names = ['image-{}.png'.format(i) for i in range(files)]
+    largest, _ = timed(thumbnail, contents[-1])
+    serial, _ = timed(lambda: [thumbnail(c) for c in contents])
+    batch, _ = timed(processor.images, thumbnail, contents, names)
+    report('thumbnail', files, largest, serial, batch)
+
+    processor.close()
+
+
+if __name__ == '__main__':
+    run()
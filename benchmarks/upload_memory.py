@@ -0,0 +1,96 @@
+'''
+Peak resident memory of parsing a large `dcc.Upload` CSV payload with the
+previous in-memory path (split, b64decode, decode, StringIO, read_csv)
+versus `tutorial.utils.uploads.read_upload`.
+
+Linux only: the peak is read from VmHWM in /proc/self/status after
+resetting it through /proc/self/clear_refs once the payload is loaded.
+
+    python -m benchmarks.upload_memory [size in MB, default 200]
+'''
+import base64
+import gc
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from tutorial.utils.uploads import read_upload
+
+
+def write_payload(path, size_mb):
+    row = '{},{:.6f},label-{},2019-01-{:02d}\n'
+    with open(path, 'wb') as f:
+        f.write(b'data:text/csv;base64,')
+        buffer = [b'id,value,label,date\n']
+        written = 0
+        i = 0
+        while written < size_mb * 1024 * 1024:
+            line = row.format(i, i * 0.5, i % 1000, i % 28 + 1).encode()
+            buffer.append(line)
+            written += len(line)
+            i += 1
+            if len(buffer) == 30000:
+                block = b''.join(buffer)
+                # keep base64 blocks aligned on 3 bytes
+                cut = len(block) - len(block) % 3
+                f.write(base64.b64encode(block[:cut]))
+                buffer = [block[cut:]]
+        f.write(base64.b64encode(b''.join(buffer)))
+
+
+def previous_path(contents):
+    content_type, content_string = contents.split(',')
+    decoded = base64.b64decode(content_string)
+    return pd.read_csv(io.StringIO(decoded.decode('utf-8')))
+
+
+def vm_kb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+
+def measure(path, parser_name, results):
+    with open(path, 'rb') as f:
+        contents = f.read().decode('ascii')
+    gc.collect()
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+    baseline = vm_kb('VmRSS')
+
+    parser = previous_path if parser_name == 'previous' else read_upload
+    start = time.time()
+    df = parser(contents)
+    elapsed = time.time() - start
+
+    results.put((
+        parser_name, len(df), (vm_kb('VmHWM') - baseline) / 1024.0, elapsed
+    ))
+
+
+def run(size_mb=200):
+    fd, path = tempfile.mkstemp(suffix='.b64')
+    os.close(fd)
+    try:
+        write_payload(path, size_mb)
+        results = multiprocessing.Queue()
+        print('{:<10} {:>10} {:>18} {:>10}'.format(
+            'path', 'rows', 'peak over input MB', 'seconds'))
+        for parser_name in ['previous', 'chunked']:
+            process = multiprocessing.Process(
+                target=measure, args=(path, parser_name, results))
+            process.start()
+            print('{:<10} {:>10} {:>18.1f} {:>10.2f}'.format(*results.get()))
+            process.join()
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -5,6 +5,7 @@ import sys
 
 from algoliasearch import algoliasearch
 from tutorial.chapter_index import chapters
+from tutorial.tools import deferred_sections
 
 # Algolia Credentials
 client = algoliasearch.Client('7EK9KHJW8M', os.environ['ALGOLIA_API_KEY'])
@@ -17,7 +18,8 @@ for chapter in chapters:
     chap['name'] = chapters[chapter]['name']
     chap['permalink'] = 'https://dash.plot.ly'+chapters[chapter]['url']
     chap['description'] = chapters[chapter]['description']
-    chap_content = str(chapters[chapter]['content'])
+    # with the collapsed sections, which are only sent when opened
+    chap_content = str(deferred_sections.inline(chapters[chapter]['content']))
     chap_content = chap_content.replace("'", '')
     chap_content = chap_content.replace('"', '')
     chap_content = chap_content.replace('\\n', '')
@@ -6,10 +6,13 @@ import dash_table
 
 from dash.dependencies import Input, Output
 
-from server import app, server
+from server import app, callback_registry, server
 
 from tutorial import chapter_index
 from tutorial import home
+from tutorial.tools import deferred_sections
+from tutorial.utils import (highlight, interning, markdown_html,
+                            page_dependencies, static_layout)
 
 
 def create_contents(contents):
@@ -33,6 +36,81 @@ chapters = {
 
 chapters.update(chapter_index.chapters)
 
+# Highlight the code blocks and render the Markdown of the chapters once, on
+# the server, instead of in the browser on every visit.
+for chapter in chapters.values():
+    chapter['content'] = markdown_html.prerender(
+        highlight.prerender(chapter['content']))
+for section_id, children in deferred_sections.sections.items():
+    deferred_sections.sections[section_id] = markdown_html.prerender(
+        highlight.prerender(children))
+
+# Links at the bottom of the chapters, by section
+chapter_footers = [
+    ('dash-deployment-server/', [
+        html.Hr(),
+        dcc.Link(html.A('Back to Dash Deployment Server Documentation'),
+                 href='/dash-deployment-server'),
+    ]),
+    ('datatable/', [
+        html.Hr(),
+        dcc.Link('Back to DataTable Documentation', href='/datatable'),
+        html.Br(),
+        dcc.Link('Back to Dash Documentation', href='/'),
+    ]),
+    ('cytoscape/', [
+        html.Hr(),
+        dcc.Link('Back to Cytoscape Documentation', href='/cytoscape'),
+        html.Br(),
+        dcc.Link('Back to Dash Documentation', href='/'),
+    ])
+]
+default_footer = [
+    html.Hr(),
+    dcc.Link(html.A('Back to the Table of Contents'), href='/'),
+]
+
+# The chapters repeat many identical fragments (`html.Hr()`, blockquotes,
+# styles...): keep one instance of each.
+interner = interning.Interner()
+for chapter in chapters.values():
+    chapter['content'] = interner.intern(chapter['content'])
+for _, links in chapter_footers:
+    interner.intern(links)
+interner.intern(default_footer)
+
+# Encode the parts of the chapters that no callback touches once, and only
+# the rest on each request (see `display_content`).
+static_chapters = static_layout.StaticLayout(static_layout.callback_ids(app))
+for chapter in chapters.values():
+    static_chapters.compile(chapter['content'])
+for _, links in chapter_footers:
+    static_chapters.compile(links)
+static_chapters.compile(default_footer)
+
+
+def chapter_name(pathname):
+    '''The chapter that `display_content` shows at `pathname`, or `None`
+    for the `/all` page.'''
+    if pathname.endswith('/') and pathname != '/':
+        pathname = pathname[:len(pathname) - 1]
+    if pathname.split('/')[-1] == 'all':
+        return None
+    matched = [c for c in chapters.keys()
+               if chapters[c]['url'] == pathname]
+    return matched[0] if matched else 'index'
+
+
+# Send each page only the callbacks of its own examples, when it is shown
+# (see `display_content`)
+page_dependencies.PageDependencies(
+    callback_registry,
+    dict((name, chapter['content']) for name, chapter in chapters.items()),
+    chapter_name,
+    deferred_sections.bodies
+)
+
+
 sections_ordered = OrderedDict()
 sections_ordered['What\'s Dash?'] = [
     'introduction',
@@ -147,19 +225,24 @@ app.layout = html.Div(
             ], className='container-width')
         ], className='background'),
         dcc.Location(id='location', refresh=False),
+        # The callbacks of the page at the location, then the location once
+        # they are in place
+        dcc.Store(id='page-dependencies'),
+        dcc.Store(id='page-pathname'),
     ]
 )
 
 
-@app.callback(Output('chapter', 'children'),
-              [Input('location', 'pathname')])
+@static_layout.callback(app, static_chapters, Output('chapter', 'children'),
+                        [Input('page-pathname', 'data')])
 def display_content(pathname):
     if pathname is None:
         return ''
     if pathname.endswith('/') and pathname != '/':
         pathname = pathname[:len(pathname) - 1]
+    name = chapter_name(pathname)
 
-    if pathname.split('/')[-1] == 'all':
+    if name is None:
         pdf_contents = []
         table_of_contents = []
 
@@ -210,56 +293,13 @@ def display_content(pathname):
             html.Div(pdf_contents)
         ], id='pdf-docs')
 
-    matched = [c for c in chapters.keys()
-               if chapters[c]['url'] == pathname]
-
-    if matched and matched[0] != 'index':
-        if 'dash-deployment-server/' in pathname:
-            content = html.Div([
-                html.Div(chapters[matched[0]]['content']),
-                html.Hr(),
-                dcc.Link(html.A('Back to Dash Deployment Server Documentation'), href='/dash-deployment-server'),
-                html.Div(id='wait-for-page-{}'.format(pathname)),
-            ])
-        elif 'datatable/' in pathname:
-            content = html.Div([
-                html.Div(chapters[matched[0]]['content']),
-                html.Hr(),
-                dcc.Link(
-                    'Back to DataTable Documentation',
-                    href='/datatable'
-                ),
-                html.Br(),
-                dcc.Link(
-                    'Back to Dash Documentation',
-                    href='/'
-                ),
-                html.Div(id='wait-for-page-{}'.format(pathname)),
-            ])
-
-        elif 'cytoscape/' in pathname:
-            content = html.Div([
-                html.Div(chapters[matched[0]]['content']),
-                html.Hr(),
-                dcc.Link(
-                    'Back to Cytoscape Documentation',
-                    href='/cytoscape'
-                ),
-                html.Br(),
-                dcc.Link(
-                    'Back to Dash Documentation',
-                    href='/'
-                ),
-                html.Div(id='wait-for-page-{}'.format(pathname)),
-            ])
-
-        else:
-            content = html.Div([
-                html.Div(chapters[matched[0]]['content']),
-                html.Hr(),
-                dcc.Link(html.A('Back to the Table of Contents'), href='/'),
-                html.Div(id='wait-for-page-{}'.format(pathname)),
-            ])
+    if name != 'index':
+        footer = next((links for prefix, links in chapter_footers
+                       if prefix in pathname), default_footer)
+        content = html.Div(
+            [html.Div(chapters[name]['content'])] + footer +
+            [html.Div(id='wait-for-page-{}'.format(pathname))]
+        )
 
     else:
         content = chapters['index']['content']
@@ -5,6 +5,8 @@ from flask import Flask, redirect
 
 import os
 
+from tutorial.utils.callback_registry import CallbackRegistry
+
 
 app = Dash(
     __name__,
@@ -18,6 +20,9 @@ app.css.config.serve_locally = True
 app.scripts.config.serve_locally = True
 app.config.suppress_callback_exceptions = True
 
+# Keeps track of which example or chapter registered each callback
+callback_registry = CallbackRegistry(app)
+
 
 @server.route('/deployment/on-premise')
 def redirectDDS():
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tutorial.utils.filter_expressions import (Boolean, Comparison,
+                                               FilterError, Literal, Not,
+                                               filter_frame, parse)
+
+
+def rows(df, expression):
+    return list(filter_frame(df, expression).index)
+
+
+class ParseTests(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(parse(''))
+        self.assertIsNone(parse('   '))
+
+    def test_table_syntax(self):
+        self.assertEqual(
+            parse('"continent" eq Asia && "pop" > num(5e6)'),
+            Boolean('and', (
+                Comparison('continent', 'eq', Literal('Asia', 'word')),
+                Comparison('pop', 'gt', Literal('5e6', 'number'))
+            ))
+        )
+
+    def test_precedence(self):
+        self.assertEqual(
+            parse('a = 1 || !(b = "x y") && {c d} in (1, 2)'),
+            Boolean('or', (
+                Comparison('a', 'eq', Literal('1', 'word')),
+                Boolean('and', (
+                    Not(Comparison('b', 'eq', Literal('x y', 'string'))),
+                    Comparison('c d', 'in', (Literal('1', 'word'),
+                                             Literal('2', 'word')))
+                ))
+            ))
+        )
+
+    def test_errors(self):
+        for expression in ['a', 'a eq', 'a eq 1 b', '(a eq 1', 'a ? 1',
+                           'a between 1 2']:
+            with self.assertRaises(FilterError):
+                parse(expression)
+
+
+class FilterFrameTests(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'country': ['France', 'Japan', 'United States', 'Chile'],
+            'continent': ['Europe', 'Asia', 'Americas', 'Americas'],
+            'pop': [67e6, 126e6, 327e6, 18e6],
+            'member': [True, False, True, False]
+        })
+
+    def test_comparisons(self):
+        self.assertEqual(rows(self.df, '"continent" eq Americas'), [2, 3])
+        self.assertEqual(rows(self.df, '"continent" ne Americas'), [0, 1])
+        self.assertEqual(rows(self.df, '"country" eq "United States"'),
+                         [2])
+        self.assertEqual(rows(self.df, '"pop" > num(1e8)'), [1, 2])
+        self.assertEqual(rows(self.df, '"pop" <= 67e6'), [0, 3])
+        self.assertEqual(rows(self.df, '"member" eq true'), [0, 2])
+        self.assertEqual(rows(self.df, '"country" contains an'), [0, 1])
+        self.assertEqual(rows(self.df, '"pop" between 5e7 and 2e8'),
+                         [0, 1])
+        self.assertEqual(rows(self.df, '"continent" in (Asia, Europe)'),
+                         [0, 1])
+
+    def test_combinations(self):
+        self.assertEqual(rows(
+            self.df, '"continent" eq Americas && !("pop" < 1e8)'), [2])
+        self.assertEqual(rows(
+            self.df, '"continent" eq Asia || "pop" < 2e7'), [1, 3])
+
+    def test_no_filter(self):
+        self.assertIs(filter_frame(self.df, ''), self.df)
+
+    def test_check_errors(self):
+        for expression in ['"capital" eq Paris', '"pop" > many',
+                           '"pop" eq "many"', '"pop" contains 1',
+                           '"member" eq maybe', '"country" eq num(1)']:
+            with self.assertRaises(FilterError):
+                filter_frame(self.df, expression)
+
+
+class DtypeTests(unittest.TestCase):
+    def test_mixed_object_column(self):
+        df = pd.DataFrame({'o': pd.Series(['a', 3, 5.5, None],
+                                          dtype=object)})
+        # numbers are compared with the numbers, text with the strings
+        self.assertEqual(rows(df, '"o" eq 3'), [1])
+        self.assertEqual(rows(df, '"o" eq "3"'), [])
+        self.assertEqual(rows(df, '"o" ne 3'), [0, 2, 3])
+        self.assertEqual(rows(df, '"o" > num(2)'), [1, 2])
+        self.assertEqual(rows(df, '"o" > 2'), [0, 1, 2])
+        self.assertEqual(rows(df, '"o" between 3 and 6'), [1, 2])
+        self.assertEqual(rows(df, '"o" in (a, 5.5)'), [0, 2])
+        self.assertEqual(rows(df, '"o" contains a'), [0])
+
+    def test_time_zone_aware_dates(self):
+        df = pd.DataFrame({'t': pd.date_range(
+            '2020-01-01', periods=4, tz='US/Eastern')})
+        # dates without a time zone are in the column's
+        self.assertEqual(rows(df, '"t" > 2020-01-02'), [2, 3])
+        self.assertEqual(rows(df, '"t" eq 2020-01-03'), [2])
+        self.assertEqual(rows(df, '"t" >= 2020-01-02T05:00:00+00:00'),
+                         [1, 2, 3])
+
+    def test_nullable_string_column(self):
+        df = pd.DataFrame({'s': pd.array(['b', None, 'd', 'a'],
+                                         dtype='string')})
+        # missing values are in no order
+        self.assertEqual(rows(df, '"s" > a'), [0, 2])
+        self.assertEqual(rows(df, '"s" between a and c'), [0, 3])
+        self.assertEqual(rows(df, '"s" ne b'), [1, 2, 3])
+
+    def test_nullable_integer_column(self):
+        df = pd.DataFrame({'n': pd.array([1, None, 3, 4], dtype='Int64')})
+        self.assertEqual(rows(df, '"n" > 2'), [2, 3])
+        self.assertEqual(rows(df, '"n" in (1, 4)'), [0, 3])
+
+    def test_categorical_column(self):
+        df = pd.DataFrame({
+            'size': pd.Categorical(['S', 'L', 'M'], categories=['S', 'M', 'L'],
+                                   ordered=True),
+            'rank': pd.Categorical([1, 2, 3], ordered=True),
+            'color': pd.Categorical(['red', 'blue', 'red'])
+        })
+        self.assertEqual(rows(df, '"size" > S'), [1, 2])
+        self.assertEqual(rows(df, '"rank" eq 2'), [1])
+        self.assertEqual(rows(df, '"color" eq red'), [0, 2])
+        with self.assertRaises(FilterError):
+            filter_frame(df, '"color" > blue')
+        with self.assertRaises(FilterError):
+            filter_frame(df, '"size" > XL')
+
+    def test_missing_numbers(self):
+        df = pd.DataFrame({'x': [1.0, np.nan, 3.0]})
+        self.assertEqual(rows(df, '"x" ne 1'), [1, 2])
+        self.assertEqual(rows(df, '"x" < 5'), [0, 2])
@@ -132,7 +132,11 @@ layout = html.Div([
     transform a ``NumPy`` array into an image data string.
 
     Finally, ``dash-canvas`` provides utility functions to process images
-    given the binary mask derived from annotations:
+    given the binary mask derived from annotations, such as
+    ``watershed_segmentation(img, mask)``. The example below performs the
+    same steps with scikit-image directly, so that the gradient of the
+    image, which does not change, is computed once when the app starts
+    instead of after every stroke:
     ''')),
 
     dcc.SyntaxHighlighter(
@@ -1166,7 +1166,12 @@ Upload = html.Div([
         the results in a table. Note that this example uses the
         `DataTable` from the
         [dash-table](https://github.com/plotly/dash-table)
-        project.
+        project. The files are parsed in parallel, in a process pool, by
+        `batch_processor` from `tutorial/utils/uploads.py` in the Dash
+        docs: it decodes each upload a chunk at a time into a temporary
+        file and reads CSVs in chunks, so large files don't need several
+        copies in memory, and it limits the size of each file and the time
+        it may take.
     '''))),
 
     Example(examples['upload-datafile'][1]),
@@ -1176,6 +1181,12 @@ Upload = html.Div([
     Syntax(examples['upload-image'][0], summary=dcc.Markdown(s('''
         This next example responds to image uploads by displaying them
         in the app with the `html.Img` component.
+        Rather than sending the uploaded `contents` back to the browser,
+        it decodes each image once, saves the original and a thumbnail
+        as files that every worker process of the server can read and
+        serves them from a Flask route, so the callback only returns
+        a short URL. Images that are too large are refused. The images of an upload
+        are processed in parallel, in a thread pool.
     '''))),
     Example(examples['upload-image'][1]),
 
@@ -6,13 +6,19 @@ import dash_html_components as html
 from tutorial import tools
 from .utils import PythonSnippet
 
+# The docs app reads the tree's elements from the file cache of
+# `tutorial.utils.phylogeny` instead of parsing it on every start
 examples = {
-    example: tools.load_example(
-        'tutorial/examples/cytoscape/{}'.format(example)
+    'usage-phylogeny.py': tools.load_example(
+        'tutorial/examples/cytoscape/usage-phylogeny.py',
+        substitutions={
+            "tree = Phylo.read('tutorial/examples/cytoscape/data/apaf.xml', "
+            "'phyloxml')\nnodes, edges = generate_elements(tree)\n":
+            "from tutorial.utils.phylogeny import load_elements\n"
+            "nodes, edges = load_elements("
+            "'tutorial/examples/cytoscape/data/apaf.xml')\n"
+        }
     )
-    for example in [
-        'usage-phylogeny.py'
-    ]
 }
 
 
@@ -52,8 +58,7 @@ layout = html.Div([
     called `add_to_elements`.
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('get_col_positions() function definition'),
+    tools.DeferredDetails('get_col_positions() function definition', [
         PythonSnippet('''
         def get_col_positions(tree, column_width=80):
             taxa = tree.get_terminals()
@@ -76,8 +81,7 @@ layout = html.Div([
     ''')
     ]),
 
-    html.Details(open=False, children=[
-        html.Summary('get_row_positions() function definition'),
+    tools.DeferredDetails('get_row_positions() function definition', [
         PythonSnippet('''
         def get_row_positions(tree):
             taxa = tree.get_terminals()
@@ -95,11 +99,15 @@ layout = html.Div([
         ''')
     ]),
 
-    html.Details(open=False, children=[
-        html.Summary('add_to_elements() function definition'),
+    tools.DeferredDetails('add_to_elements() function definition', [
         PythonSnippet('''
         def add_to_elements(clade, clade_id):
             children = clade.clades
+            # Clades are numbered in the order they are visited, so the clades
+            # below this one are numbered from `order` up to (not including) the
+            # `end` that is taken once all of its children have been added.
+            order = next(counter)
+            clade_edges = []
     
             pos_x = col_positions[clade] * xlen
             pos_y = row_positions[clade] * ylen
@@ -137,7 +145,8 @@ layout = html.Div([
                     'data': {
                         'source': clade_id,
                         'target': support_id,
-                        'sourceCladeId': clade_id
+                        'sourceCladeId': clade_id,
+                        'cladeOrder': order
                     },
                 }
     
@@ -146,7 +155,8 @@ layout = html.Div([
                         'source': support_id,
                         'target': child_id,
                         'length': clade.branch_length,
-                        'sourceCladeId': clade_id
+                        'sourceCladeId': clade_id,
+                        'cladeOrder': order
                     },
                 }
     
@@ -154,9 +164,14 @@ layout = html.Div([
                     cy_source['data']['confidence'] = clade.confidence.value
     
                 nodes.append(cy_support_node)
-                edges.extend([cy_support_edge, cy_edge])
+                clade_edges.extend([cy_support_edge, cy_edge])
     
                 add_to_elements(child, child_id)
+    
+            end = next(counter)
+            for cy_edge in clade_edges:
+                cy_edge['data']['cladeEnd'] = end
+            edges.extend(clade_edges)
         ''')
     ]),
 
@@ -169,6 +184,7 @@ layout = html.Div([
     ''')),
 
     PythonSnippet('''
+    import itertools
     import math
     
     def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
@@ -186,6 +202,7 @@ layout = html.Div([
     
         nodes = []
         edges = []
+        counter = itertools.count()
     
         add_to_elements(tree.clade, 'r')
         
@@ -246,10 +263,12 @@ layout = html.Div([
     
     At this point, we simply need to create the layout of the app, which will
     be a simple Cytoscape component. We will also add a callback that will 
-    color all the children of an edge red whenever we hover on that edge. This
-    is accomplished by filtering the IDs, which are sequences of 
-    *s*'s and *c*'s, which stand for *support* and *children*, intersected
-    by the number 0 or 1, since there are two subclades per clade.
+    color all the children of an edge blue whenever we hover on that edge.
+    `add_to_elements` numbers the clades in the order it visits them, so the
+    clades below any clade have the consecutive numbers from its `cladeOrder`
+    up to its `cladeEnd`. Every edge carries the number of the clade it
+    comes from, and a single selector comparing that number to the hovered
+    edge's range finds all of the children, however big the tree is.
     ''')),
 
     PythonSnippet('''
@@ -276,13 +295,11 @@ layout = html.Div([
         if not edgeData:
             return stylesheet
     
-        if 's' in edgeData['source']:
-            val = edgeData['source'].split('s')[0]
-        else:
-            val = edgeData['source']
-    
+        # The edges below the hovered one belong to the clades numbered from
+        # its cladeOrder up to its cladeEnd
         children_style = [{
-            'selector': 'edge[source *= "{}"]'.format(val),
+            'selector': 'edge[cladeOrder >= {}][cladeOrder < {}]'.format(
+                edgeData['cladeOrder'], edgeData['cladeEnd']),
             'style': {
                 'line-color': 'blue'
             }
@@ -295,8 +312,7 @@ layout = html.Div([
     This results in the following app:
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View the complete source code'),
+    tools.DeferredDetails('View the complete source code', [
         PythonSnippet(examples['usage-phylogeny.py'][0])
     ]),
 
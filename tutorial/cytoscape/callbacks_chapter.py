@@ -99,8 +99,7 @@ layout = html.Div([
     Recall the declaration of the graph:
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View Elements Declaration'),
+    tools.DeferredDetails('View Elements Declaration', [
         dcc.SyntaxHighlighter(dedent('''
         nodes = [
             {
@@ -353,8 +352,8 @@ layout = html.Div([
     ## Adding and removing elements
     
     One useful aspect of callbacks is the ability to add and remove elements.
-    By using elements as a state of your callback, you can decide to manipulate
-    it in order to add elements whenever another Dash component is updated.
+    By returning a new `elements` list from a callback, you can decide to add
+    or remove elements whenever another Dash component is updated.
     
     Let's take as an example a simple app where you can add and remove nodes
     by clicking two html buttons (with the same graph as above):
@@ -367,48 +366,99 @@ layout = html.Div([
     ])
     '''),
 
+    dcc.Markdown(dedent('''
+    The elements of the graph are kept on the server, in an `ElementStore`
+    (see `tutorial/utils/elements.py` in these docs). It numbers every
+    change to the elements with a version, so that a callback only has to
+    send the elements that were added or removed since the version a browser
+    already has, instead of the whole list. That version is kept in a
+    `dcc.Store`, and the changes are sent to another one:
+    ''')),
+
+    PythonSnippet('''
+    graph = ElementStore(nodes + edges)
+
+    dcc.Store(id='cytoscape-elements-version', data=graph.token()),
+    dcc.Store(id='cytoscape-elements-changes')
+    '''),
+
     dcc.Markdown(dedent('''
     The following callback would be needed:
     
     ''')),
 
     PythonSnippet('''
-    @app.callback(Output('cytoscape-callbacks-2', 'elements'),
+    @app.callback(Output('cytoscape-elements-changes', 'data'),
                   [Input('btn-add-node-example', 'n_clicks_timestamp'),
                    Input('btn-remove-node-example', 'n_clicks_timestamp')],
-                  [State('cytoscape-callbacks-2', 'elements')])
-    def update_elements(btn_add, btn_remove, elements):
-        if int(btn_add) > int(btn_remove):
-            next_node_idx = len(elements) - len(edges)
+                  [State('cytoscape-elements-version', 'data')])
+    def update_elements(btn_add, btn_remove, version):
+        with graph_lock:
+            shown = [node for node in nodes if node['data']['id'] in graph]
     
-            if next_node_idx < len(nodes):
-                return edges + nodes[:next_node_idx+1]
+            if int(btn_add) > int(btn_remove):
+                if len(shown) < len(nodes):
+                    node = nodes[len(shown)]
+                    ids = set(n['data']['id'] for n in shown + [node])
+                    graph.add(node, *[
+                        edge for edge in edges
+                        if node['data']['id'] in (edge['data']['source'],
+                                                  edge['data']['target']) and
+                        edge['data']['source'] in ids and
+                        edge['data']['target'] in ids
+                    ])
     
-        elif int(btn_remove) > int(btn_add):
-            if len(elements) > len(edges):
-                return elements[:-1]
+            elif int(btn_remove) > int(btn_add):
+                if shown:
+                    graph.remove(shown[-1]['data']['id'])
     
-        return elements
+        return graph.delta(version)
     '''),
 
     dcc.Markdown(dedent('''
     
     The first conditional `if int(btn_add) > int(btn_remove)` verifies whether
     the add button was just clicked. If it wasn't, then the remove button is
-    verified with `elif int(btn_remove) > int(btn_add)`. If neither were clicked,
-    then we return the default `elements`.
+    verified with `elif int(btn_remove) > int(btn_add)`. If neither were
+    clicked, the graph is left as it is.
+    
+    The statement `if len(shown) < len(nodes)` verifies if we have reached
+    the maximum number of nodes. If not, then we add the next node, with its
+    edges to the nodes already shown. Similarly for the *remove* case:
+    `if shown` only removes a node if there is any remaining, and
+    `graph.remove` removes its edges as well, as Cytoscape does.
     
-    The statement `if next_node_idx < len(nodes)` verifies if we have reached
-    the maximum number of nodes. If not, then we proceed to add the next node.
-    Similarly for the *remove* case: `if len(elements) > len(edges)` only
-    removes nodes if there is any remaining (so we don't remove any edge). If
-    neither conditions are met, we simply return the current elements.
+    The callback then returns `graph.delta(version)`: the changes since the
+    browser's version, including those made by other people viewing the
+    app, since the graph is shared by all of them. A browser that is too far
+    behind gets the whole list instead. Notice that the callback doesn't take the `elements`
+    themselves as `State`: every `State` is sent from the browser to the
+    server each time the callback fires, so with a large graph that would
+    upload the whole list on every click.
     
-    It`s important to *mutate* the `elements` object by passing it into the 
-    callbacks as `State` (which is what we are doing here) rather than making 
-    it a `global` variable. In general, `global` variables should be avoided 
-    as they won't work when multiple users are viewing the app or when the app 
-    is deployed with multiple gunicorn workers.
+    The changes are merged into the graph's `elements` in the browser, by a
+    clientside callback that runs the `deltas.elements` function of
+    `assets/deltas.js` in these docs:
+    ''')),
+
+    PythonSnippet('''
+    app.clientside_callback(
+        ClientsideFunction('deltas', 'elements'),
+        [Output('cytoscape-callbacks-2', 'elements'),
+         Output('cytoscape-elements-version', 'data')],
+        [Input('cytoscape-elements-changes', 'data')],
+        [State('cytoscape-callbacks-2', 'elements'),
+         State('cytoscape-elements-version', 'data')]
+    )
+    '''),
+
+    dcc.Markdown(dedent('''
+    The store lives in the memory of the server process, so each process of
+    an app served by several gunicorn workers has its own graph. Versions
+    name the process they come from, so a browser whose request reaches
+    another process is sent that process's whole graph rather than changes
+    it can't apply. To share one graph between processes, keep its
+    elements and their changes in a shared database instead.
     
     You can find the complete app below:
     ''')),
@@ -201,8 +201,7 @@ layout = html.Div([
     > want to take a look at the stylesheet used previously.
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View the Stylesheet'),
+    tools.DeferredDetails('View the Stylesheet', [
         dcc.SyntaxHighlighter(dedent('''
         my_stylesheet = [
             # Group selectors
@@ -239,8 +239,9 @@ layout = html.Div([
     hosted on the [Dash Deployment Servers](https://plot.ly/products/dash/).
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('Expand to see how to interactively style your elements'),
+    tools.DeferredDetails((
+        'Expand to see how to interactively style your elements'
+    ), [
         PythonSnippet('''
         @app.callback(Output('cytoscape', 'stylesheet'),
                       [Input('cytoscape', 'tapNode'),
@@ -342,8 +343,7 @@ layout = html.Div([
     ''')),
 
 
-    html.Details(open=False, children=[
-        html.Summary('Expand to see how to construct the dictionaries'),
+    tools.DeferredDetails('Expand to see how to construct the dictionaries', [
         PythonSnippet('''
         with open('demos/data/sample_network.txt', 'r') as f:
             data = f.read().split('\\n')
@@ -398,8 +398,7 @@ layout = html.Div([
         ''')
     ]),
 
-    html.Details(open=False, children=[
-        html.Summary('Expand to see how to generate elements'),
+    tools.DeferredDetails('Expand to see how to generate elements', [
         PythonSnippet('''
         @app.callback(Output('cytoscape', 'elements'),
                       [Input('cytoscape', 'tapNodeData')],
@@ -5,6 +5,8 @@ import dash_cytoscape as cyto
 import dash_core_components as dcc
 import dash_html_components as html
 
+from tutorial import tools
+from tutorial.utils import graph_layout
 from .utils import CreateDisplay
 
 
@@ -43,10 +45,22 @@ edges = [
 
 elements = nodes + edges
 
+# A tree positioned once on the server (and cached on disk) so that the
+# browser only has to draw it. It is kept small because the elements are
+# part of the page's layout; `benchmarks/graph_layout.py` times larger ones.
+tree_elements = graph_layout.preset_elements(
+    [{'data': {'id': str(i)}} for i in range(50)] +
+    [{'data': {'source': str((i - 1) // 3), 'target': str(i)}}
+     for i in range(1, 50)],
+    'hierarchical',
+    spacing=40
+)
+
 
 Display = CreateDisplay({
     'cyto': cyto,
     'elements': elements,
+    'tree_elements': tree_elements,
     'math': math
 })
 
@@ -99,8 +113,7 @@ layout = html.Div([
     
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View Elements Declaration'),
+    tools.DeferredDetails('View Elements Declaration', [
         dcc.SyntaxHighlighter(dedent('''
         nodes = [
             {
@@ -272,5 +285,29 @@ layout = html.Div([
             'name': 'cose'
         }
     )
+    '''),
+
+    dcc.Markdown(dedent('''
+    ## Laying Out Large Graphs on the Server
+
+    All the layouts above are computed by Cytoscape.js in the browser, every
+    time the page is loaded. With thousands of nodes, physics-based layouts
+    like `cose` can freeze the page for a long time. Since the positions only
+    depend on the graph, you can instead compute them once in Python when
+    the app starts (with a library such as NetworkX, or your own code),
+    store them alongside the graph, and give them to Cytoscape with the
+    `preset` layout. The positions of the graph below were computed on the
+    server; the same code lays out graphs of thousands of nodes:
+    ''')),
+
+    Display('''
+    cyto.Cytoscape(
+        id='cytoscape-layout-9',
+        elements=tree_elements,
+        style={'width': '100%', 'height': '350px'},
+        layout={
+            'name': 'preset'
+        }
+    )
     ''')
 ])
@@ -126,8 +126,7 @@ layout = html.Div([
     chapter, but this time we examine the stylesheet:
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View simple elements'),
+    tools.DeferredDetails('View simple elements', [
         dcc.SyntaxHighlighter(dedent('''
         simple_elements = [
             {
@@ -226,8 +225,7 @@ layout = html.Div([
     
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View weighted elements'),
+    tools.DeferredDetails('View weighted elements', [
         dcc.SyntaxHighlighter(dedent('''
         weighted_elements = [
             {'data': {'id': 'A'}},
@@ -313,8 +311,7 @@ layout = html.Div([
     declare:
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View named elements'),
+    tools.DeferredDetails('View named elements', [
         dcc.SyntaxHighlighter(dedent('''
         named_elements = [
             {'data': {'id': 'A', 'firstname': 'Albert'}},
@@ -456,8 +453,7 @@ layout = html.Div([
     might want different ways to display double-edged 
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View double-edged elements'),
+    tools.DeferredDetails('View double-edged elements', [
         dcc.SyntaxHighlighter(dedent('''
         double_edges = [
             {'data': {'id': src+tgt, 'source': src, 'target': tgt}}
@@ -522,8 +518,7 @@ layout = html.Div([
     edges removed:
     ''')),
 
-    html.Details(open=False, children=[
-        html.Summary('View directed elements'),
+    tools.DeferredDetails('View directed elements', [
         dcc.SyntaxHighlighter(dedent('''
         directed_edges = [
             {'data': {'id': src+tgt, 'source': src, 'target': tgt}}
@@ -42,7 +42,7 @@ dash_daq_components = {
     'ColorPicker': {
         'description': '''A color picker.''',
         'props': {
-            'label': '\"colorPicker\"'
+            'label': 'colorPicker'
         },
     },
     'Gauge': {
@@ -65,7 +65,7 @@ dash_daq_components = {
         'description': '''A boolean indicator LED.''',
         'props': {
             'value': True,
-            'color': '\"#00cc96\"'
+            'color': '#00cc96'
         }
     },
     'Knob': {
@@ -80,7 +80,7 @@ dash_daq_components = {
     'LEDDisplay': {
         'description': '''A 7-segment LED display component.''',
         'props': {
-            'value': '\"3.14159\"'
+            'value': '3.14159'
         }
     },
     'NumericInput': {
@@ -117,7 +117,7 @@ dash_daq_components = {
             'value': 17,
             'min': 0,
             'max': 100,
-            'targets': '{\"25\": {\"label\": \"TARGET\"}}'
+            'targets': {'25': {'label': 'TARGET'}}
         }
     },
     'Tank': {
@@ -6,7 +6,7 @@ import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Input, Output
 import plotly
-from tutorial import styles
+from tutorial import styles, tools
 import reusable_components as rc
 from server import app
 
@@ -2153,8 +2153,7 @@ Troubleshooting = html.Div(children=[
 
     ''')),
 
-    html.Details([
-        html.Summary("Are using the latest versions?"),
+    tools.DeferredDetails("Are using the latest versions?", [
 
         dcc.SyntaxHighlighter('''dash=={}
             dash-html-components=={}
@@ -2199,8 +2198,7 @@ Troubleshooting = html.Div(children=[
 
     ''')),
 
-    html.Details([
-        html.Summary("SSL certificate problem: self signed certificate"),
+    tools.DeferredDetails("SSL certificate problem: self signed certificate", [
 
         dcc.SyntaxHighlighter(s(
         '''fatal: unable to access 'https://<your-dash-deployment-server>/GIT/your-dash-app-name/': SSL certificate problem: self signed certificate'''),
@@ -2226,8 +2224,9 @@ Troubleshooting = html.Div(children=[
 
     ''')),
 
-    html.Details([
-        html.Summary("Could not find a version that satisfies the requirement"),
+    tools.DeferredDetails((
+        "Could not find a version that satisfies the requirement"
+    ), [
 
         dcc.SyntaxHighlighter(
         '''...
@@ -2279,8 +2278,9 @@ Troubleshooting = html.Div(children=[
         '''))
     ]),
 
-    html.Details([
-        html.Summary("Failed to find application object 'server' in 'app"),
+    tools.DeferredDetails((
+        "Failed to find application object 'server' in 'app"
+    ), [
 
         dcc.SyntaxHighlighter(
         '''...
@@ -2312,8 +2312,7 @@ Troubleshooting = html.Div(children=[
         '''))
     ]),
 
-    html.Details([
-        html.Summary("SSH deploy: git push is asking for password."),
+    tools.DeferredDetails("SSH deploy: git push is asking for password.", [
 
         dcc.SyntaxHighlighter(
             '''
@@ -2377,8 +2376,9 @@ Troubleshooting = html.Div(children=[
             '''))
     ]),
 
-    html.Details([
-        html.Summary("Got permission denied while trying to connect to the Docker daemon socket"),
+    tools.DeferredDetails((
+        "Got permission denied while trying to connect to the Docker daemon socket"
+    ), [
 
         dcc.SyntaxHighlighter(s(
         '''$ Got permission denied while trying to connect to the Docker daemon socket at unix:///var/run/docker.sock: Get http://%2Fvar%2Frun%2Fdocker.sock/v1.38/containers/json?all=1&filters=%7B%22label%22%3A%7B%22dokku%22%3Atrue%7D%2C%22status%22%3A%7B%22exited%22%3Atrue%7D%7D: dial unix /var/run/docker.sock: connect: permission denied'''),
@@ -2393,8 +2393,7 @@ Troubleshooting = html.Div(children=[
         '''))
     ]),
 
-    html.Details([
-        html.Summary("Unable to select a buildpack"),
+    tools.DeferredDetails("Unable to select a buildpack", [
 
         dcc.SyntaxHighlighter(s(
             '''...
@@ -2422,8 +2421,9 @@ Troubleshooting = html.Div(children=[
 
     ''')),
 
-    html.Details([
-        html.Summary("Callbacks using async processes aren't running and `Celery` is not present in app logs"),
+    tools.DeferredDetails((
+        "Callbacks using async processes aren't running and `Celery` is not present in app logs"
+    ), [
 
         html.Br(),
 
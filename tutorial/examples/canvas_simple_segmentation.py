@@ -4,9 +4,10 @@ from dash.dependencies import Input, Output, State
 import dash_html_components as html
 import dash_canvas
 from dash_canvas import DashCanvas
-from dash_canvas.utils import (array_to_data_url, parse_jsonstring,
-                              watershed_segmentation)
-from skimage import io, color, img_as_ubyte
+from dash_canvas.utils import array_to_data_url, parse_jsonstring
+from scipy import ndimage
+from skimage import io, color, img_as_ubyte, measure
+from skimage.segmentation import watershed
 import numpy as np
 
 app = dash.Dash(__name__)
@@ -14,6 +15,9 @@ app = dash.Dash(__name__)
 filename = 'https://upload.wikimedia.org/wikipedia/commons/e/e4/Mitochondria%2C_mammalian_lung_-_TEM_%282%29.jpg'
 canvas_width = 300 
 img = io.imread(filename, as_gray=True)
+# The image doesn't change, so its gradient (the landscape that the
+# watershed floods) is computed once rather than for every annotation
+gradient = -ndimage.gaussian_gradient_magnitude(img, 4)
 
 app.layout = html.Div([
     html.H6('Annotate the two objects and the background'),
@@ -35,7 +39,7 @@ app.layout = html.Div([
 def segmentation(string):
     if string:
         mask = parse_jsonstring(string, img.shape)
-        seg = watershed_segmentation(img, mask)
+        seg = watershed(gradient, measure.label(mask))
         src = color.label2rgb(seg, image=img)
     else:
         raise PreventUpdate
@@ -1,6 +1,4 @@
-import base64
 import datetime
-import io
 
 import dash
 from dash.dependencies import Input, Output, State
@@ -8,7 +6,10 @@ import dash_core_components as dcc
 import dash_html_components as html
 import dash_table
 
-import pandas as pd
+# Parses the files of an upload in a shared process pool, decoding each
+# one a chunk at a time and reading it with chunked, typed parsers, see
+# `tutorial/utils/uploads.py` in the Dash docs
+from tutorial.utils.uploads import UploadError, batch_processor
 
 
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
@@ -39,20 +40,10 @@ app.layout = html.Div([
 ])
 
 
-def parse_contents(contents, filename, date):
-    content_type, content_string = contents.split(',')
-
-    decoded = base64.b64decode(content_string)
-    try:
-        if 'csv' in filename:
-            # Assume that the user uploaded a CSV file
-            df = pd.read_csv(
-                io.StringIO(decoded.decode('utf-8')))
-        elif 'xls' in filename:
-            # Assume that the user uploaded an excel file
-            df = pd.read_excel(io.BytesIO(decoded))
-    except Exception as e:
-        print(e)
+def parse_contents(df, contents, filename, date):
+    if isinstance(df, UploadError):
+        # too large, too slow or not a CSV or Excel file
+        print(df)
         return html.Div([
             'There was an error processing this file.'
         ])
@@ -83,9 +74,12 @@ def parse_contents(contents, filename, date):
                State('upload-data', 'last_modified')])
 def update_output(list_of_contents, list_of_names, list_of_dates):
     if list_of_contents is not None:
+        # Parse the files in parallel; the results come back in the order
+        # the files were uploaded
+        frames = batch_processor.parse(list_of_contents, list_of_names)
         children = [
-            parse_contents(c, n, d) for c, n, d in
-            zip(list_of_contents, list_of_names, list_of_dates)]
+            parse_contents(df, c, n, d) for df, c, n, d in
+            zip(frames, list_of_contents, list_of_names, list_of_dates)]
         return children
 
 
@@ -5,12 +5,28 @@ from dash.dependencies import Input, Output, State
 import dash_core_components as dcc
 import dash_html_components as html
 
+# Saves the files of an upload in a shared thread pool, into a store of
+# files that every server process can read, see `tutorial/utils/uploads.py`
+# in the Dash docs
+from tutorial.utils.uploads import ImageStore, UploadError, batch_processor
+
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
 
 app.scripts.config.serve_locally = True
 
+# Uploaded images and their thumbnails are saved as files and served from
+# a Flask route, so the callback returns a short URL instead of sending
+# the whole base64 encoded image back to the browser.
+image_store = ImageStore()
+
+
+@app.server.route('/upload-image/<name>')
+def serve_image(name):
+    return image_store.serve(name)
+
+
 app.layout = html.Div([
     dcc.Upload(
         id='upload-image',
@@ -35,14 +51,24 @@ app.layout = html.Div([
 ])
 
 
-def parse_contents(contents, filename, date):
+def parse_contents(names, contents, filename, date):
+    if isinstance(names, UploadError):
+        # too large, too slow or not an image
+        print(names)
+        return html.Div([
+            html.H5(filename),
+            'There was an error processing this file.',
+            html.Hr()
+        ])
     return html.Div([
         html.H5(filename),
         html.H6(datetime.datetime.fromtimestamp(date)),
 
-        # HTML images accept base64 encoded strings in the same format
-        # that is supplied by the upload
-        html.Img(src=contents),
+        # Link the thumbnail to the full resolution image
+        html.A(
+            html.Img(src='/upload-image/{}'.format(names[1])),
+            href='/upload-image/{}'.format(names[0])
+        ),
         html.Hr(),
         html.Div('Raw Content'),
         html.Pre(contents[0:200] + '...', style={
@@ -58,12 +84,15 @@ def parse_contents(contents, filename, date):
                State('upload-image', 'last_modified')])
 def update_output(list_of_contents, list_of_names, list_of_dates):
     if list_of_contents is not None:
+        # Save the images in parallel; the results come back in the order
+        # the files were uploaded
+        names = batch_processor.images(
+            image_store.save_upload, list_of_contents, list_of_names)
         children = [
-            parse_contents(c, n, d) for c, n, d in
-            zip(list_of_contents, list_of_names, list_of_dates)]
+            parse_contents(i, c, n, d) for i, c, n, d in
+            zip(names, list_of_contents, list_of_names, list_of_dates)]
         return children
 
 
-
 if __name__ == '__main__':
     app.run_server(debug=True)
@@ -3,11 +3,16 @@ import dash_core_components as dcc
 import dash_html_components as html
 import numpy as np
 import pandas as pd
-from dash.dependencies import Input, Output
+from dash.dependencies import Input
+
+# Sends each figure as a patch against the one the browser already has,
+# applied by the `deltas.figure` clientside function in assets/deltas.js
+from tutorial.utils.figure_diff import FigureDeltas
 
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+figure_deltas = FigureDeltas(app)
 
 np.random.seed(0)
 df = pd.DataFrame({
@@ -30,7 +35,10 @@ app.layout = html.Div([
         dcc.Graph(
             id='g3',
             config={'displayModeBar': False}
-        ), className='four columns')
+        ), className='four columns'),
+    figure_deltas.store('g1'),
+    figure_deltas.store('g2'),
+    figure_deltas.store('g3')
 ], className='row')
 
 
@@ -126,25 +134,26 @@ def highlight(x, y):
 
 
 
-# app.callback is a decorator which means that it takes a function
-# as its argument.
+# figure_deltas.callback is a decorator which means that it takes a function
+# as its argument. Like app.callback, but it outputs the figure of a graph
+# through its stores.
 # highlight is a function "generator": it's a function that returns function
-app.callback(
-    Output('g1', 'figure'),
+figure_deltas.callback(
+    'g1',
     [Input('g1', 'selectedData'),
      Input('g2', 'selectedData'),
      Input('g3', 'selectedData')]
 )(highlight('Column 0', 'Column 1'))
 
-app.callback(
-    Output('g2', 'figure'),
+figure_deltas.callback(
+    'g2',
     [Input('g2', 'selectedData'),
      Input('g1', 'selectedData'),
      Input('g3', 'selectedData')]
 )(highlight('Column 2', 'Column 3'))
 
-app.callback(
-    Output('g3', 'figure'),
+figure_deltas.callback(
+    'g3',
     [Input('g3', 'selectedData'),
      Input('g1', 'selectedData'),
      Input('g2', 'selectedData')]
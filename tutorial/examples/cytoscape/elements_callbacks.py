@@ -1,9 +1,17 @@
+import threading
+
 import dash
 import dash_cytoscape as cyto
 import dash_html_components as html
 import dash_core_components as dcc
 from pprint import pprint
-from dash.dependencies import Input, Output, State
+from dash.dependencies import ClientsideFunction, Input, Output, State
+
+# A versioned copy of the graph's elements kept on the server, see
+# `tutorial/utils/elements.py` in the Dash docs. The `deltas.elements`
+# clientside function of `assets/deltas.js` merges the changes it sends
+# into the graph: copy it into the `assets` folder of your app.
+from tutorial.utils.elements import ElementStore
 
 app = dash.Dash(__name__)
 
@@ -42,6 +50,13 @@ edges = [
 ]
 
 
+# The graph is shared by everyone viewing the app. It lives in the memory
+# of the server process: run the app in a single process, or each process
+# will have its own graph.
+graph = ElementStore(nodes + edges)
+graph_lock = threading.Lock()
+
+
 default_stylesheet = [
     {
         'selector': 'node',
@@ -70,32 +85,60 @@ app.layout = html.Div([
         layout={'name': 'circle'},
         stylesheet=default_stylesheet,
         style={'width': '100%', 'height': '450px'},
-        elements=edges+nodes
-    )
+        elements=graph.elements()
+    ),
+
+    # The version of the graph shown in this browser, and the changes that
+    # bring it up to date
+    dcc.Store(id='cytoscape-elements-version', data=graph.token()),
+    dcc.Store(id='cytoscape-elements-changes')
 ])
 
 
-@app.callback(Output('cytoscape-elements-callbacks', 'elements'),
+@app.callback(Output('cytoscape-elements-changes', 'data'),
               [Input('btn-add-node', 'n_clicks_timestamp'),
                Input('btn-remove-node', 'n_clicks_timestamp')],
-              [State('cytoscape-elements-callbacks', 'elements')])
-def update_elements(btn_add, btn_remove, elements):
-    # If the add button was clicked most recently
-    if int(btn_add) > int(btn_remove):
-        next_node_idx = len(elements) - len(edges)
-
-        # As long as we have not reached the max number of nodes, we add them
-        # to the cytoscape elements
-        if next_node_idx < len(nodes):
-            return edges + nodes[:next_node_idx+1]
-
-    # If the remove button was clicked most recently
-    elif int(btn_remove) > int(btn_add):
-        if len(elements) > len(edges):
-            return elements[:-1]
-
-    # Neither have been clicked yet (or fallback condition)
-    return elements
+              [State('cytoscape-elements-version', 'data')])
+def update_elements(btn_add, btn_remove, version):
+    with graph_lock:
+        shown = [node for node in nodes if node['data']['id'] in graph]
+
+        # If the add button was clicked most recently
+        if int(btn_add) > int(btn_remove):
+            # As long as we have not reached the max number of nodes, we add
+            # the next one and its edges to the nodes already shown
+            if len(shown) < len(nodes):
+                node = nodes[len(shown)]
+                ids = set(n['data']['id'] for n in shown + [node])
+                graph.add(node, *[
+                    edge for edge in edges
+                    if node['data']['id'] in (edge['data']['source'],
+                                              edge['data']['target']) and
+                    edge['data']['source'] in ids and
+                    edge['data']['target'] in ids
+                ])
+
+        # If the remove button was clicked most recently
+        elif int(btn_remove) > int(btn_add):
+            # Removing a node removes its edges too
+            if shown:
+                graph.remove(shown[-1]['data']['id'])
+
+    # Only send what changed since the version this browser has, including
+    # the changes made by other viewers, or all of the elements when that
+    # is no longer known
+    return graph.delta(version)
+
+
+# Merges the changes into the elements of the graph, in the browser
+app.clientside_callback(
+    ClientsideFunction('deltas', 'elements'),
+    [Output('cytoscape-elements-callbacks', 'elements'),
+     Output('cytoscape-elements-version', 'data')],
+    [Input('cytoscape-elements-changes', 'data')],
+    [State('cytoscape-elements-callbacks', 'elements'),
+     State('cytoscape-elements-version', 'data')]
+)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import itertools
 import math
 
 from Bio import Phylo
@@ -43,6 +44,11 @@ def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
 
     def add_to_elements(clade, clade_id):
         children = clade.clades
+        # Clades are numbered in the order they are visited, so the clades
+        # below this one are numbered from `order` up to (not including) the
+        # `end` that is taken once all of its children have been added.
+        order = next(counter)
+        clade_edges = []
 
         pos_x = col_positions[clade] * xlen
         pos_y = row_positions[clade] * ylen
@@ -80,7 +86,8 @@ def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
                 'data': {
                     'source': clade_id,
                     'target': support_id,
-                    'sourceCladeId': clade_id
+                    'sourceCladeId': clade_id,
+                    'cladeOrder': order
                 },
             }
 
@@ -89,7 +96,8 @@ def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
                     'source': support_id,
                     'target': child_id,
                     'length': clade.branch_length,
-                    'sourceCladeId': clade_id
+                    'sourceCladeId': clade_id,
+                    'cladeOrder': order
                 },
             }
 
@@ -97,15 +105,21 @@ def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
                 cy_source['data']['confidence'] = clade.confidence.value
 
             nodes.append(cy_support_node)
-            edges.extend([cy_support_edge, cy_edge])
+            clade_edges.extend([cy_support_edge, cy_edge])
 
             add_to_elements(child, child_id)
 
+        end = next(counter)
+        for cy_edge in clade_edges:
+            cy_edge['data']['cladeEnd'] = end
+        edges.extend(clade_edges)
+
     col_positions = get_col_positions(tree)
     row_positions = get_row_positions(tree)
 
     nodes = []
     edges = []
+    counter = itertools.count()
 
     add_to_elements(tree.clade, 'r')
 
@@ -176,13 +190,11 @@ def color_children(edgeData):
     if edgeData is None:
         return stylesheet
 
-    if 's' in edgeData['source']:
-        val = edgeData['source'].split('s')[0]
-    else:
-        val = edgeData['source']
-
+    # The edges below the hovered one belong to the clades numbered from
+    # its cladeOrder up to its cladeEnd
     children_style = [{
-        'selector': 'edge[source *= "{}"]'.format(val),
+        'selector': 'edge[cladeOrder >= {}][cladeOrder < {}]'.format(
+            edgeData['cladeOrder'], edgeData['cladeEnd']),
         'style': {
             'line-color': 'blue'
         }
@@ -1,14 +1,19 @@
 import math
 import dash
-from dash.dependencies import Input, Output
+from dash.dependencies import Input
 import dash_core_components as dcc
 import dash_html_components as html
 import pandas as pd
 
+# Sends each figure as a patch against the one the browser already has,
+# applied by the `deltas.figure` clientside function in assets/deltas.js
+from tutorial.utils.figure_diff import FigureDeltas
+
 
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+figure_deltas = FigureDeltas(app)
 
 # Get data
 df = pd.read_csv(
@@ -35,7 +40,9 @@ app.layout = html.Div([
             for i in years
         },
         value=1952, min=years[0], max=years[-1]
-    )
+    ),
+    figure_deltas.store('graph-left'),
+    figure_deltas.store('graph-right')
 ])
 
 
@@ -102,8 +109,8 @@ def create_figure(year, selectedData, hoverData, yaxis_column):
     }
 
 
-@app.callback(
-    Output('graph-left', 'figure'),
+@figure_deltas.callback(
+    'graph-left',
     [Input('year-slider', 'value'),
      Input('graph-right', 'selectedData'),
      Input('graph-right', 'hoverData')])
@@ -116,8 +123,8 @@ def filterScatterPlot(sliderValue, selectedData, hoverData):
     return figure
 
 
-@app.callback(
-    Output('graph-right', 'figure'),
+@figure_deltas.callback(
+    'graph-right',
     [Input('year-slider', 'value'),
      Input('graph-left', 'selectedData'),
      Input('graph-left', 'hoverData')])
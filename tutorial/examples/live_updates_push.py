@@ -0,0 +1,103 @@
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import ClientsideFunction, Input, Output, State
+
+# pip install pyorbital
+from pyorbital.orbital import Orbital
+
+# The shared ring buffer and its producer thread, and the server-sent
+# events stream that publishes its new samples, see `tutorial/utils/live.py`
+# and `tutorial/utils/push.py` in the Dash docs. The graph subscribes to
+# the stream with the `stream.subscribe` clientside function of
+# `assets/live-stream.js`: copy it into the `assets` folder of your app.
+from tutorial.utils.live import Producer, RingBuffer, producer
+from tutorial.utils.push import Broadcaster, add_stream_route, stream_producer
+
+satellite = Orbital('TERRA')
+
+N_SAMPLES = 180
+SAMPLE_PERIOD = 20  # seconds between the samples in the graph
+
+
+def sample(times):
+    # get_lonlatalt works on a whole array of timestamps at once
+    lon, lat, alt = satellite.get_lonlatalt(times.astype('datetime64[us]'))
+    return {'time': times, 'Longitude': lon, 'Latitude': lat, 'Altitude': alt}
+
+
+history = producer('terra-history', lambda: Producer(
+    RingBuffer(N_SAMPLES, {
+        'time': 'datetime64[ms]',
+        'Longitude': 'float64',
+        'Latitude': 'float64',
+        'Altitude': 'float64'
+    }),
+    sample,
+    SAMPLE_PERIOD
+))
+
+external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
+
+app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+
+# Every new sample is serialized once and sent to all of the subscribed
+# browsers. A browser that reconnects gets the samples it missed, a new one
+# the whole buffer.
+broadcaster = Broadcaster()
+catch_up = stream_producer(history, broadcaster, [
+    {'x': 'time', 'y': 'Altitude'},
+    {'x': 'Longitude', 'y': 'Latitude', 'text': 'time'}
+], N_SAMPLES)
+add_stream_route(app.server, '/_stream/terra', broadcaster, catch_up)
+
+app.layout = html.Div([
+    html.H4('TERRA Satellite Live Feed'),
+    dcc.Graph(
+        id='live-stream-graph',
+        figure={
+            'data': [{
+                'x': [],
+                'y': [],
+                'text': [],
+                'name': 'Altitude',
+                'mode': 'lines+markers',
+                'type': 'scatter'
+            }, {
+                'x': [],
+                'y': [],
+                'text': [],
+                'name': 'Longitude vs Latitude',
+                'mode': 'lines+markers',
+                'type': 'scatter',
+                'xaxis': 'x2',
+                'yaxis': 'y2'
+            }],
+            'layout': {
+                'xaxis': {'anchor': 'y'},
+                'yaxis': {'domain': [0.6, 1], 'anchor': 'x'},
+                'xaxis2': {'anchor': 'y2'},
+                'yaxis2': {'domain': [0, 0.4], 'anchor': 'x2'},
+                'margin': {'l': 30, 'r': 10, 'b': 30, 't': 10},
+                'legend': {'x': 0, 'y': 1, 'xanchor': 'left'}
+            }
+        }
+    ),
+    dcc.Store(id='live-stream-url', data='/_stream/terra'),
+    html.Div(id='live-stream-subscription', style={'display': 'none'})
+])
+
+# Runs in the browser once the page is loaded: the graph is then extended
+# by the events of the stream, without any further requests.
+app.clientside_callback(
+    ClientsideFunction('stream', 'subscribe'),
+    Output('live-stream-subscription', 'children'),
+    [Input('live-stream-url', 'data')],
+    [State('live-stream-graph', 'id')]
+)
+
+
+if __name__ == '__main__':
+    # each subscriber keeps a connection open, so in production serve the
+    # app with an asynchronous worker, e.g. `gunicorn -k gevent app:server`
+    app.run_server(debug=True, threaded=True)
@@ -0,0 +1,128 @@
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+# pip install pyorbital
+from pyorbital.orbital import Orbital
+
+# A ring buffer filled by a single background thread, shared by every
+# viewer of the app, see `tutorial/utils/live.py` in the Dash docs
+from tutorial.utils.live import Producer, RingBuffer, extend_data, producer
+
+satellite = Orbital('TERRA')
+
+N_SAMPLES = 180
+SAMPLE_PERIOD = 20  # seconds between the samples in the graph
+COLUMNS = {
+    'time': 'datetime64[ms]',
+    'Longitude': 'float64',
+    'Latitude': 'float64',
+    'Altitude': 'float64'
+}
+
+
+def sample(times):
+    # get_lonlatalt works on a whole array of timestamps at once
+    lon, lat, alt = satellite.get_lonlatalt(times.astype('datetime64[us]'))
+    return {'time': times, 'Longitude': lon, 'Latitude': lat, 'Altitude': alt}
+
+
+# The satellite's positions are shared by everyone viewing the app.
+# One background thread per buffer computes them into fixed-size NumPy
+# arrays and the callbacks only read from them, so the work done per
+# viewer on each interval doesn't depend on the history length.
+history = producer('terra-history', lambda: Producer(
+    RingBuffer(N_SAMPLES, COLUMNS), sample, SAMPLE_PERIOD))
+current = producer('terra-current', lambda: Producer(
+    RingBuffer(1, COLUMNS), sample, 1, backfill=False))
+
+external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
+
+app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
+app.layout = html.Div(
+    html.Div([
+        html.H4('TERRA Satellite Live Feed'),
+        html.Div(id='live-update-text'),
+        dcc.Graph(
+            id='live-update-graph',
+            figure={
+                # every trace that `extendData` extends needs each of
+                # its attributes, `text` included
+                'data': [{
+                    'x': [],
+                    'y': [],
+                    'text': [],
+                    'name': 'Altitude',
+                    'mode': 'lines+markers',
+                    'type': 'scatter'
+                }, {
+                    'x': [],
+                    'y': [],
+                    'text': [],
+                    'name': 'Longitude vs Latitude',
+                    'mode': 'lines+markers',
+                    'type': 'scatter',
+                    'xaxis': 'x2',
+                    'yaxis': 'y2'
+                }],
+                # two subplots, stacked vertically
+                'layout': {
+                    'xaxis': {'anchor': 'y'},
+                    'yaxis': {'domain': [0.6, 1], 'anchor': 'x'},
+                    'xaxis2': {'anchor': 'y2'},
+                    'yaxis2': {'domain': [0, 0.4], 'anchor': 'x2'},
+                    'margin': {'l': 30, 'r': 10, 'b': 30, 't': 10},
+                    'legend': {'x': 0, 'y': 1, 'xanchor': 'left'}
+                }
+            }
+        ),
+        # the sequence number of the last sample sent to this client
+        dcc.Store(id='last-sequence', data=0),
+        dcc.Interval(
+            id='interval-component',
+            interval=1*1000,  # in milliseconds
+            n_intervals=0
+        )
+    ])
+)
+
+
+@app.callback(Output('live-update-text', 'children'),
+              [Input('interval-component', 'n_intervals')])
+def update_metrics(n):
+    sequence, data = current.buffer.snapshot()
+    if sequence == 0:
+        raise PreventUpdate
+    style = {'padding': '5px', 'fontSize': '16px'}
+    return [
+        html.Span('Longitude: {0:.2f}'.format(data['Longitude'][0]),
+                  style=style),
+        html.Span('Latitude: {0:.2f}'.format(data['Latitude'][0]),
+                  style=style),
+        html.Span('Altitude: {0:0.2f}'.format(data['Altitude'][0]),
+                  style=style)
+    ]
+
+
+# Multiple components can update everytime interval gets fired.
+# Rather than redrawing the whole figure, only the samples that this client
+# hasn't seen yet are appended to the traces with `extendData`, and the
+# traces are trimmed to the last N_SAMPLES points.
+@app.callback([Output('live-update-graph', 'extendData'),
+               Output('last-sequence', 'data')],
+              [Input('interval-component', 'n_intervals')],
+              [State('last-sequence', 'data')])
+def update_graph_live(n, last_sequence):
+    sequence, value = extend_data(history.buffer, last_sequence or 0, [
+        {'x': 'time', 'y': 'Altitude'},
+        {'x': 'Longitude', 'y': 'Latitude', 'text': 'time'}
+    ], N_SAMPLES)
+    if value is None:
+        raise PreventUpdate
+    return value, sequence
+
+
+if __name__ == '__main__':
+    app.run_server(debug=True)
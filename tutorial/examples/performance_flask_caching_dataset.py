@@ -8,19 +8,23 @@ import dash_html_components as html
 import numpy as np
 import pandas as pd
 from dash.dependencies import Input, Output
-from flask_caching import Cache
+
+# Caches the dataset in files that every server process can read, see
+# `tutorial/utils/session_store.py` in the Dash docs
+from tutorial.utils.session_store import FileSystemBackend, SessionDatasetStore
 
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
-cache = Cache(app.server, config={
-    'CACHE_TYPE': 'filesystem',
-    'CACHE_DIR': 'cache-directory'
-})
 
 TIMEOUT = 60
 
-@cache.memoize(timeout=TIMEOUT)
+store = SessionDatasetStore(
+    FileSystemBackend('cache-directory'),
+    timeout=TIMEOUT
+)
+
+
 def query_data():
     # This could be an expensive data querying step
     df =  pd.DataFrame(
@@ -29,11 +33,14 @@ def query_data():
     )
     now = dt.datetime.now()
     df['time'] = [now - dt.timedelta(seconds=5*i) for i in range(100)]
-    return df.to_json(date_format='iso', orient='split')
+    # The store saves the DataFrame in a binary format; no need to
+    # convert it to JSON
+    return df
 
 
 def dataframe():
-    return pd.read_json(query_data(), orient='split')
+    # One dataset shared by all of the users of the app
+    return store.get('global', 'dataset', query_data)
 
 app.layout = html.Div([
     html.Div('Data was updated within the last {} seconds'.format(TIMEOUT)),
@@ -3,12 +3,15 @@ from dash.dependencies import Input, Output
 import dash_core_components as dcc
 import dash_html_components as html
 import datetime
-from flask_caching import Cache
 import os
 import pandas as pd
 import time
 import uuid
 
+# Caches a DataFrame per session in files that every server process can
+# read, see `tutorial/utils/session_store.py` in the Dash docs
+from tutorial.utils.session_store import FileSystemBackend, SessionDatasetStore
+
 external_stylesheets = [
     # Dash CSS
     'https://codepen.io/chriddyp/pen/bWLwgP.css',
@@ -16,22 +19,19 @@ external_stylesheets = [
     'https://codepen.io/chriddyp/pen/brPBPO.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
-cache = Cache(app.server, config={
-    'CACHE_TYPE': 'redis',
-    # Note that filesystem cache doesn't work on systems with ephemeral
+store = SessionDatasetStore(
+    # Note that filesystem storage doesn't work on systems with ephemeral
     # filesystems like Heroku.
-    'CACHE_TYPE': 'filesystem',
-    'CACHE_DIR': 'cache-directory',
+    FileSystemBackend('cache-directory'),
 
     # should be equal to maximum number of users on the app at a single time
-    # higher numbers will store more data in the filesystem / redis cache
-    'CACHE_THRESHOLD': 200
-})
+    # higher numbers will store more data in the filesystem
+    max_entries=200
+)
 
 
 def get_dataframe(session_id):
-    @cache.memoize()
-    def query_and_serialize_data(session_id):
+    def query_data():
         # expensive or user/session-unique data processing step goes here
 
         # simulate a user/session-unique data processing step by generating
@@ -50,9 +50,11 @@ def get_dataframe(session_id):
             ],
             'values': ['a', 'b', 'a', 'c']
         })
-        return df.to_json()
+        # The store saves the DataFrame in a binary format that is mapped
+        # back into memory, much faster than parsing JSON on every callback
+        return df
 
-    return pd.read_json(query_and_serialize_data(session_id))
+    return store.get(session_id, 'df', query_data)
 
 
 def serve_layout():
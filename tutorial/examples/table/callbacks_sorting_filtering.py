@@ -3,10 +3,17 @@ from dash.dependencies import Input, Output
 import dash_table
 import pandas as pd
 
+# The filter expression parser of the Dash docs: copy
+# `tutorial/utils/filter_expressions.py` into your project to use it
+from tutorial.utils.filter_expressions import FilterError, filter_frame
+
 
 app = dash.Dash(__name__)
 
-df = pd.read_csv('https://raw.githubusercontent.com/plotly/datasets/master/gapminder2007.csv')
+df = pd.read_csv(
+    'https://raw.githubusercontent.com/plotly/datasets/master/'
+    'gapminder2007.csv'
+)
 
 PAGE_SIZE = 5
 
@@ -29,27 +36,20 @@ app.layout = dash_table.DataTable(
     sorting_settings=[]
 )
 
+
 @app.callback(
     Output('table-sorting-filtering', 'data'),
     [Input('table-sorting-filtering', 'pagination_settings'),
      Input('table-sorting-filtering', 'sorting_settings'),
      Input('table-sorting-filtering', 'filtering_settings')])
 def update_graph(pagination_settings, sorting_settings, filtering_settings):
-    filtering_expressions = filtering_settings.split(' && ')
-    dff = df
-    for filter in filtering_expressions:
-        if ' eq ' in filter:
-            col_name = filter.split(' eq ')[0]
-            filter_value = filter.split(' eq ')[1]
-            dff = dff.loc[dff[col_name] == filter_value]
-        if ' > ' in filter:
-            col_name = filter.split(' > ')[0]
-            filter_value = float(filter.split(' > ')[1])
-            dff = dff.loc[dff[col_name] > filter_value]
-        if ' < ' in filter:
-            col_name = filter.split(' < ')[0]
-            filter_value = float(filter.split(' < ')[1])
-            dff = dff.loc[dff[col_name] < filter_value]
+    try:
+        # `filtering_settings` is parsed once, then run as one vectorized
+        # operation per column
+        dff = filter_frame(df, filtering_settings)
+    except FilterError:
+        # e.g. text in a numeric column: show every row until it's fixed
+        dff = df
 
     if len(sorting_settings):
         dff = dff.sort_values(
@@ -62,8 +62,10 @@ def update_graph(pagination_settings, sorting_settings, filtering_settings):
         )
 
     return dff.iloc[
-        pagination_settings['current_page']*pagination_settings['page_size']:
-        (pagination_settings['current_page'] + 1)*pagination_settings['page_size']
+        pagination_settings['current_page'] *
+        pagination_settings['page_size']:
+        (pagination_settings['current_page'] + 1) *
+        pagination_settings['page_size']
     ].to_dict('records')
 
 
@@ -1,6 +1,3 @@
-import base64
-import datetime
-import io
 import dash
 from dash.dependencies import Input, Output, State
 import dash_core_components as dcc
@@ -8,6 +5,10 @@ import dash_html_components as html
 import dash_table
 import pandas as pd
 
+# Decodes uploads a chunk at a time and reads them with chunked, typed
+# parsers, see `tutorial/utils/uploads.py` in the Dash docs
+from tutorial.utils.uploads import read_upload
+
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
@@ -30,25 +31,13 @@ app.layout = html.Div([
 ])
 
 
-def parse_contents(contents, filename):
-    content_type, content_string = contents.split(',')
-    decoded = base64.b64decode(content_string)
-    if 'csv' in filename:
-        # Assume that the user uploaded a CSV file
-        return pd.read_csv(
-            io.StringIO(decoded.decode('utf-8')))
-    elif 'xls' in filename:
-        # Assume that the user uploaded an excel file
-        return pd.read_excel(io.BytesIO(decoded))
-
-
 @app.callback(Output('datatable-upload-container', 'data'),
               [Input('datatable-upload', 'contents')],
               [State('datatable-upload', 'filename')])
 def update_output(contents, filename):
     if contents is None:
         return [{}]
-    df = parse_contents(contents, filename)
+    df = read_upload(contents, filename)
     return df.to_dict('records')
 
 
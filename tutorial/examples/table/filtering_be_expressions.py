@@ -0,0 +1,53 @@
+import dash
+from dash.dependencies import Input, Output
+import dash_core_components as dcc
+import dash_html_components as html
+import dash_table
+import pandas as pd
+
+# The filter expression parser of the Dash docs: copy
+# `tutorial/utils/filter_expressions.py` into your project to use it
+from tutorial.utils.filter_expressions import FilterError, filter_frame
+
+
+app = dash.Dash(__name__)
+
+df = pd.read_csv(
+    'https://raw.githubusercontent.com/plotly/datasets/master/'
+    'gapminder2007.csv'
+)
+
+
+app.layout = html.Div([
+    dcc.Input(
+        id='filter-expression-input',
+        value='"continent" in (Asia, Europe) && "lifeExp" between 60 and 70',
+        style={'width': '100%'}
+    ),
+    html.Div(id='filter-expression-error', style={'color': 'red'}),
+    dash_table.DataTable(
+        id='filter-expression-table',
+        columns=[
+            {"name": i, "id": i} for i in sorted(df.columns)
+        ],
+        style_table={'maxHeight': '300px', 'overflowY': 'scroll'}
+    )
+])
+
+
+@app.callback(
+    [Output('filter-expression-table', 'data'),
+     Output('filter-expression-error', 'children')],
+    [Input('filter-expression-input', 'value')])
+def update_table(expression):
+    try:
+        # Each expression is parsed once, then run as one vectorized
+        # operation per comparison
+        dff = filter_frame(df, expression)
+    except FilterError as e:
+        return [], str(e)
+    return dff.to_dict('records'), ''
+
+
+if __name__ == '__main__':
+    app.run_server(debug=True)
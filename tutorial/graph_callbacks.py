@@ -55,6 +55,11 @@ Here's a simple example.
 
 In this example, we use the `customdata` property to add extra
 metadata for the points that we've hovered over or selected.
+
+Hovering only changes the opacity of a few points, so the graphs are
+updated through `FigureDeltas`, from `tutorial/utils/figure_diff.py` in
+the Dash docs: the server sends the changes to the figure, and the
+clientside callback in `assets/deltas.js` applies them.
 '''),
 
     dcc.SyntaxHighlighter(examples[1][0], customStyle=styles.code_container),
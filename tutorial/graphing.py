@@ -102,6 +102,13 @@ layout = html.Div([
     of the selected points and the graphs are replotted with the selected
     points highlighted and the selected region drawn as a dashed rectangle.
 
+    Most of each figure stays the same from one selection to the next, so
+    the callbacks go through `FigureDeltas`, from
+    `tutorial/utils/figure_diff.py` in the Dash docs: the server sends
+    only the parts of the figure that changed, and a clientside callback,
+    in `assets/deltas.js`, applies them to the graph. Copy both files into
+    your project to run this example.
+
     > As an aside, if you find yourself filtering and visualizing
     highly-dimensional datasets, you should consider checking out the
     [parallel coordinates](https://plot.ly/python/parallel-coordinates-plot/)
@@ -1,5 +1,11 @@
 import dash_core_components as dcc
 
+examples = {
+    'live-updates-satellite': open(
+        'tutorial/examples/live_updates_satellite.py').read(),
+    'live-updates-push': open(
+        'tutorial/examples/live_updates_push.py').read()
+}
 
 layout = [dcc.Markdown('''
 # Live Updating Components
@@ -20,101 +26,45 @@ the callback on a predefined interval.
 
 This example pulls data from live satellite feeds and updates the graph
 and the text every second.
+
+The satellite data is computed by a single background thread into a
+fixed-size buffer that is shared by every viewer (the `RingBuffer` and
+`Producer` of `tutorial/utils/live.py` in these docs). The callbacks only
+read from that buffer, so each additional viewer doesn't multiply the work.
+Instead of sending the whole figure on every interval, the graph callback
+uses the `extendData` property to append just the new samples, keeping
+track of what each client has already received in a `dcc.Store`.
 '''),
-    dcc.SyntaxHighlighter('''import datetime
+    dcc.SyntaxHighlighter(
+        examples['live-updates-satellite'],
+        language='python',
+        customStyle={'borderLeft': 'thin solid lightgrey'}
+    ),
 
-import dash
-import dash_core_components as dcc
-import dash_html_components as html
-import plotly
-from dash.dependencies import Input, Output
-
-# pip install pyorbital
-from pyorbital.orbital import Orbital
-satellite = Orbital('TERRA')
-
-external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
-
-app = dash.Dash(__name__, external_stylesheets=external_stylesheets)
-app.layout = html.Div(
-    html.Div([
-        html.H4('TERRA Satellite Live Feed'),
-        html.Div(id='live-update-text'),
-        dcc.Graph(id='live-update-graph'),
-        dcc.Interval(
-            id='interval-component',
-            interval=1*1000, # in milliseconds
-            n_intervals=0
-        )
-    ])
-)
-
-
-@app.callback(Output('live-update-text', 'children'),
-              [Input('interval-component', 'n_intervals')])
-def update_metrics(n):
-    lon, lat, alt = satellite.get_lonlatalt(datetime.datetime.now())
-    style = {'padding': '5px', 'fontSize': '16px'}
-    return [
-        html.Span('Longitude: {0:.2f}'.format(lon), style=style),
-        html.Span('Latitude: {0:.2f}'.format(lat), style=style),
-        html.Span('Altitude: {0:0.2f}'.format(alt), style=style)
-    ]
-
-
-# Multiple components can update everytime interval gets fired.
-@app.callback(Output('live-update-graph', 'figure'),
-              [Input('interval-component', 'n_intervals')])
-def update_graph_live(n):
-    satellite = Orbital('TERRA')
-    data = {
-        'time': [],
-        'Latitude': [],
-        'Longitude': [],
-        'Altitude': []
-    }
-
-    # Collect some data
-    for i in range(180):
-        time = datetime.datetime.now() - datetime.timedelta(seconds=i*20)
-        lon, lat, alt = satellite.get_lonlatalt(
-            time
-        )
-        data['Longitude'].append(lon)
-        data['Latitude'].append(lat)
-        data['Altitude'].append(alt)
-        data['time'].append(time)
-
-    # Create the graph with subplots
-    fig = plotly.tools.make_subplots(rows=2, cols=1, vertical_spacing=0.2)
-    fig['layout']['margin'] = {
-        'l': 30, 'r': 10, 'b': 30, 't': 10
-    }
-    fig['layout']['legend'] = {'x': 0, 'y': 1, 'xanchor': 'left'}
-
-    fig.append_trace({
-        'x': data['time'],
-        'y': data['Altitude'],
-        'name': 'Altitude',
-        'mode': 'lines+markers',
-        'type': 'scatter'
-    }, 1, 1)
-    fig.append_trace({
-        'x': data['Longitude'],
-        'y': data['Latitude'],
-        'text': data['time'],
-        'name': 'Longitude vs Latitude',
-        'mode': 'lines+markers',
-        'type': 'scatter'
-    }, 2, 1)
-
-    return fig
+dcc.Markdown('''
 
+***
 
-if __name__ == '__main__':
-    app.run_server(debug=True)
+## Pushing Updates with Server-Sent Events
 
-''',
+With `dcc.Interval`, every viewer sends a request on every interval, even
+when there is nothing new. When the data arrives at its own pace, the
+server can push it to the browsers instead, with
+[Server-Sent Events](https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events).
+
+This version of the satellite example publishes every new sample once to
+all of the subscribed browsers, through a stream registered with
+`add_stream_route` (`tutorial/utils/push.py` in these docs). A clientside
+callback subscribes the graph to the stream when the page is loaded and
+appends each sample with `Plotly.extendTraces`, so idle viewers make no
+requests at all. A browser that loses its connection reconnects on its own
+and receives the samples it missed.
+
+Each subscriber keeps a connection open, so serve apps like this one with
+an asynchronous worker, for example `gunicorn -k gevent app:server`.
+'''),
+    dcc.SyntaxHighlighter(
+        examples['live-updates-push'],
         language='python',
         customStyle={'borderLeft': 'thin solid lightgrey'}
     ),
@@ -72,7 +72,10 @@ Here is an example of `Flask-Caching` with Redis:
 ***
 
 Here is an example that **caches a dataset** instead of a callback.
-It uses the FileSystem cache, saving the cached results to the filesystem.
+It saves the dataset to the filesystem with the `SessionDatasetStore` of
+these docs (`tutorial/utils/session_store.py`), in a binary format that is
+mapped back into memory on every read instead of being parsed again, and
+computes it again after `TIMEOUT` seconds.
 
 This approach works well if there is one dataset that is used to update
 several callbacks.
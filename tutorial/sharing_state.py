@@ -510,10 +510,15 @@ def update_output_1(value):
         [Dash Community Forum thread](https://community.plot.ly/t/capture-window-tab-closing-event/7375/2?u=chriddyp).
 
         This example:
-        - Caches data using the `flask_caching` filesystem cache. You can also save to an in-memory database like Redis.
-        - Serializes the data as JSON.
-            - If you are using Pandas, consider serializing
-            with Apache Arrow. [Community thread](https://community.plot.ly/t/fast-way-to-share-data-between-callbacks/8024/2)
+        - Caches data on the filesystem with the `SessionDatasetStore` of
+        these docs (`tutorial/utils/session_store.py`), so that every
+        process of the server can read it.
+        - Caches the DataFrame itself, in the Apache Arrow format when
+        `pyarrow` is installed and as a pickle otherwise. The file is mapped
+        back into memory, which is much faster than parsing JSON on every
+        callback. [Community thread](https://community.plot.ly/t/fast-way-to-share-data-between-callbacks/8024/2)
+        - Computes the data of a session once, even when several callbacks
+        ask for it at the same time.
         - Saves session data up to the number of expected concurrent users.
         This prevents the cache from being overfilled with data.
         - Creates unique session IDs by embedding a hidden random string into
@@ -110,6 +110,10 @@ layout = html.Div([
     with two columns of data and we'll plot it.
     Try it out by [downloading this file](https://raw.githubusercontent.com/plotly/datasets/master/2014_apple_stock.csv)
     and then uploading it.
+
+    The upload is parsed with `read_upload` from
+    `tutorial/utils/uploads.py` in the Dash docs, which decodes it a chunk
+    at a time instead of holding several copies of the file in memory.
     '''
     )),
 
@@ -12,7 +12,8 @@ from tutorial import styles
 
 examples = {
     example: tools.load_example('tutorial/examples/table/{}'.format(example))
-    for example in ['filtering_fe.py', 'filtering_be.py']
+    for example in ['filtering_fe.py', 'filtering_be.py',
+                    'filtering_be_expressions.py']
 }
 
 layout = html.Div(
@@ -33,7 +34,8 @@ layout = html.Div(
         > Note that we plan on improving
         > the simplicity and consistency of
         > this syntax in the near future.
-        > Follow [dash-table#169](https://github.com/plotly/dash-table/issues/169)
+        > Follow
+        > [dash-table#169](https://github.com/plotly/dash-table/issues/169)
         > for updates.
 
         ## Frontend Filtering
@@ -44,7 +46,8 @@ layout = html.Div(
         - Numerical values must be wrapped in num(): `> num(500)`
 
         > Note that at this time, frontend filtering must be connected to a
-        > callback in order to work. See [dash-table#202](https://github.com/plotly/dash-table/issues/202)
+        > callback in order to work. See
+        > [dash-table#202](https://github.com/plotly/dash-table/issues/202)
         > for progress on this issue.
 
         In the example below:
@@ -73,16 +76,21 @@ layout = html.Div(
 
         For large dataframes, you can perform the filtering in Python instead
         of the default clientside filtering. You can find more information on
-        performing operations in python in the [Python Callbacks chapter](/datatable/callbacks).
+        performing operations in python in the
+        [Python Callbacks chapter](/datatable/callbacks).
 
         As mentioned above, the backend filtering syntax currently differs
         slightly from the frontend syntax.
 
-        BAckend filtering supports equals: `eq`, greater than: `>`, and less
-        than: `<` operations.
+        The backend filtering below supports equals: `eq`, not equals: `ne`,
+        greater than: `>` and `>=`, and less than: `<` and `<=` operations.
         - No quotes necessary for text: `eq Asia`
+        - Quotes for text with spaces: `eq "United States"`
         - Numerical values accepted: `> 500`
 
+        The example uses `filter_frame` from the filter expression parser
+        described in the next section.
+
         In the example below:
         - Enter `eq Asia` in the "continent" column
         - Enter `> 5000` in the "gdpPercap" column
@@ -100,5 +108,36 @@ layout = html.Div(
             examples['filtering_be.py'][1],
             className='example-container'
         ),
+
+        dcc.Markdown(dedent(
+        """
+        ## Filter Expressions
+
+        The docs include a more complete parser for these expressions,
+        `tutorial/utils/filter_expressions.py`. It supports `eq`, `ne`,
+        `gt`, `ge`, `lt`, `le`, `contains`, `in (a, b, ...)` and
+        `between low and high`, combined with `&&`, `||`, `!` and
+        parentheses. For example:
+        `"continent" in (Asia, Europe) && "lifeExp" between 60 and 70`.
+
+        `filter_frame(df, expression)` parses each expression once and runs
+        it as one vectorized pandas operation per comparison. It raises a
+        `FilterError` for unknown columns and for values that don't fit
+        their column, e.g. text compared with a numeric column.
+
+        Edit the expression below to filter the table:
+        """
+        )),
+
+        dcc.SyntaxHighlighter(
+            examples['filtering_be_expressions.py'][0],
+            language='python',
+            customStyle=styles.code_container
+        ),
+
+        html.Div(
+            examples['filtering_be_expressions.py'][1],
+            className='example-container'
+        ),
     ]
 )
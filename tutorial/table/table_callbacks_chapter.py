@@ -108,15 +108,23 @@ layout = html.Div([
     write your own expression query language.
 
     In this example, we've written a Pandas backend for the filtering
-    language. It supports `eq`, `<`, and `>`. For example, try:
+    language. The table writes the filter of each column as
+    `"column" operator value` and joins them with ` && `. `filter_frame`,
+    from the filter expression parser of the docs
+    (`tutorial/utils/filter_expressions.py`), parses these expressions
+    once and runs them as a single boolean mask. It supports `eq`, `ne`,
+    `<`, `<=`, `>` and `>=` (or `=`, `!=`, `lt`, `le`, `gt` and `ge`).
+    For example, try:
 
     - Enter `eq Asia` in the "continent" column
     - Enter `> 5000` in the "gdpPercap" column
     - Enter `< 80` in the `lifeExp` column
+    - Enter `eq "United States"` in the "country" column
 
-    > Note that unlike the front-end filtering, our backend filtering
-    > expression language doesn't require or support `num()` or wrapping
-    > items in double quotes (`"`).
+    > Values are compared as numbers in numeric columns and as text
+    > otherwise. Wrap values that contain spaces in double quotes (`"`).
+    > A filter that doesn't fit its column, like text in a numeric
+    > column, is ignored until it is fixed.
     > We will improve this syntax in the future,
     > follow [dash-table#169](https://github.com/plotly/dash-table/issues/169)
     > for more.
@@ -1,9 +1,15 @@
-from server import app
+from server import app, callback_registry
+from tutorial.utils.deferred import DeferredSections
+
+# Collapsed sections whose contents are sent when they are first opened
+deferred_sections = DeferredSections(app)
+DeferredDetails = deferred_sections.details
+
 
 def exception_handler(func):
-    def wrapper(path):
+    def wrapper(path, *args, **kwargs):
         try:
-            return func(path)
+            return func(path, *args, **kwargs)
         except Exception as e:
             print('\nError running {}\n{}'.format(
                 path,
@@ -15,11 +21,18 @@ def exception_handler(func):
 
 
 @exception_handler
-def load_example(path):
+def load_example(path, substitutions=None):
+    # `substitutions` maps code of the example to what the docs app runs
+    # instead; the source shown to readers is left as it is
     with open(path, 'r') as _f:
         _source = _f.read()
         _example = _source
 
+        for old, new in (substitutions or {}).items():
+            if old not in _example:
+                raise Exception('{!r} not found'.format(old))
+            _example = _example.replace(old, new)
+
         # Use the global app assignment
         if 'app = dash.Dash' not in _example and 'app = CustomDash()' not in _example:
             raise Exception("Didn't declare app")
@@ -52,7 +65,8 @@ def load_example(path):
         )
 
         scope = {'app': app}
-        exec(_example, scope)
+        with callback_registry.registering(path):
+            exec(_example, scope)
 
     return (
         _source,
@@ -0,0 +1,153 @@
+import contextlib
+import json
+from collections import OrderedDict
+
+import flask
+from dash.dash import _create_callback_id
+from dash.exceptions import DuplicateCallbackOutput
+
+DEPENDENCIES_PATH = '_dash-dependencies'
+
+
+def _dependency_ids(output, inputs, state):
+    outputs = output if isinstance(output, (list, tuple)) else [output]
+    return set(c.component_id for c in list(outputs) + inputs + state)
+
+
+class CallbackRegistry(object):
+    '''
+    Takes over `app.callback` and `app.clientside_callback` to keep track
+    of where each callback comes from: the example that
+    `tutorial.tools.load_example` is running (see `registering`), or else
+    the module of the callback function. These owners are the namespaces
+    of the callbacks, in `owners`.
+
+    - Registering the same callback again from the same owner, e.g. an
+      example loaded by two chapters, is skipped instead of failing.
+    - Another owner registering an output that is already taken raises
+      `DuplicateCallbackOutput`, naming both owners.
+    - Component ids that the callbacks of several owners use are listed
+      in `conflicts`: those examples can't be on the same page.
+
+    The `_dash-dependencies` response is serialized once for each set of
+    callbacks and cached, as are the subsets from `dependencies_json`.
+    '''
+
+    def __init__(self, app):
+        self.app = app
+        # callback id -> (owner, function name, inputs, state)
+        self.callbacks = OrderedDict()
+        self.skipped = []
+        self._dash_callback = app.callback
+        self._dash_clientside_callback = app.clientside_callback
+        self._owner = []
+        self._id_owners = {}
+        self._component_ids = {}
+        self._json = {}
+        app.callback = self.callback
+        app.clientside_callback = self.clientside_callback
+        app.server.view_functions['/' + DEPENDENCIES_PATH] = \
+            self.serve_dependencies
+
+    @contextlib.contextmanager
+    def registering(self, owner):
+        '''Attribute the callbacks registered in this block to `owner`.'''
+        self._owner.append(owner)
+        try:
+            yield
+        finally:
+            self._owner.pop()
+
+    def callback(self, output, inputs=[], state=[]):
+        def wrap_func(func):
+            return self._register(
+                func.__name__, output, inputs, state,
+                lambda: self._dash_callback(output, inputs, state)(func),
+                func.__module__, func)
+        return wrap_func
+
+    def clientside_callback(self, clientside_function, output, inputs=[],
+                            state=[]):
+        self._register(
+            '{}.{}'.format(clientside_function.namespace,
+                           clientside_function.function_name),
+            output, inputs, state,
+            lambda: self._dash_clientside_callback(
+                clientside_function, output, inputs, state))
+
+    def _register(self, name, output, inputs, state, register, module=None,
+                  func=None):
+        # `register` adds the callback to the app; `func` is returned when
+        # the same callback was already registered
+        callback_id = _create_callback_id(output)
+        owner = self._owner[-1] if self._owner else module
+        entry = (owner, name) + (
+            [(c.component_id, c.component_property) for c in inputs],
+            [(c.component_id, c.component_property) for c in state]
+        )
+        registered = self.callbacks.get(callback_id)
+        if registered == entry:
+            self.skipped.append(callback_id)
+            return func
+        if registered is not None:
+            raise DuplicateCallbackOutput(
+                'The output {} of {} in {} is already the output of '
+                '{} in {}.'.format(callback_id, entry[1], entry[0],
+                                   registered[1], registered[0]))
+
+        wrapped = register()
+        self.callbacks[callback_id] = entry
+        self._component_ids[callback_id] = _dependency_ids(
+            output, inputs, state)
+        for component_id in self._component_ids[callback_id]:
+            self._id_owners.setdefault(
+                component_id, OrderedDict())[entry[0]] = True
+        self._json.clear()
+        return wrapped
+
+    @property
+    def owners(self):
+        '''Callback ids by owner.'''
+        owners = OrderedDict()
+        for callback_id, entry in self.callbacks.items():
+            owners.setdefault(entry[0], []).append(callback_id)
+        return owners
+
+    def component_ids(self, callback_id):
+        '''The ids of the components of a callback's outputs and inputs.'''
+        return self._component_ids[callback_id]
+
+    @property
+    def conflicts(self):
+        '''Owners by component id, for ids used by several owners.'''
+        return dict(
+            (component_id, list(owners))
+            for component_id, owners in self._id_owners.items()
+            if len(owners) > 1
+        )
+
+    def dependencies_json(self, callback_ids=None):
+        '''
+        The `_dash-dependencies` response for `callback_ids`, all the
+        callbacks by default.
+        '''
+        key = None if callback_ids is None else frozenset(callback_ids)
+        cached = self._json.get(key)
+        if cached is None:
+            callback_map = self.app.callback_map
+            cached = self._json[key] = json.dumps([
+                {
+                    'output': callback_id,
+                    'inputs': callback_map[callback_id]['inputs'],
+                    'state': callback_map[callback_id]['state'],
+                    'clientside_function': callback_map[callback_id].get(
+                        'clientside_function', None)
+                }
+                for callback_id in callback_map
+                if key is None or callback_id in key
+            ], separators=(',', ':'))
+        return cached
+
+    def serve_dependencies(self):
+        return flask.Response(self.dependencies_json(),
+                              mimetype='application/json')
@@ -1,24 +1,66 @@
+import ast
+import hashlib
+import threading
+
 import dash_core_components as dcc
 import dash_html_components as html
 
 from tutorial import styles
 
+# style of the container of an example, by the type of its component
+CONTAINER_STYLES = {
+    'DatePickerSingle': {'overflow-x': 'initial'},
+    'DatePickerRange': {'overflow-x': 'initial'},
+    'Dropdown': {'overflow-x': 'initial'},
+    'Slider': {'overflow-x': 'initial', 'padding-bottom': '25px'},
+    'RangeSlider': {'overflow-x': 'initial', 'padding-bottom': '25px'},
+    'ColorPicker': {'float': 'center'},
+    'Tank': {'padding-left': '30px'},
+    'Thermometer': {'height': '240px'}
+}
 
-def ComponentBlock(example_string, **kwargs):
+_compiled = {}
+_blocks = {}
+_lock = threading.Lock()
+
+
+def _key(example_string):
+    if not isinstance(example_string, bytes):
+        example_string = example_string.encode('utf-8')
+    return hashlib.sha1(example_string).hexdigest()
+
+
+def compile_snippet(example_string):
+    '''
+    `(body, component)` code objects for a snippet: `body` runs all its
+    statements but the last, `component` evaluates the last one, an
+    expression or an assignment whose value is the component to show.
+    '''
+    tree = ast.parse(example_string, '<ComponentBlock>')
+    last = tree.body.pop() if tree.body else None
+    if not isinstance(last, (ast.Expr, ast.Assign)):
+        raise ValueError(
+            'The last statement of a ComponentBlock example must be '
+            'the component to show')
+    expression = ast.Expression(body=last.value)
+    return (compile(tree, '<ComponentBlock>', 'exec'),
+            compile(expression, '<ComponentBlock>', 'eval'))
+
+
+def evaluate(example_string):
+    '''The component that a snippet evaluates to, in a fresh scope.'''
+    key = _key(example_string)
+    code = _compiled.get(key)
+    if code is None:
+        code = _compiled.setdefault(key, compile_snippet(example_string))
+    body, component = code
     scope = {}
-    converted_string = example_string.replace(
-        'dcc.', 'component = dcc.').replace(
-            'daq.', 'component = daq.')
-    try:
-        exec(converted_string, scope)
-    except Exception as e:
-        print('\nError running\n{}\n{}'.format(
-            converted_string,
-            ('======================================' +
-             '======================================')
-        ))
+    exec(body, scope)
+    return eval(component, scope)
 
-        raise e
+
+def example_block(example_string, component):
+    '''The source of an example next to the component it creates.'''
     return html.Div([
         dcc.SyntaxHighlighter(
             example_string,
@@ -26,21 +68,33 @@ def ComponentBlock(example_string, **kwargs):
             customStyle=styles.code_container
         ),
         html.Div(
-            scope['component'],
+            component,
             className='example-container',
-            style=(({'overflow-x': 'initial'}) if (
-                'DatePicker' in example_string or
-                'Dropdown' in example_string
-            ) else ({
-                'overflow-x': 'initial',
-                'padding-bottom': '25px'
-            }) if 'Slider' in example_string else ({
-                'float': 'center'
-            }) if 'ColorPicker' in example_string else ({
-                'padding-left': '30px'
-            }) if 'Tank' in example_string else ({
-                'height': '240px'
-            }) if 'Thermometer' in example_string else {})
+            style=CONTAINER_STYLES.get(type(component).__name__, {})
         )
     ])
 
+
+def ComponentBlock(example_string, **kwargs):
+    '''
+    `example_block` of a snippet and the component it evaluates to. Blocks
+    are memoized by snippet, so each example is only run once per process.
+    '''
+    key = _key(example_string)
+    with _lock:
+        block = _blocks.get(key)
+    if block is not None:
+        return block
+    try:
+        component = evaluate(example_string)
+    except Exception as e:
+        print('\nError running\n{}\n{}'.format(
+            example_string,
+            ('======================================' +
+             '======================================')
+        ))
+
+        raise e
+    block = example_block(example_string, component)
+    with _lock:
+        return _blocks.setdefault(key, block)
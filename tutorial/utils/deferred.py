@@ -0,0 +1,97 @@
+import hashlib
+import json
+from collections import OrderedDict
+from copy import deepcopy
+
+import dash_html_components as html
+import plotly
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+from tutorial.utils import static_layout
+from tutorial.utils.layout_tree import replace_components
+
+
+class DeferredSections(object):
+    '''
+    Collapsed `html.Details` whose contents aren't sent with the chapter:
+    a callback of `app` sends them the first time the section is opened.
+    The JSON of each section is encoded once, on its first request, and
+    reused for everyone after that.
+
+    The renderer also calls these callbacks once when a chapter is shown,
+    with `n_clicks=None`: that is one small request per section, answered
+    without an update.
+    '''
+
+    def __init__(self, app):
+        self.app = app
+        # contents of the sections, by id
+        self.sections = OrderedDict()
+        self.layout = static_layout.StaticLayout()
+        self._compiled = set()
+
+    def details(self, summary, children, section_id=None):
+        '''
+        Like `html.Details([html.Summary(summary)] + children)`, closed.
+        `section_id` defaults to a hash of the contents, so that it is the
+        same in every process.
+        '''
+        if not isinstance(children, list):
+            children = [children]
+        if section_id is None:
+            section_id = 'section-' + hashlib.sha1(json.dumps(
+                [summary, children], cls=plotly.utils.PlotlyJSONEncoder,
+                sort_keys=True
+            ).encode('utf-8')).hexdigest()[:12]
+        base_id, copy = section_id, 1
+        while section_id in self.sections:
+            copy += 1
+            section_id = '{}-{}'.format(base_id, copy)
+        self.sections[section_id] = children
+
+        body_id = '{}-body'.format(section_id)
+        static_layout.callback(
+            self.app, self.layout,
+            Output(body_id, 'children'), [Input(section_id, 'n_clicks')],
+            [State(body_id, 'children')]
+        )(self._loader(section_id))
+        return html.Details([
+            html.Summary(summary),
+            html.Div(id=body_id)
+        ], id=section_id, open=False)
+
+    @property
+    def bodies(self):
+        '''The contents of the sections, by the id of the Div they go in.'''
+        return dict(
+            ('{}-body'.format(section_id), children)
+            for section_id, children in self.sections.items()
+        )
+
+    def inline(self, tree):
+        '''
+        A copy of `tree` with the contents of its sections in place, as if
+        they had been opened, e.g. for the search index.
+        '''
+        bodies = self.bodies
+
+        def fill(component):
+            body_id = getattr(component, 'id', None)
+            if isinstance(component, html.Div) and body_id in bodies:
+                return html.Div(bodies[body_id], id=body_id)
+        return replace_components(deepcopy(tree), fill)
+
+    def _loader(self, section_id):
+        def load(n_clicks, loaded):
+            # the page keeps the contents once they are there: load them on
+            # any click until then, so that a failed request can be retried
+            if not n_clicks or loaded is not None:
+                raise PreventUpdate
+            children = self.sections[section_id]
+            if section_id not in self._compiled:
+                self.layout.dynamic_ids = static_layout.callback_ids(self.app)
+                self.layout.compile(children)
+                self._compiled.add(section_id)
+            return children
+        return load
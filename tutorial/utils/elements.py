@@ -0,0 +1,186 @@
+import copy
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict, deque
+
+
+def apply_changes(elements, operations):
+    '''Apply `ElementStore.changes` operations to a copy of `elements`.'''
+    by_id = OrderedDict(
+        (element['data']['id'], copy.deepcopy(element))
+        for element in elements
+    )
+    for op in operations:
+        if op['op'] == 'add':
+            by_id[op['id']] = copy.deepcopy(op['element'])
+        elif op['op'] == 'remove':
+            by_id.pop(op['id'], None)
+        else:
+            element = by_id[op['id']]
+            for key, value in op['element'].items():
+                if key == 'data':
+                    element['data'].update(value)
+                else:
+                    element[key] = value
+    return list(by_id.values())
+
+
+class ElementStore(object):
+    '''
+    Server-side copy of a Cytoscape `elements` list that is the source of
+    truth for a graph, so callbacks don't need the whole list as `State`.
+
+    Elements are kept by id (edges without one get `<source>-<target>-<n>`)
+    and every `add`, `remove` and `update` bumps `version`. `changes(since)`
+    returns the operations made after a version, in the order they were
+    applied, as `{'op': 'add' | 'remove' | 'update', 'id': ..., 'element':
+    ...}` where an update only holds the fields that changed; only the last
+    `max_history` operations are kept. Removing a node also removes its
+    edges, as Cytoscape does.
+
+    `delta(since)` wraps `changes` for callbacks: it returns what a browser
+    needs to update its copy, with versions that name this store in this
+    process (`token`), so that a browser whose requests reach another
+    worker process gets the whole list rather than changes to another copy.
+    '''
+
+    def __init__(self, elements=(), max_history=10000):
+        self.version = 0
+        self._elements = OrderedDict()
+        self._edges_of = {}
+        self._history = deque(maxlen=max_history)
+        self._edge_count = 0
+        self._json = None
+        self._id = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self.add(*elements)
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __contains__(self, id):
+        return id in self._elements
+
+    def get(self, id):
+        return copy.deepcopy(self._elements[id])
+
+    def add(self, *elements):
+        with self._lock:
+            for element in elements:
+                element = copy.deepcopy(element)
+                data = element['data']
+                if 'source' in data and data.get('id') is None:
+                    self._edge_count += 1
+                    data['id'] = '{}-{}-{}'.format(
+                        data['source'], data['target'], self._edge_count)
+                id = data['id']
+                if id in self._elements:
+                    raise ValueError('Duplicate element id: {}'.format(id))
+                self._elements[id] = element
+                if 'source' in data:
+                    for end in (data['source'], data['target']):
+                        self._edges_of.setdefault(end, set()).add(id)
+                self._record({'op': 'add', 'id': id, 'element': element})
+            return self.version
+
+    def remove(self, *ids):
+        with self._lock:
+            for id in ids:
+                for edge_id in sorted(self._edges_of.pop(id, ())):
+                    self._remove(edge_id)
+                self._remove(id)
+            return self.version
+
+    def update(self, id, data=None, **fields):
+        '''
+        Merge `data` into the element's data and replace any other
+        top-level fields given, e.g. `position` or `classes`.
+        '''
+        with self._lock:
+            element = self._elements[id]
+            changes = copy.deepcopy(fields)
+            if data:
+                if 'id' in data and data['id'] != id:
+                    raise ValueError('Element ids cannot be updated')
+                changes['data'] = copy.deepcopy(data)
+                element['data'].update(changes['data'])
+            element.update((k, v) for k, v in changes.items() if k != 'data')
+            self._record({'op': 'update', 'id': id, 'element': changes})
+            return self.version
+
+    def elements(self):
+        with self._lock:
+            return copy.deepcopy(list(self._elements.values()))
+
+    def to_json(self):
+        '''The full `elements` list as JSON, serialized once per version.'''
+        with self._lock:
+            if self._json is None:
+                self._json = json.dumps(list(self._elements.values()))
+            return self._json
+
+    def changes(self, since):
+        '''
+        `(version, operations)` to bring a copy at version `since` up to
+        date, or `(version, None)` if they are no longer in the history
+        and the full list has to be sent instead.
+        '''
+        with self._lock:
+            return self.version, self._changes(since)
+
+    def token(self):
+        '''The current version, as `delta` names it.'''
+        with self._lock:
+            return self._token()
+
+    def delta(self, since=None):
+        '''
+        `{'since': since, 'version': ..., 'operations': [...]}` to bring a
+        copy at version `since` (a `token`) up to date, or `{'version': ...,
+        'elements': [...]}` with all of the elements when `since` is `None`,
+        too old or from another store or process.
+        '''
+        with self._lock:
+            version = self._token()
+            prefix = version[:version.rindex(':') + 1]
+            if since is not None and str(since).startswith(prefix):
+                operations = self._changes(int(str(since)[len(prefix):]))
+                if operations is not None:
+                    return {'since': since, 'version': version,
+                            'operations': operations}
+            return {'version': version,
+                    'elements': copy.deepcopy(list(self._elements.values()))}
+
+    def _token(self):
+        # forked worker processes share `_id`, but not the pid
+        return '{}-{}:{}'.format(self._id, os.getpid(), self.version)
+
+    def _changes(self, since):
+        if since == self.version:
+            return []
+        if (since > self.version or not self._history or
+                self._history[0][0] > since + 1):
+            return None
+        return [
+            copy.deepcopy(op) for version, op in self._history
+            if version > since
+        ]
+
+    def _remove(self, id):
+        element = self._elements.pop(id, None)
+        if element is None:
+            return
+        data = element['data']
+        if 'source' in data:
+            for end in (data['source'], data['target']):
+                self._edges_of.get(end, set()).discard(id)
+        self._record({'op': 'remove', 'id': id})
+
+    def _record(self, op):
+        # `add` ops share the stored element, which later updates change,
+        # but replaying the ops in order still gives the same result.
+        self.version += 1
+        self._json = None
+        self._history.append((self.version, op))
@@ -0,0 +1,189 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import dash_core_components as dcc
+import dash_html_components as html
+import plotly
+from dash.dependencies import ClientsideFunction, Input, Output, State
+
+
+def to_json(figure):
+    return json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder)
+
+
+def normalize(figure):
+    '''
+    Round-trip a figure through the plotly encoder so that numpy arrays,
+    pandas series and other encoder-only types become plain lists/dicts
+    that can be compared structurally.
+    '''
+    return json.loads(to_json(figure))
+
+
+def diff(old, new, path=None):
+    '''
+    Compute a structural patch that turns `old` into `new`.
+
+    Both arguments must already be normalized (see `normalize`).
+    The patch is a list of operations of the form
+    `{'op': 'set' | 'delete', 'path': [...], 'value': ...}`.
+    Dicts are compared key by key and lists of equal length element by
+    element; anything else that differs is replaced wholesale, so data
+    arrays that change length are shipped once rather than element-wise.
+    '''
+    path = path or []
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'delete', 'path': path + [key]})
+        for key in new:
+            if key in old:
+                ops += diff(old[key], new[key], path + [key])
+            else:
+                ops.append({'op': 'set', 'path': path + [key],
+                            'value': new[key]})
+        return ops
+
+    if (isinstance(old, list) and isinstance(new, list) and
+            len(old) == len(new) and
+            any(isinstance(v, (dict, list)) for v in new)):
+        ops = []
+        for i, (old_value, new_value) in enumerate(zip(old, new)):
+            ops += diff(old_value, new_value, path + [i])
+        return ops
+
+    return [{'op': 'set', 'path': path, 'value': new}]
+
+
+def apply_patch(figure, patch):
+    '''
+    Apply a patch produced by `diff` to a copy of `figure`.
+    '''
+    figure = copy.deepcopy(figure)
+    for op in patch:
+        if not op['path']:
+            figure = copy.deepcopy(op['value'])
+            continue
+        parent = figure
+        for key in op['path'][:-1]:
+            parent = parent[key]
+        key = op['path'][-1]
+        if op['op'] == 'delete':
+            del parent[key]
+        else:
+            parent[key] = copy.deepcopy(op['value'])
+    return figure
+
+
+class FigureDeltas(object):
+    '''
+    Sends the figures of graph callbacks as patches against the figure
+    that the browser already shows.
+
+    `callback(graph_id, inputs, state)` registers the decorated function,
+    which returns a whole figure, as a callback of `app` whose output is
+    the `dcc.Store` made by `store(graph_id)`. The store gets the figure
+    the first time and after that the `diff` from the previous one; the
+    clientside function `deltas.figure` (assets/deltas.js) applies it to
+    the graph.
+
+    Figures are remembered by hash, so each session's next patch is made
+    against the figure it was last sent, whichever session that was. Up
+    to `max_entries` figures are kept, least recently used first out; a
+    browser whose figure was forgotten, or that was answered by another
+    process, gets the whole figure again.
+    '''
+
+    def __init__(self, app, max_entries=1000):
+        self.app = app
+        self.max_entries = max_entries
+        self._figures = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def store(self, graph_id):
+        '''The components that carry the patches of `graph_id`.'''
+        return html.Div([
+            dcc.Store(id='{}-figure-delta'.format(graph_id)),
+            dcc.Store(id='{}-figure-key'.format(graph_id))
+        ])
+
+    def callback(self, graph_id, inputs, state=[]):
+        delta_id = '{}-figure-delta'.format(graph_id)
+        key_id = '{}-figure-key'.format(graph_id)
+
+        def wrap(func):
+            def update(*args):
+                # the last argument is the key of the figure on the page
+                return self.delta(graph_id, func(*args[:-1]), args[-1])
+            update.__name__ = func.__name__
+
+            self.app.callback(
+                Output(delta_id, 'data'), inputs,
+                list(state) + [State(key_id, 'data')]
+            )(update)
+            self.app.clientside_callback(
+                ClientsideFunction('deltas', 'figure'),
+                [Output(graph_id, 'figure'), Output(key_id, 'data')],
+                [Input(delta_id, 'data')],
+                [State(graph_id, 'figure'), State(key_id, 'data')]
+            )
+            return func
+        return wrap
+
+    def delta(self, output_id, figure, sent_key):
+        '''
+        What to send for `figure` to a browser that has the figure with
+        the key `sent_key`: `{'key': ..., 'figure': ...}`, or
+        `{'key': ..., 'base': sent_key, 'patch': [...]}`.
+        '''
+        start = time.time()
+        figure = normalize(figure)
+        figure_json = json.dumps(figure, sort_keys=True)
+        key = hashlib.sha1(figure_json.encode('utf-8')).hexdigest()[:16]
+        with self._lock:
+            previous = self._figures.pop(sent_key, None) \
+                if sent_key is not None else None
+            if previous is not None:
+                self._figures[sent_key] = previous
+            self._figures[key] = self._figures.pop(key, figure)
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+
+        if previous is None:
+            message = {'key': key, 'figure': figure}
+        else:
+            message = {'key': key, 'base': sent_key,
+                       'patch': diff(previous, figure)}
+        self._record(output_id, len(figure_json), len(to_json(message)),
+                     time.time() - start)
+        return message
+
+    def stats(self):
+        '''
+        Per-output totals: number of updates, bytes the whole figures
+        would have cost, bytes actually sent and seconds spent diffing.
+        '''
+        with self._lock:
+            return dict((k, dict(v)) for k, v in self._stats.items())
+
+    def _record(self, output_id, full_bytes, sent_bytes, seconds):
+        with self._lock:
+            stats = self._stats.setdefault(output_id, {
+                'calls': 0,
+                'full_bytes': 0,
+                'sent_bytes': 0,
+                'diff_seconds': 0.0
+            })
+            stats['calls'] += 1
+            stats['full_bytes'] += full_bytes
+            stats['sent_bytes'] += sent_bytes
+            stats['diff_seconds'] += seconds
@@ -0,0 +1,439 @@
+import numbers
+import operator
+import re
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+from six import string_types
+
+# How many compiled filters `compile_filter` keeps
+MAX_COMPILED = 256
+
+_TOKEN = re.compile(r'''\s*(?:
+    (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`)
+  | (?P<column>\{[^{}]*\})
+  | (?P<symbol>&&|\|\||>=|<=|!=|==|=|>|<|!|\(|\)|,)
+  | (?P<word>[\w:.+\-]+)
+)''', re.VERBOSE | re.UNICODE)
+_ESCAPE = re.compile(r'\\(.)')
+
+_OPERATORS = {
+    '=': 'eq', '==': 'eq', '!=': 'ne', '>': 'gt', '>=': 'ge', '<': 'lt',
+    '<=': 'le', 'eq': 'eq', 'ne': 'ne', 'gt': 'gt', 'ge': 'ge', 'lt': 'lt',
+    'le': 'le', 'contains': 'contains', 'in': 'in', 'between': 'between'
+}
+_ORDERINGS = ('gt', 'ge', 'lt', 'le', 'between')
+_COMPARISONS = {
+    'eq': operator.eq, 'ne': operator.ne, 'gt': operator.gt,
+    'ge': operator.ge, 'lt': operator.lt, 'le': operator.le
+}
+
+Token = namedtuple('Token', ['kind', 'text', 'position'])
+# A value as written: `kind` is 'string' (quoted), 'number' (`num(...)`)
+# or 'word' (bare, typed by the column it is compared with)
+Literal = namedtuple('Literal', ['text', 'kind'])
+# `value` is a tuple of values for 'in', and of the bounds for 'between'
+Comparison = namedtuple('Comparison', ['column', 'operator', 'value'])
+# A value compared with an object column that mixes types: as `text` with
+# its strings and as `number` with its numbers; either may be None
+MixedValue = namedtuple('MixedValue', ['text', 'number'])
+# `operator` is 'and' or 'or'
+Boolean = namedtuple('Boolean', ['operator', 'operands'])
+Not = namedtuple('Not', ['operand'])
+
+
+class FilterError(ValueError):
+    pass
+
+
+def tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None:
+            rest = expression[position:]
+            raise FilterError('Unexpected {!r} at {} in {!r}'.format(
+                rest.lstrip()[:1], position + len(rest) - len(rest.lstrip()),
+                expression))
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'string':
+            text = _ESCAPE.sub(r'\1', text[1:-1])
+        elif kind == 'column':
+            text = text[1:-1]
+        tokens.append(Token(kind, text, match.start(kind)))
+        position = match.end()
+    return tokens
+
+
+class _Parser(object):
+    # expression  := disjunction
+    # disjunction := conjunction (('or' | '||') conjunction)*
+    # conjunction := negation (('and' | '&&') negation)*
+    # negation    := ('not' | '!') negation | '(' expression ')' | comparison
+    # comparison  := column operator value
+    #              | column 'in' '(' value (',' value)* ')'
+    #              | column 'between' value 'and' value
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = tokenize(expression)
+        self.position = 0
+
+    def parse(self):
+        node = self.disjunction()
+        if self.position < len(self.tokens):
+            self.fail('Expected the end of the expression')
+        return node
+
+    def peek(self, *keywords):
+        # the next token if it is one of `keywords`
+        if self.position < len(self.tokens):
+            token = self.tokens[self.position]
+            if token.kind in ('symbol', 'word') and \
+                    token.text.lower() in keywords:
+                return token
+        return None
+
+    def accept(self, *keywords):
+        token = self.peek(*keywords)
+        if token is not None:
+            self.position += 1
+        return token
+
+    def expect(self, *keywords):
+        token = self.accept(*keywords)
+        if token is None:
+            self.fail('Expected {}'.format(' or '.join(
+                repr(keyword) for keyword in keywords)))
+        return token
+
+    def next(self, *kinds):
+        if self.position >= len(self.tokens):
+            self.fail('Unexpected end of the expression')
+        token = self.tokens[self.position]
+        if token.kind not in kinds:
+            self.fail('Unexpected {!r}'.format(token.text))
+        self.position += 1
+        return token
+
+    def fail(self, message):
+        if self.position < len(self.tokens):
+            message += ' at {}'.format(self.tokens[self.position].position)
+        raise FilterError('{} in {!r}'.format(message, self.expression))
+
+    def disjunction(self):
+        operands = [self.conjunction()]
+        while self.accept('or', '||'):
+            operands.append(self.conjunction())
+        return operands[0] if len(operands) == 1 else \
+            Boolean('or', tuple(operands))
+
+    def conjunction(self):
+        operands = [self.negation()]
+        while self.accept('and', '&&'):
+            operands.append(self.negation())
+        return operands[0] if len(operands) == 1 else \
+            Boolean('and', tuple(operands))
+
+    def negation(self):
+        if self.accept('not', '!'):
+            return Not(self.negation())
+        if self.accept('('):
+            node = self.disjunction()
+            self.expect(')')
+            return node
+        return self.comparison()
+
+    def comparison(self):
+        column = self.next('string', 'column', 'word').text
+        token = self.accept(*_OPERATORS)
+        if token is None:
+            self.fail('Expected an operator after {!r}'.format(column))
+        operator_name = _OPERATORS[token.text.lower()]
+        if operator_name == 'in':
+            self.expect('(')
+            values = [self.value()]
+            while self.accept(','):
+                values.append(self.value())
+            self.expect(')')
+            return Comparison(column, 'in', tuple(values))
+        if operator_name == 'between':
+            low = self.value()
+            self.expect('and')
+            return Comparison(column, 'between', (low, self.value()))
+        return Comparison(column, operator_name, self.value())
+
+    def value(self):
+        token = self.next('string', 'word')
+        if token.kind == 'word' and token.text.lower() in ('num', 'str') \
+                and self.accept('('):
+            text = self.next('string', 'word').text
+            self.expect(')')
+            return Literal(text, 'number' if token.text.lower() == 'num'
+                           else 'string')
+        return Literal(token.text, token.kind)
+
+
+def parse(expression):
+    '''
+    The syntax tree of a filter expression, as written by DataTable in
+    `filtering_settings` (e.g. `"continent" eq Asia && "pop" > 5e6`) or by
+    hand, or `None` if it is empty.
+
+    Columns are quoted, bare or in braces; operators are `eq`/`=`, `ne`/`!=`,
+    `gt`/`>`, `ge`/`>=`, `lt`/`<`, `le`/`<=`, `contains`, `in (a, b, ...)`
+    and `between low and high` (inclusive), combined with `and`/`&&`,
+    `or`/`||`, `not`/`!` and parentheses.
+    '''
+    if not expression or not expression.strip():
+        return None
+    return _Parser(expression).parse()
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def _coerce(literal, column, dtype):
+    if isinstance(dtype, CategoricalDtype):
+        # compared with the categories, as text if they are objects
+        dtype = dtype.categories.dtype
+    elif dtype == np.dtype(object):
+        if literal.kind == 'string':
+            return MixedValue(literal.text, None)
+        number = _number(literal.text)
+        if literal.kind == 'number':
+            if number is None:
+                raise FilterError('{!r} is not a number'.format(literal.text))
+            return MixedValue(None, number)
+        return MixedValue(literal.text, number)
+    kind = dtype.kind
+    if kind in 'iuf':
+        if literal.kind == 'string':
+            raise FilterError('{!r} is numeric, {!r} is text'.format(
+                column, literal.text))
+        try:
+            return float(literal.text)
+        except ValueError:
+            raise FilterError('{!r} is numeric, {!r} is not a number'.format(
+                column, literal.text))
+    if kind == 'b':
+        if literal.text.lower() not in ('true', 'false'):
+            raise FilterError('{!r} is boolean, {!r} is not'.format(
+                column, literal.text))
+        return literal.text.lower() == 'true'
+    if kind == 'M':
+        try:
+            timestamp = pd.Timestamp(literal.text)
+        except ValueError:
+            raise FilterError('{!r} holds dates, {!r} is not one'.format(
+                column, literal.text))
+        tz = getattr(dtype, 'tz', None)
+        if tz is not None and timestamp.tzinfo is None:
+            # dates without a time zone are in the column's
+            timestamp = timestamp.tz_localize(tz)
+        # in UTC for time zone aware columns, see `_array`
+        return timestamp.to_datetime64()
+    if literal.kind == 'number':
+        raise FilterError('{!r} is text, {!r} is a number'.format(
+            column, literal.text))
+    return literal.text
+
+
+def check(node, dtypes):
+    '''
+    `node` with its values converted to the dtypes of their columns, a
+    dict-like such as `df.dtypes`; raises `FilterError` for unknown
+    columns and values or operators that don't fit the column.
+    '''
+    if isinstance(node, Boolean):
+        return Boolean(node.operator, tuple(
+            check(operand, dtypes) for operand in node.operands))
+    if isinstance(node, Not):
+        return Not(check(node.operand, dtypes))
+
+    if node.column not in dtypes:
+        raise FilterError('Unknown column {!r}'.format(node.column))
+    dtype = dtypes[node.column]
+    if node.operator == 'contains':
+        if dtype.kind in 'iufbM':
+            raise FilterError('{!r} is not a text column, it can\'t '
+                              'contain {!r}'.format(node.column,
+                                                    node.value.text))
+        return node._replace(value=node.value.text)
+    if node.operator in ('in', 'between'):
+        value = tuple(_coerce(item, node.column, dtype)
+                      for item in node.value)
+    else:
+        value = _coerce(node.value, node.column, dtype)
+    if isinstance(dtype, CategoricalDtype) and node.operator in _ORDERINGS:
+        # pandas only orders ordered categoricals, and only by their
+        # categories
+        if not dtype.ordered:
+            raise FilterError('{!r} is unordered, it can\'t be compared '
+                              'with {!r}'.format(node.column, node.operator))
+        for bound in (value if node.operator == 'between' else (value,)):
+            if bound not in dtype.categories:
+                raise FilterError('{!r} is not a category of {!r}'.format(
+                    bound, node.column))
+    return node._replace(value=value)
+
+
+def _compile_comparison(node, dtype):
+    column, operator_name, value = node
+    if operator_name == 'contains':
+        return lambda df: df[column].str.contains(
+            value, regex=False, na=False).to_numpy(dtype=bool)
+    if dtype.kind in 'iufbM':
+        # work on the numpy arrays directly
+        if operator_name == 'in':
+            values = np.array(value)
+            return lambda df: np.isin(_array(df[column]), values)
+        if operator_name == 'between':
+            low, high = value
+            return lambda df: _between(_array(df[column]), low, high)
+        compare = _COMPARISONS[operator_name]
+        return lambda df: compare(_array(df[column]), value)
+    if dtype == np.dtype(object):
+        return lambda df: _mixed_mask(df[column], operator_name, value)
+
+    if operator_name in ('eq', 'ne'):
+        # hashing is faster than comparing Python strings one by one
+        if operator_name == 'eq':
+            return lambda df: df[column].isin([value]).to_numpy(dtype=bool)
+        return lambda df: ~df[column].isin([value]).to_numpy(dtype=bool)
+    if operator_name == 'in':
+        values = list(value)
+        return lambda df: df[column].isin(values).to_numpy(dtype=bool)
+    # missing values are never in an order
+    if operator_name == 'between':
+        low, high = value
+        return lambda df: df[column].between(low, high).to_numpy(
+            dtype=bool, na_value=False)
+    compare = _COMPARISONS[operator_name]
+    return lambda df: compare(df[column], value).to_numpy(
+        dtype=bool, na_value=False)
+
+
+def _array(series):
+    # the values of a numeric, boolean or date column as a numpy array,
+    # with NaN or NaT for missing values and time zone aware dates in UTC
+    dtype = series.dtype
+    if getattr(dtype, 'tz', None) is not None:
+        return series.dt.tz_convert('UTC').dt.tz_localize(None).to_numpy()
+    if isinstance(dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype=float, na_value=np.nan)
+
+
+def _between(values, low, high):
+    mask = values >= low
+    mask &= values <= high
+    return mask
+
+
+def _mixed_mask(series, operator_name, value):
+    # an object column can hold strings, numbers and anything else: each
+    # MixedValue is compared with the strings as text and with the
+    # numbers as a number, and never matches the other values
+    values = series.to_numpy()
+    is_text = np.array([isinstance(item, string_types) for item in values],
+                       dtype=bool)
+    as_numbers = np.array([
+        item if isinstance(item, numbers.Real) and
+        not isinstance(item, bool) else np.nan
+        for item in values
+    ], dtype=float)
+    texts = values[is_text]
+
+    def mask(compare, bound):
+        result = np.zeros(len(values), dtype=bool)
+        if bound.text is not None:
+            result[is_text] = compare(texts, bound.text).astype(bool)
+        if bound.number is not None:
+            result |= compare(as_numbers, bound.number)
+        return result
+
+    if operator_name in ('eq', 'ne'):
+        result = mask(operator.eq, value)
+        return result if operator_name == 'eq' else ~result
+    if operator_name == 'in':
+        result = np.zeros(len(values), dtype=bool)
+        for item in value:
+            result |= mask(operator.eq, item)
+        return result
+    if operator_name == 'between':
+        low, high = value
+        return mask(operator.ge, low) & mask(operator.le, high)
+    return mask(_COMPARISONS[operator_name], value)
+
+
+def _compile(node, dtypes):
+    if isinstance(node, Not):
+        operand = _compile(node.operand, dtypes)
+        return lambda df: ~operand(df)
+    if isinstance(node, Boolean):
+        operands = [_compile(operand, dtypes) for operand in node.operands]
+        combine = np.logical_and if node.operator == 'and' \
+            else np.logical_or
+
+        def predicate(df):
+            mask = operands[0](df)
+            for operand in operands[1:]:
+                mask = combine(mask, operand(df))
+            return mask
+        return predicate
+    return _compile_comparison(node, dtypes[node.column])
+
+
+_compiled = OrderedDict()
+_lock = threading.Lock()
+
+
+def compile_filter(expression, dtypes):
+    '''
+    A function of a DataFrame with these `dtypes` that returns the boolean
+    mask of the rows matching `expression` (see `parse`), computed with a
+    vectorized operation per comparison.
+
+    Compiled filters are memoized by expression and dtypes, so that the
+    callbacks of a table only parse each filter once.
+    '''
+    key = (expression, tuple(
+        (column, str(dtype)) for column, dtype in dtypes.items()))
+    with _lock:
+        predicate = _compiled.get(key)
+        if predicate is not None:
+            _compiled[key] = _compiled.pop(key)
+            return predicate
+
+    node = parse(expression)
+    if node is None:
+        predicate = _all_rows
+    else:
+        predicate = _compile(check(node, dtypes), dtypes)
+    with _lock:
+        _compiled[key] = predicate
+        while len(_compiled) > MAX_COMPILED:
+            _compiled.popitem(last=False)
+    return predicate
+
+
+def _all_rows(df):
+    return np.ones(len(df), dtype=bool)
+
+
+def filter_frame(df, expression):
+    '''The rows of `df` that match `expression` (see `parse`).'''
+    if not expression or not expression.strip():
+        return df
+    return df[compile_filter(expression, df.dtypes)(df)]
@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Bump when the algorithms change, to invalidate cached positions.
+LAYOUT_VERSION = 1
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-layouts')
+# Graphs up to this many nodes get exact pairwise repulsion.
+EXACT_REPULSION_MAX = 2000
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_SIZE = 16
+
+
+def graph_arrays(elements):
+    '''
+    Split Cytoscape `elements` into the list of node ids and two arrays of
+    node indices, `source` and `target`, for the edges. Edges to unknown
+    nodes are ignored, as Cytoscape does.
+    '''
+    ids = [e['data']['id'] for e in elements if 'source' not in e['data']]
+    index = dict((id, i) for i, id in enumerate(ids))
+    pairs = [
+        (index[e['data']['source']], index[e['data']['target']])
+        for e in elements
+        if 'source' in e['data'] and
+        e['data']['source'] in index and e['data']['target'] in index
+    ]
+    pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    return ids, pairs[:, 0], pairs[:, 1]
+
+
+def _exact_repulsion(pos, chunk=500):
+    # Fruchterman-Reingold repulsion k**2 / d between every pair (k = 1)
+    force = np.zeros_like(pos)
+    for start in range(0, len(pos), chunk):
+        delta = pos[start:start + chunk, None, :] - pos[None, :, :]
+        dist2 = (delta ** 2).sum(-1)
+        dist2[dist2 == 0] = np.inf
+        force[start:start + chunk] = (delta / dist2[..., None]).sum(1)
+    return force
+
+
+def _mesh_kernel(grid):
+    # Spectra of the x and y components of the force kernel d / |d|**2 on
+    # a zero-padded 2 * grid mesh, in units of one cell. For cells of
+    # size h the kernel is this one divided by h.
+    offsets = np.fft.fftfreq(2 * grid, 1.0 / (2 * grid))
+    dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+    dist2 = dx ** 2 + dy ** 2
+    dist2[0, 0] = np.inf
+    return np.fft.rfft2(dx / dist2), np.fft.rfft2(dy / dist2)
+
+
+def _mesh_repulsion(pos, grid, kernel):
+    # Particle-mesh approximation of the same force: count the nodes in
+    # each cell of a grid x grid mesh, convolve the counts with the force
+    # kernel using FFTs and read the field back at each node's cell. The
+    # cost is O(n + grid**2 log grid) per step instead of O(n**2).
+    low = pos.min(0)
+    cell = (pos.max(0) - low).max() / (grid - 1) or 1.0
+    cells = np.minimum(((pos - low) / cell + 0.5).astype(np.int64), grid - 1)
+    flat = cells[:, 0] * (2 * grid) + cells[:, 1]
+    density = np.bincount(flat, minlength=4 * grid * grid).astype(np.float64)
+    spectrum = np.fft.rfft2(density.reshape(2 * grid, 2 * grid))
+
+    force = np.empty_like(pos)
+    for axis in range(2):
+        field = np.fft.irfft2(spectrum * kernel[axis], (2 * grid, 2 * grid))
+        force[:, axis] = field.ravel()[flat] / cell
+    return force
+
+
+def force_directed(n, source, target, iterations=100, seed=0):
+    '''
+    Fruchterman-Reingold spring layout with an ideal edge length of 1.
+
+    Repulsion is exact for small graphs and uses a particle-mesh
+    approximation above `EXACT_REPULSION_MAX` nodes; attraction along
+    edges is summed with `np.bincount`. Returns an `(n, 2)` array.
+    '''
+    rng = np.random.RandomState(seed)
+    pos = rng.uniform(-1, 1, (n, 2)) * np.sqrt(n)
+    if n < 2:
+        return pos
+    # about one node per mesh cell
+    grid = int(2 ** np.ceil(np.log2(np.sqrt(n))))
+    kernel = _mesh_kernel(grid) if n > EXACT_REPULSION_MAX else None
+    temperature = np.sqrt(n) / 10.0
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        if n <= EXACT_REPULSION_MAX:
+            displacement = _exact_repulsion(pos)
+        else:
+            displacement = _mesh_repulsion(pos, grid, kernel)
+
+        delta = pos[source] - pos[target]
+        # attraction d**2 / k along the edge
+        pull = delta * np.sqrt((delta ** 2).sum(1))[:, None]
+        for axis in range(2):
+            displacement[:, axis] -= np.bincount(
+                source, pull[:, axis], minlength=n)
+            displacement[:, axis] += np.bincount(
+                target, pull[:, axis], minlength=n)
+
+        length = np.sqrt((displacement ** 2).sum(1))
+        length[length == 0] = 1
+        step = np.minimum(length, temperature) / length
+        pos += displacement * step[:, None]
+        temperature -= cooling
+    return pos - pos.mean(0)
+
+
+def _neighbors(n, source, target):
+    # undirected adjacency in CSR form: neighbors of i are
+    # neighbor[start[i]:start[i + 1]]
+    ends = np.concatenate([source, target])
+    others = np.concatenate([target, source])
+    order = np.argsort(ends, kind='mergesort')
+    start = np.searchsorted(ends[order], np.arange(n + 1))
+    return start, others[order]
+
+
+def hierarchical(n, source, target, roots=None):
+    '''
+    Tree layout from a breadth-first search, like Cytoscape's
+    `breadthfirst`: nodes are placed on rows by their distance to the
+    nearest root and ordered within a row by the position of the node
+    that reached them. Every component without one of `roots` (node
+    indices) gets its own root. Returns an `(n, 2)` array.
+    '''
+    start, neighbor = _neighbors(n, source, target)
+    degree = np.diff(start)
+    level = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+
+    # isolated nodes are their own roots; the others are searched from
+    # the given roots, then from the first unreached node of each
+    # remaining component
+    frontier = np.union1d(np.asarray(roots or [], dtype=np.int64),
+                          np.flatnonzero(degree == 0))
+    if not len(frontier) and n:
+        frontier = np.array([0])
+    depth = 0
+    while len(frontier):
+        level[frontier] = depth
+        counts = degree[frontier]
+        total = counts.sum()
+        if total:
+            first = np.repeat(start[frontier] - np.cumsum(counts) + counts,
+                              counts)
+            reached = neighbor[first + np.arange(total)]
+            via = np.repeat(frontier, counts)
+            new = level[reached] < 0
+            reached, keep = np.unique(reached[new], return_index=True)
+            parent[reached] = via[new][keep]
+            frontier = reached
+            depth += 1
+        else:
+            frontier = frontier[:0]
+        if not len(frontier):
+            unreached = np.flatnonzero(level < 0)
+            if len(unreached):
+                frontier = unreached[:1]
+                depth = 0
+
+    pos = np.zeros((n, 2))
+    pos[:, 1] = level
+    rank = np.zeros(n)
+    for at_level in range(level.max() + 1 if n else 0):
+        nodes = np.flatnonzero(level == at_level)
+        key = np.where(parent[nodes] >= 0, rank[parent[nodes]], -1)
+        nodes = nodes[np.argsort(key, kind='mergesort')]
+        rank[nodes] = np.arange(len(nodes))
+        pos[nodes, 0] = rank[nodes] - (len(nodes) - 1) / 2.0
+    return pos
+
+
+LAYOUTS = {
+    'force': force_directed,
+    'hierarchical': hierarchical
+}
+
+
+def _graph_key(ids, source, target, name, params):
+    digest = hashlib.sha1()
+    digest.update('\0'.join(ids).encode('utf-8'))
+    digest.update(source.tobytes())
+    digest.update(target.tobytes())
+    digest.update(json.dumps(
+        [LAYOUT_VERSION, name, sorted(params.items())]
+    ).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def positions(elements, name='force', cache_dir=CACHE_DIR, **params):
+    '''
+    Compute the `name` layout of `elements` on the server and return
+    `(ids, positions)`, with one row of `positions` per node id.
+
+    Results are cached in memory and as `.npy` files in `cache_dir`, keyed
+    by a hash of the graph and the layout parameters, so a graph is only
+    laid out once. `roots` for the hierarchical layout are node ids.
+    '''
+    ids, source, target = graph_arrays(elements)
+    if params.get('roots'):
+        index = dict((id, i) for i, id in enumerate(ids))
+        params['roots'] = sorted(index[root] for root in params['roots'])
+    key = _graph_key(ids, source, target, name, params)
+    with _cache_lock:
+        if key in _cache:
+            _cache[key] = _cache.pop(key)
+            return ids, _cache[key]
+
+    cache_path = os.path.join(cache_dir, '{}.npy'.format(key))
+    if os.path.exists(cache_path):
+        pos = np.load(cache_path)
+    else:
+        pos = LAYOUTS[name](len(ids), source, target, **params)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        with open(tmp_path, 'wb') as f:
+            np.save(f, pos)
+        os.rename(tmp_path, cache_path)
+
+    with _cache_lock:
+        _cache[key] = pos
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return ids, pos
+
+
+def preset_elements(elements, name='force', spacing=60, **params):
+    '''
+    Copy of `elements` with node positions from the server-side `name`
+    layout, `spacing` pixels per unit, for `layout={'name': 'preset'}`.
+    '''
+    ids, pos = positions(elements, name, **params)
+    xy = dict(zip(ids, (pos * spacing).round(1).tolist()))
+    laid_out = []
+    for element in elements:
+        element = dict(element)
+        if element['data'].get('id') in xy and 'source' not in element['data']:
+            x, y = xy[element['data']['id']]
+            element['position'] = {'x': x, 'y': y}
+        laid_out.append(element)
+    return laid_out
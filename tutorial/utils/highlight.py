@@ -0,0 +1,137 @@
+import hashlib
+import io
+import os
+import tempfile
+import threading
+
+import dash_core_components as dcc
+import dash_html_components as html
+import pygments
+from dash_dangerously_set_inner_html import DangerouslySetInnerHTML
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name, guess_lexer
+from pygments.util import ClassNotFound
+
+from tutorial.utils.layout_tree import replace_components, set_props
+
+# Bump when the markup changes, to invalidate cached fragments.
+HIGHLIGHT_VERSION = 1
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-highlight')
+# Pygments style for each `dcc.SyntaxHighlighter` theme. The matching
+# rules are in assets/highlight.css (see `stylesheet`).
+THEMES = {'light': 'default', 'dark': 'monokai'}
+# Props a `dcc.SyntaxHighlighter` can have and still be pre-rendered.
+# Ones with an `id` may be the output of a callback and are left alone.
+PRERENDERED_PROPS = {'children', 'language', 'theme', 'customStyle'}
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _lexer(code, language):
+    if language:
+        try:
+            return get_lexer_by_name(language, stripnl=False)
+        except ClassNotFound:
+            pass
+    else:
+        # like highlight.js in the browser, guess when no language is given
+        try:
+            return guess_lexer(code, stripnl=False)
+        except ClassNotFound:
+            pass
+    return get_lexer_by_name('text', stripnl=False)
+
+
+def _key(code, language, style):
+    return hashlib.sha1('\0'.join([
+        str(HIGHLIGHT_VERSION), pygments.__version__,
+        language or '', style, code
+    ]).encode('utf-8')).hexdigest()
+
+
+def highlight(code, language='python', style=THEMES['light'],
+              cache_dir=CACHE_DIR):
+    '''
+    `code` tokenized by Pygments, as a `<pre>` of class `highlight-<style>`
+    containing CSS-classed `<span>`s.
+
+    Fragments are cached in memory and as files in `cache_dir`, keyed by
+    a hash of the code, the language and the style, so each block is only
+    tokenized once across restarts.
+    '''
+    key = _key(code, language, style)
+    with _cache_lock:
+        markup = _cache.get(key)
+    if markup is not None:
+        return markup
+
+    cache_path = os.path.join(cache_dir, '{}.html'.format(key))
+    if os.path.exists(cache_path):
+        with io.open(cache_path, encoding='utf-8') as f:
+            markup = f.read()
+    else:
+        markup = u'<pre class="highlight highlight-{}"><code>{}</code></pre>'
+        markup = markup.format(
+            style,
+            pygments.highlight(code, _lexer(code, language),
+                               HtmlFormatter(nowrap=True))
+        )
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        with io.open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(markup)
+        os.rename(tmp_path, cache_path)
+
+    with _cache_lock:
+        _cache[key] = markup
+    return markup
+
+
+def stylesheet(themes=THEMES):
+    '''The CSS of assets/highlight.css, for the Pygments styles of `themes`.'''
+    rules = ['.highlight { margin: 0; padding: 0.5em; overflow-x: auto; }']
+    for style in sorted(set(themes.values())):
+        rules.append('.highlight-{} {{ background: {}; }}'.format(
+            style, HtmlFormatter(style=style).style.background_color))
+        # newer Pygments also emit unprefixed rules, e.g. for `pre`
+        rules += [
+            rule for rule in HtmlFormatter(style=style).get_style_defs(
+                '.highlight-{}'.format(style)).splitlines()
+            if rule.startswith('.highlight-')
+        ]
+    return '\n'.join(rules) + '\n'
+
+
+def PreHighlighted(code, language='python', theme='light', customStyle=None):
+    '''
+    Drop-in for `dcc.SyntaxHighlighter` that ships the code already
+    highlighted, so that the browser doesn't tokenize it on every visit.
+    '''
+    if isinstance(code, (list, tuple)):
+        code = ''.join(code)
+    return html.Div(
+        DangerouslySetInnerHTML(highlight(code, language, THEMES[theme])),
+        style=customStyle
+    )
+
+
+def _prehighlighted(component):
+    if (isinstance(component, dcc.SyntaxHighlighter) and
+            set_props(component) <= PRERENDERED_PROPS and
+            getattr(component, 'children', None) is not None):
+        return PreHighlighted(
+            component.children,
+            getattr(component, 'language', None),
+            getattr(component, 'theme', None) or 'light',
+            getattr(component, 'customStyle', None)
+        )
+
+
+def prerender(tree):
+    '''
+    Replace the static `dcc.SyntaxHighlighter`s of a layout by
+    `PreHighlighted` blocks, in place (see `replace_components`).
+    '''
+    return replace_components(tree, _prehighlighted)
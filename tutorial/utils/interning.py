@@ -0,0 +1,160 @@
+import hashlib
+import json
+import re
+
+import plotly
+from dash.development.base_component import Component
+
+# JSON of the placeholder `FragmentEncoder` writes for a component
+_PLACEHOLDER = re.compile(r'"\\u0000(\d+)\\u0000"')
+
+
+def _encode(value):
+    return json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder,
+                      sort_keys=True)
+
+
+def _digest(*parts):
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part)
+    return sha.digest()
+
+
+class FragmentEncoder(plotly.utils.PlotlyJSONEncoder):
+    '''
+    Dash's encoder, except that the components in `fragments`, a dict by
+    id, are written as placeholders (see `dumps_with_fragments`).
+    '''
+
+    def __init__(self, fragments=None, **kwargs):
+        super(FragmentEncoder, self).__init__(**kwargs)
+        self.fragments = fragments
+
+    def default(self, obj):
+        if isinstance(obj, Component):
+            if id(obj) in self.fragments:
+                return u'\0{}\0'.format(id(obj))
+            return obj.to_plotly_json()
+        return super(FragmentEncoder, self).default(obj)
+
+
+def dumps_with_fragments(value, fragments, fragment_json):
+    '''
+    `value` serialized like `json.dumps(value, cls=PlotlyJSONEncoder)`,
+    except that the JSON of the components in `fragments` (a dict by id)
+    is `fragment_json(component)`, e.g. JSON encoded ahead of time.
+    '''
+    return _PLACEHOLDER.sub(
+        lambda match: fragment_json(fragments[int(match.group(1))]),
+        json.dumps(value, cls=FragmentEncoder, fragments=fragments))
+
+
+class Interner(object):
+    '''
+    Hash-consing for layout fragments that are never modified once built,
+    like the chapters: structurally identical components (same type and
+    props, children included) are replaced by a single shared instance,
+    and so are identical `style` dicts.
+
+    Children are interned before their parent, so a component is keyed by
+    a digest of its own props and of its children's digests, and a whole
+    layout is interned in time linear in its size. Interned components
+    that are used more than once also share their serialized JSON (see
+    `dumps`).
+    '''
+
+    def __init__(self):
+        self._components = {}
+        self._styles = {}
+        # the interned components used more than once, by id
+        self._shared = {}
+        self._json = {}
+        self.nodes = 0
+        self.shared_nodes = 0
+        self.shared_bytes = 0
+        self.styles = 0
+        self.shared_styles = 0
+
+    def intern(self, tree):
+        '''
+        Intern the components of `tree`, in place; returns the tree, or
+        its interned instance if it is a component itself.
+        '''
+        return self._intern(tree)[0]
+
+    def _intern(self, value):
+        # returns (interned value, digest, JSON size, number of components,
+        # and how many of those components and bytes were shared)
+        if isinstance(value, (list, tuple)):
+            interned = [self._intern(item) for item in value]
+            if isinstance(value, list):
+                value[:] = [item[0] for item in interned]
+            else:
+                value = tuple(item[0] for item in interned)
+            return (
+                value,
+                _digest(b'list', *[item[1] for item in interned]),
+                2 + sum(item[2] + 2 for item in interned),
+                sum(item[3] for item in interned),
+                sum(item[4] for item in interned),
+                sum(item[5] for item in interned)
+            )
+        if not isinstance(value, Component):
+            encoded = _encode(value)
+            return (value, _digest(b'value', encoded.encode('utf-8')),
+                    len(encoded), 0, 0, 0)
+
+        self.nodes += 1
+        props = value.to_plotly_json()['props']
+        if isinstance(props.get('style'), dict):
+            value.style = props['style'] = self._intern_style(props['style'])
+        children_digest = b''
+        size = count = shared = shared_size = 0
+        if 'children' in props:
+            (value.children, children_digest, size, count, shared,
+             shared_size) = self._intern(props.pop('children'))
+        own = _encode([value._namespace, value._type, props])
+        size += len(own)
+        count += 1
+        digest = _digest(b'component', own.encode('utf-8'), children_digest)
+
+        interned = self._components.setdefault(digest, value)
+        if interned is not value:
+            self._shared[id(interned)] = interned
+            # the whole subtree is shared, not only the parts found so far
+            self.shared_nodes += count - shared
+            self.shared_bytes += size - shared_size
+            shared, shared_size = count, size
+        return interned, digest, size, count, shared, shared_size
+
+    def _intern_style(self, style):
+        self.styles += 1
+        interned = self._styles.setdefault(_encode(style), style)
+        if interned is not style:
+            self.shared_styles += 1
+        return interned
+
+    def dumps(self, value):
+        '''
+        `value` serialized like `json.dumps(value, cls=PlotlyJSONEncoder)`.
+        The JSON of each shared component is computed once and reused.
+        '''
+        return dumps_with_fragments(value, self._shared, self._fragment)
+
+    def _fragment(self, component):
+        fragment = self._json.get(id(component))
+        if fragment is None:
+            fragment = self._json[id(component)] = self.dumps(
+                component.to_plotly_json())
+        return fragment
+
+    def report(self):
+        return {
+            'components': self.nodes,
+            'unique components': len(self._components),
+            'shared components': self.shared_nodes,
+            'shared bytes': self.shared_bytes,
+            'styles': self.styles,
+            'shared styles': self.shared_styles
+        }
@@ -0,0 +1,29 @@
+def replace_components(tree, replace):
+    '''
+    Walk a layout and substitute `replace(component)` for each component
+    for which it doesn't return `None`; the replacements are not walked.
+
+    Components and lists are updated in place so that the other references
+    to them (e.g. the `/all` page) see the change too. Returns the tree, or
+    its replacement.
+    '''
+    if isinstance(tree, list):
+        for i, child in enumerate(tree):
+            tree[i] = replace_components(child, replace)
+        return tree
+    if isinstance(tree, tuple):
+        return tuple(replace_components(child, replace) for child in tree)
+    replacement = replace(tree)
+    if replacement is not None:
+        return replacement
+    if getattr(tree, 'children', None) is not None:
+        tree.children = replace_components(tree.children, replace)
+    return tree
+
+
+def set_props(component):
+    '''The names of the props of `component` that are set.'''
+    return set(
+        prop for prop in component._prop_names
+        if getattr(component, prop, None) is not None
+    )
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RingBuffer(object):
+    '''
+    Fixed-size, NumPy-backed buffer of the most recent `size` samples.
+
+    `columns` maps column names to dtypes. Every appended sample gets a
+    sequence number (the first sample is 1), so readers can ask for what
+    they haven't seen yet. Appends and reads are guarded by a lock and
+    reads return copies, so a snapshot never changes under its reader.
+    '''
+
+    def __init__(self, size, columns):
+        self.size = size
+        self.columns = list(columns)
+        self._data = {
+            name: np.zeros(size, dtype=dtype)
+            for name, dtype in columns.items()
+        }
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def sequence(self):
+        '''Sequence number of the newest sample, 0 if empty.'''
+        return self._count
+
+    def extend(self, **columns):
+        lengths = set(len(values) for values in columns.values())
+        if len(lengths) != 1 or set(columns) != set(self.columns):
+            raise ValueError(
+                'Expected equal length arrays for columns {}'.format(
+                    self.columns))
+        n = lengths.pop()
+        with self._lock:
+            # only the last `size` samples of a large batch survive
+            skip = max(n - self.size, 0)
+            index = (self._count + skip + np.arange(n - skip)) % self.size
+            for name, values in columns.items():
+                self._data[name][index] = np.asarray(values)[skip:]
+            self._count += n
+        return self._count
+
+    def append(self, **sample):
+        return self.extend(**{k: [v] for k, v in sample.items()})
+
+    def snapshot(self, since=0):
+        '''
+        Return `(sequence, columns)` where `columns` holds, oldest first,
+        the samples with a sequence number greater than `since` that are
+        still in the buffer.
+        '''
+        with self._lock:
+            count = self._count
+            n = max(min(count - max(since, 0), self.size), 0)
+            index = (count - n + np.arange(n)) % self.size
+            return count, {
+                name: values[index] for name, values in self._data.items()
+            }
+
+
+def extend_data(buffer, since, traces, max_points=None):
+    '''
+    Build a `dcc.Graph` `extendData` value holding only the samples of
+    `buffer` that are newer than sequence number `since`.
+
+    `traces` lists, for each trace index of the graph, a dict mapping a
+    trace attribute (`x`, `y`, `text`, ...) to a buffer column. Returns
+    `(sequence, value)`; `value` is `None` when there is nothing new.
+    A client that has fallen behind by more than the buffer size, or that
+    reconnects with `since=0`, catches up with whatever the buffer holds.
+    '''
+    sequence, columns = buffer.snapshot(since)
+    if since > sequence:
+        # the stream restarted after the client last read from it
+        sequence, columns = buffer.snapshot(0)
+    elif sequence == since:
+        return sequence, None
+    attributes = set(a for trace in traces for a in trace)
+    update = {
+        a: [columns[trace[a]] if a in trace else [] for trace in traces]
+        for a in attributes
+    }
+    value = [update, list(range(len(traces)))]
+    if max_points is not None:
+        value.append(max_points)
+    return sequence, value
+
+
+class Producer(object):
+    '''
+    Runs `sample(times)` in a single background thread every `interval`
+    seconds and appends the result to `buffer`.
+
+    `sample` is called with a NumPy array of `datetime64` timestamps and
+    must return a dict of arrays, one entry per buffer column, so that the
+    initial backfill of the whole buffer is a single vectorized call.
+    Errors raised by `sample` are logged and the next interval is tried
+    again. Each function in `listeners` is called with the buffer's new
+    sequence number after every tick.
+    '''
+
+    def __init__(self, buffer, sample, interval, backfill=True):
+        self.buffer = buffer
+        self.sample = sample
+        self.interval = interval
+        self.backfill = backfill
+        self.listeners = []
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+    def tick(self, now=None):
+        now = np.datetime64(int((now or time.time()) * 1000), 'ms')
+        if self.backfill and self.buffer.sequence == 0:
+            step = np.timedelta64(int(self.interval * 1000), 'ms')
+            times = now - step * np.arange(self.buffer.size)[::-1]
+        else:
+            times = np.array([now])
+        sequence = self.buffer.extend(**self.sample(times))
+        for listener in self.listeners:
+            listener(sequence)
+        return sequence
+
+    def _run(self):
+        next_tick = time.time()
+        while not self._stopped.is_set():
+            try:
+                self.tick()
+            except Exception:
+                # a failed sample leaves a gap; the thread keeps going
+                logger.exception('Live data producer failed to sample')
+            next_tick += self.interval
+            self._stopped.wait(max(next_tick - time.time(), 0))
+
+
+_producers = {}
+_producers_lock = threading.Lock()
+
+
+def producer(name, factory):
+    '''
+    Return the running producer registered under `name`, creating and
+    starting it with `factory()` the first time, so that every callback
+    in the process reads from the same buffer.
+    '''
+    with _producers_lock:
+        if name not in _producers:
+            _producers[name] = factory().start()
+        return _producers[name]
@@ -0,0 +1,128 @@
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+
+import commonmark
+import dash_core_components as dcc
+import dash_html_components as html
+from dash_dangerously_set_inner_html import DangerouslySetInnerHTML
+
+from tutorial.utils.layout_tree import replace_components, set_props
+
+# Bump when the rendering changes, to invalidate cached HTML.
+MARKDOWN_VERSION = 1
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-markdown')
+# Props a `dcc.Markdown` can have and still be pre-rendered. Ones with an
+# `id` may be the output of a callback and are left alone.
+PRERENDERED_PROPS = {'children', 'className', 'dangerously_allow_html'}
+# `dcc.Markdown` follows GitHub Flavored Markdown, which CommonMark doesn't
+# cover: tables, strikethrough, task lists and bare URL and email autolinks.
+# Blocks with any of the characters these start with are left to the
+# browser, even when the characters are in code.
+GFM_SYNTAX = re.compile(r'[|~@]|://|www\.|^ *(?:[-+*]|\d+[.)]) +\[[ xX]\]',
+                        re.MULTILINE)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class _EscapingRenderer(commonmark.HtmlRenderer):
+    # like `dcc.Markdown` without `dangerously_allow_html`, show raw HTML
+    # as text rather than dropping it
+    def html_inline(self, node, entering):
+        self.lit(self.escape(node.literal))
+
+    def html_block(self, node, entering):
+        self.cr()
+        self.lit(self.escape(node.literal))
+        self.cr()
+
+
+def is_commonmark(text):
+    '''
+    Whether `text` renders the same as CommonMark and as GitHub Flavored
+    Markdown, i.e. has none of the syntax of `GFM_SYNTAX`.
+    '''
+    return GFM_SYNTAX.search(text) is None
+
+
+def _key(text, allow_html):
+    return hashlib.sha1('\0'.join([
+        str(MARKDOWN_VERSION), 'html' if allow_html else 'text', text
+    ]).encode('utf-8')).hexdigest()
+
+
+def render(text, allow_html=False, cache_dir=CACHE_DIR):
+    '''
+    CommonMark `text` as HTML, with raw HTML escaped unless `allow_html`,
+    as `dcc.Markdown` would show it.
+
+    Results are cached in memory and as files in `cache_dir`, keyed by a
+    hash of the text, so each block is only rendered once across restarts
+    and changing a chapter only renders the blocks that changed.
+    '''
+    key = _key(text, allow_html)
+    with _cache_lock:
+        markup = _cache.get(key)
+    if markup is not None:
+        return markup
+
+    cache_path = os.path.join(cache_dir, '{}.html'.format(key))
+    if os.path.exists(cache_path):
+        with io.open(cache_path, encoding='utf-8') as f:
+            markup = f.read()
+    else:
+        renderer = (commonmark.HtmlRenderer() if allow_html
+                    else _EscapingRenderer())
+        markup = renderer.render(commonmark.Parser().parse(text))
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        with io.open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(markup)
+        os.rename(tmp_path, cache_path)
+
+    with _cache_lock:
+        _cache[key] = markup
+    return markup
+
+
+def PreRendered(text, className=None, dangerously_allow_html=False):
+    '''
+    Drop-in for `dcc.Markdown` that ships the text already rendered to
+    HTML, so that the browser doesn't parse it on every visit.
+    '''
+    if isinstance(text, (list, tuple)):
+        text = '\n'.join(text)
+    return html.Div(
+        DangerouslySetInnerHTML(render(text, dangerously_allow_html)),
+        className=className
+    )
+
+
+def _prerendered(component):
+    if (isinstance(component, dcc.Markdown) and
+            set_props(component) <= PRERENDERED_PROPS and
+            getattr(component, 'children', None) is not None):
+        text = component.children
+        if isinstance(text, (list, tuple)):
+            text = '\n'.join(text)
+        if not is_commonmark(text):
+            return None
+        return PreRendered(
+            text,
+            getattr(component, 'className', None),
+            getattr(component, 'dangerously_allow_html', None) or False
+        )
+
+
+def prerender(tree):
+    '''
+    Replace the static `dcc.Markdown`s of a layout by `PreRendered`
+    blocks, in place (see `replace_components`). Blocks that may use
+    GitHub Flavored Markdown (see `is_commonmark`) are kept.
+    '''
+    return replace_components(tree, _prerendered)
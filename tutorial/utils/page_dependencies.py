@@ -0,0 +1,164 @@
+import hashlib
+
+import flask
+from dash.dependencies import ClientsideFunction, Input, Output, State
+from dash.development.base_component import Component
+
+from tutorial.utils.callback_registry import DEPENDENCIES_PATH
+
+
+def layout_ids(tree, expansions=None):
+    '''
+    The ids of the components of a layout, and of the subtrees in
+    `expansions` (a dict by id) that callbacks put in the components.
+    '''
+    expansions = expansions or {}
+    ids = set()
+    pending = [tree]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (list, tuple)):
+            pending.extend(value)
+        elif isinstance(value, Component):
+            component_id = getattr(value, 'id', None)
+            if component_id is not None and component_id not in ids:
+                ids.add(component_id)
+                if component_id in expansions:
+                    pending.append(expansions[component_id])
+            pending.append(getattr(value, 'children', None))
+    return ids
+
+
+def partition(registry, pages, expansions=None):
+    '''
+    The callback ids each page of `pages` (layouts by key) needs, by key,
+    and the ids of the callbacks found on no page at all, e.g. those of
+    the app itself. A page gets the callbacks of the components in its
+    layout or in its `expansions`, with the other callbacks of the same
+    owner (see `CallbackRegistry`), e.g. those of components that an
+    example creates in a callback, and the callbacks found on no page.
+    '''
+    page_ids = dict((key, layout_ids(layout, expansions))
+                    for key, layout in pages.items())
+    everywhere = set()
+    callbacks = dict((key, set()) for key in page_ids)
+    for owner, callback_ids in registry.owners.items():
+        owner_pages = set()
+        for key, ids in page_ids.items():
+            for callback_id in callback_ids:
+                if registry.component_ids(callback_id) & ids:
+                    callbacks[key].add(callback_id)
+                    owner_pages.add(key)
+        placed = set().union(*[callbacks[key] for key in owner_pages])
+        unplaced = set(callback_ids) - placed
+        if not owner_pages:
+            everywhere.update(unplaced)
+        for key in owner_pages:
+            callbacks[key].update(unplaced)
+    return dict(
+        (key, frozenset(ids | everywhere)) for key, ids in callbacks.items()
+    ), frozenset(everywhere)
+
+
+class PageDependencies(object):
+    '''
+    Gives each page of the app only the callbacks it needs, rather than
+    those of every chapter and example.
+
+    `pages` maps keys to layouts and `page(pathname)` gives the key of the
+    page at a pathname, or `None` for all the callbacks (e.g. `/all`); see
+    `partition` for the callbacks of a page.
+
+    dash-renderer fetches `_dash-dependencies` once, when the app loads,
+    so that view only sends the callbacks found on no page, the router's
+    among them. The router is a chain of callbacks that runs on every
+    change of `location`'s pathname, initial load included:
+
+    - a callback sends the callbacks of the new page, unless the page
+      has the same ones as the previous page;
+    - `pages.install` (assets/page-dependencies.js) replaces the
+      callbacks of the renderer with them, then sets the `pathname`
+      store to the pathname;
+    - the callback that shows the page takes that store as its input
+      instead of the pathname, so that the page arrives once its
+      callbacks are in place.
+    '''
+
+    def __init__(self, registry, pages, page, expansions=None,
+                 location='location', dependencies='page-dependencies',
+                 pathname='page-pathname'):
+        self.registry = registry
+        self.pages = pages
+        self.page = page
+        self.expansions = expansions or {}
+        # callback ids by page, computed once all callbacks are registered
+        self._callbacks = None
+        self._everywhere = None
+        self._registered = None
+        self._keys = {}
+        app = registry.app
+        app.server.view_functions[
+            app.config.routes_pathname_prefix + DEPENDENCIES_PATH
+        ] = self.serve
+
+        app.callback(Output(dependencies, 'data'),
+                     [Input(location, 'pathname')],
+                     [State(dependencies, 'data')])(self.route)
+        app.clientside_callback(
+            ClientsideFunction('pages', 'install'),
+            Output(pathname, 'data'),
+            [Input(dependencies, 'data')]
+        )
+
+    def callbacks(self, key):
+        '''The ids of the callbacks of page `key`.'''
+        self._update()
+        return self._callbacks.get(key, self._callbacks[None])
+
+    @property
+    def everywhere(self):
+        '''The ids of the callbacks that are found on no page.'''
+        self._update()
+        return self._everywhere
+
+    def _update(self):
+        if self._registered == len(self.registry.callbacks):
+            return
+        self._callbacks, self._everywhere = partition(
+            self.registry, self.pages, self.expansions)
+        self._callbacks[None] = frozenset(self.registry.callbacks)
+        self._registered = len(self.registry.callbacks)
+        self._keys.clear()
+
+    def _key(self, callback_ids):
+        key = self._keys.get(callback_ids)
+        if key is None:
+            key = self._keys[callback_ids] = hashlib.sha1(
+                ' '.join(sorted(callback_ids)).encode('utf-8')
+            ).hexdigest()[:16]
+        return key
+
+    def route(self, pathname, previous):
+        '''
+        The callbacks of the page at `pathname` for `pages.install`, as
+        `_dash-dependencies` would send them. `dependencies` is `None`
+        when they are the ones of the `previous` page.
+        '''
+        if pathname is None:
+            return {'pathname': None, 'key': None, 'dependencies': None}
+        callback_ids = self.callbacks(self.page(pathname))
+        key = self._key(callback_ids)
+        return {
+            'pathname': pathname,
+            'key': key,
+            'dependencies': None if previous and previous['key'] == key
+            else self.registry.dependencies_json(callback_ids)
+        }
+
+    def serve(self):
+        callback_ids = self.everywhere
+        response = flask.Response(
+            self.registry.dependencies_json(callback_ids),
+            mimetype='application/json')
+        response.set_etag(self._key(callback_ids))
+        return response.make_conditional(flask.request)
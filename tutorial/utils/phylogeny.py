@@ -0,0 +1,200 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+
+import numpy as np
+from Bio import Phylo
+
+# Bump when the generated elements change, to invalidate cached files.
+ELEMENTS_VERSION = 2
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-phylogeny')
+
+
+def flatten(tree):
+    '''
+    List the clades of a `Bio.Phylo` tree in preorder without recursion.
+
+    Returns `(clades, parent)` where `parent[i]` is the index of the
+    parent of `clades[i]` (-1 for the root). In preorder every parent
+    comes before its children and the first child of `i` is `i + 1`.
+    '''
+    clades = []
+    parent = []
+    stack = [(tree.root, -1)]
+    while stack:
+        clade, parent_index = stack.pop()
+        index = len(clades)
+        clades.append(clade)
+        parent.append(parent_index)
+        for child in reversed(clade.clades):
+            stack.append((child, index))
+    return clades, np.array(parent, dtype=np.int64)
+
+
+def _sum_to_root(parent, values):
+    # Pointer jumping: after k rounds every node has added up the values
+    # of its 2**k nearest ancestors, so this takes log2(depth) rounds of
+    # vectorized work instead of one Python step per node.
+    total = values.astype(np.float64)
+    ancestor = parent.copy()
+    while (ancestor >= 0).any():
+        has_ancestor = ancestor >= 0
+        total[has_ancestor] += total[ancestor[has_ancestor]]
+        ancestor[has_ancestor] = ancestor[ancestor[has_ancestor]]
+    return total
+
+
+def col_positions(clades, parent, column_width=80):
+    terminal = np.array([not c.clades for c in clades])
+    branch_length = np.array([c.branch_length or 0 for c in clades],
+                             dtype=np.float64)
+    branch_length[0] = 0
+    depths = _sum_to_root(parent, branch_length)
+    # If there are no branch lengths, assume unit branch lengths
+    if not depths.max():
+        unit = np.ones(len(clades))
+        unit[0] = 0
+        depths = _sum_to_root(parent, unit)
+
+    max_label_width = max(len(str(c)) for c, t in zip(clades, terminal) if t)
+    drawing_width = column_width - max_label_width - 1
+    # Potential drawing overflow due to rounding -- 1 char per tree layer
+    fudge_margin = int(math.ceil(math.log(terminal.sum(), 2)))
+    cols_per_branch_unit = (drawing_width - fudge_margin) / depths.max()
+    return (depths * cols_per_branch_unit + 1.0).astype(np.int64)
+
+
+def _deepest_first(parent, nodes):
+    # `nodes` split into groups of equal depth, deepest group first
+    level = _sum_to_root(parent, np.ones(len(parent))).astype(np.int64)
+    nodes = nodes[np.argsort(-level[nodes], kind='mergesort')]
+    return np.split(nodes, np.flatnonzero(np.diff(level[nodes])) + 1)
+
+
+def row_positions(clades, parent):
+    n = len(clades)
+    index = np.arange(n)
+    terminal = np.array([not c.clades for c in clades])
+    rows = np.zeros(n, dtype=np.int64)
+    rows[terminal] = 2 * np.arange(terminal.sum())
+
+    last_child = np.full(n, -1, dtype=np.int64)
+    np.maximum.at(last_child, parent[1:], index[1:])
+
+    # Parents sit halfway between their first and last child; fill them
+    # in one tree level at a time, deepest first.
+    for at_level in _deepest_first(parent, index[~terminal]):
+        rows[at_level] = (rows[at_level + 1] + rows[last_child[at_level]]) // 2
+    return rows
+
+
+def subtree_ends(parent):
+    '''
+    In preorder the subtree of clade `i` is the contiguous range
+    `[i, end[i])`, so each clade's descendants can be selected with two
+    numeric comparisons instead of walking the tree.
+    '''
+    n = len(parent)
+    size = np.ones(n, dtype=np.int64)
+    for at_level in _deepest_first(parent, np.arange(1, n)):
+        np.add.at(size, parent[at_level], size[at_level])
+    return np.arange(n) + size
+
+
+def generate_elements(tree, xlen=30, ylen=30, grabbable=False):
+    '''
+    Compile a `Bio.Phylo` tree into Cytoscape nodes and edges drawn as a
+    rectangular cladogram, like the `usage-phylogeny.py` example but
+    without recursion, so it works on trees of any depth.
+
+    Clade `i` (in preorder) gets the id `c<i>`; the support node that makes
+    the right angle between it and its parent gets `s<i>`. The two edges
+    drawn from clade `p` to each of its children carry `cladeOrder` (`p`)
+    and `cladeEnd`, so the edges of the subtree below `p` are exactly
+    `edge[cladeOrder >= p][cladeOrder < cladeEnd]`, as in the example's
+    `color_children` callback.
+    '''
+    clades, parent = flatten(tree)
+    x = (col_positions(clades, parent) * xlen).tolist()
+    y = (row_positions(clades, parent) * ylen).tolist()
+    end = subtree_ends(parent).tolist()
+    parent = parent.tolist()
+
+    nodes = []
+    edges = []
+    for i, clade in enumerate(clades):
+        node = {
+            'data': {'id': 'c{}'.format(i)},
+            'position': {'x': x[i], 'y': y[i]},
+            'classes': 'nonterminal',
+            'grabbable': grabbable
+        }
+        if not clade.clades:
+            node['data']['name'] = clade.name
+            node['classes'] = 'terminal'
+        elif clade.confidence and clade.confidence.value:
+            node['data']['confidence'] = clade.confidence.value
+        nodes.append(node)
+
+        p = parent[i]
+        if p < 0:
+            continue
+        # Edge config: parent -> support -> child
+        nodes.append({
+            'data': {'id': 's{}'.format(i)},
+            'position': {'x': x[p], 'y': y[i]},
+            'grabbable': grabbable,
+            'classes': 'support'
+        })
+        edges.append({'data': {
+            'source': 'c{}'.format(p),
+            'target': 's{}'.format(i),
+            'sourceCladeId': 'c{}'.format(p),
+            'cladeOrder': p,
+            'cladeEnd': end[p]
+        }})
+        edges.append({'data': {
+            'source': 's{}'.format(i),
+            'target': 'c{}'.format(i),
+            'length': clades[p].branch_length,
+            'sourceCladeId': 'c{}'.format(p),
+            'cladeOrder': p,
+            'cladeEnd': end[p]
+        }})
+    return nodes, edges
+
+
+def load_elements(path, file_format='phyloxml', cache_dir=CACHE_DIR,
+                  **kwargs):
+    '''
+    Read the tree at `path` and return its `(nodes, edges)`.
+
+    The result is cached as JSON in `cache_dir`, keyed by a hash of the
+    file's contents and the `generate_elements` arguments, so the tree is
+    only parsed and compiled again when the file changes.
+    '''
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    digest.update(json.dumps(
+        [ELEMENTS_VERSION, file_format, sorted(kwargs.items())]
+    ).encode('utf-8'))
+    cache_path = os.path.join(cache_dir, '{}.json'.format(digest.hexdigest()))
+
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        return cached['nodes'], cached['edges']
+
+    nodes, edges = generate_elements(Phylo.read(path, file_format), **kwargs)
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    tmp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+    with open(tmp_path, 'w') as f:
+        json.dump({'nodes': nodes, 'edges': edges}, f)
+    os.rename(tmp_path, cache_path)
+    return nodes, edges
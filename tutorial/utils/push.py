@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from collections import deque
+
+import flask
+import plotly
+
+from tutorial.utils.live import extend_data
+
+
+class Subscription(object):
+    def __init__(self, max_queue):
+        self.messages = deque()
+        self.max_queue = max_queue
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def put(self, event_id, message):
+        with self.condition:
+            if len(self.messages) >= self.max_queue:
+                # A slow consumer: rather than buffering without bound,
+                # drop it. The browser's EventSource reconnects with the
+                # id of the last event it saw and catches up from there.
+                self.closed = True
+            else:
+                self.messages.append((event_id, message))
+            self.condition.notify()
+
+    def get(self, timeout):
+        with self.condition:
+            if not self.messages and not self.closed:
+                self.condition.wait(timeout)
+            if self.messages:
+                return self.messages.popleft()
+            return None, None
+
+
+class Broadcaster(object):
+    '''
+    Fans out published messages to every current subscriber over
+    Server-Sent Events, so that viewers of a live page receive updates
+    instead of polling for them with `dcc.Interval`.
+
+    Messages are serialized once per publish, not once per subscriber.
+    Each subscriber buffers at most `max_queue` messages; one that falls
+    further behind is disconnected.
+    '''
+
+    def __init__(self, max_queue=32):
+        self.max_queue = max_queue
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def subscribe(self):
+        subscription = Subscription(self.max_queue)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, data, event_id=None, event=None):
+        message = format_event(data, event_id, event)
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.put(event_id, message)
+            if subscription.closed:
+                self.unsubscribe(subscription)
+
+
+def format_event(data, event_id=None, event=None):
+    lines = []
+    if event_id is not None:
+        lines.append('id: {}'.format(event_id))
+    if event is not None:
+        lines.append('event: {}'.format(event))
+    lines.append('data: {}'.format(
+        json.dumps(data, cls=plotly.utils.PlotlyJSONEncoder)))
+    return '\n'.join(lines) + '\n\n'
+
+
+def event_stream(broadcaster, catch_up=None, last_event_id=None,
+                 heartbeat=15):
+    '''
+    Generator of SSE chunks for one client.
+
+    `catch_up(last_event_id)` may return `(event_id, data)` for a client
+    that reconnects after missing events. A comment line is sent every
+    `heartbeat` seconds without events so that dead connections are
+    noticed and proxies don't time the stream out.
+    '''
+    subscription = broadcaster.subscribe()
+    caught_up = None
+    try:
+        if catch_up is not None:
+            missed = catch_up(last_event_id)
+            if missed is not None:
+                caught_up = missed[0]
+                yield format_event(missed[1], missed[0])
+        last_sent = time.time()
+        while not subscription.closed:
+            event_id, message = subscription.get(heartbeat)
+            if message is not None:
+                # skip what was published while catching up and already sent
+                if (caught_up is None or event_id is None or
+                        event_id > caught_up):
+                    yield message
+                    last_sent = time.time()
+            elif time.time() - last_sent >= heartbeat:
+                yield ': heartbeat\n\n'
+                last_sent = time.time()
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def add_stream_route(server, path, broadcaster, catch_up=None, **kwargs):
+    '''
+    Serve `broadcaster` as an event stream at `path` on the Flask `server`.
+
+    Every subscriber holds its connection open, so serve the app with an
+    async worker, e.g. `gunicorn -k gevent run:server`.
+    '''
+    def stream():
+        last_event_id = flask.request.headers.get('Last-Event-ID')
+        response = flask.Response(
+            flask.stream_with_context(event_stream(
+                broadcaster, catch_up, last_event_id, **kwargs)),
+            mimetype='text/event-stream'
+        )
+        response.headers['Cache-Control'] = 'no-cache'
+        # ask nginx-style proxies not to buffer the stream
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
+    server.add_url_rule(
+        path, endpoint='stream-{}'.format(path), view_func=stream)
+
+
+def stream_producer(producer, broadcaster, traces, max_points=None):
+    '''
+    Publish the new samples of a `tutorial.utils.live.Producer` to
+    `broadcaster` as `dcc.Graph` `extendData` values after every tick,
+    using buffer sequence numbers as event ids.
+
+    Returns the `catch_up` function to pass to `add_stream_route`: new
+    clients get the whole buffer and reconnecting clients the samples
+    after their `Last-Event-ID`.
+    '''
+    state = {'sequence': producer.buffer.sequence}
+
+    def publish(sequence):
+        since, state['sequence'] = state['sequence'], sequence
+        _, value = extend_data(producer.buffer, since, traces, max_points)
+        if value is not None:
+            broadcaster.publish(value, sequence)
+
+    def catch_up(last_event_id):
+        try:
+            since = int(last_event_id)
+        except (TypeError, ValueError):
+            since = 0
+        sequence, value = extend_data(
+            producer.buffer, since, traces, max_points)
+        if value is None:
+            return None
+        return sequence, value
+
+    producer.listeners.append(publish)
+    return catch_up
@@ -0,0 +1,272 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+from scipy import ndimage
+from skimage import color, draw, morphology, segmentation
+from skimage.color.colorlabel import DEFAULT_COLORS
+
+try:
+    from urllib.request import urlopen
+except ImportError:
+    from urllib2 import urlopen
+
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-images')
+PALETTE = np.array([color.color_dict[name] for name in DEFAULT_COLORS])
+
+
+def cached_image(url, cache_dir=CACHE_DIR):
+    '''
+    Local path of a copy of the image at `url`, downloaded on first use,
+    so that apps don't fetch their source images again on every start.
+    '''
+    extension = os.path.splitext(url.split('?')[0])[1]
+    path = os.path.join(cache_dir, hashlib.sha1(
+        url.encode('utf-8')).hexdigest() + extension)
+    if not os.path.exists(path):
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        response = urlopen(url)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(response.read())
+        finally:
+            response.close()
+        os.rename(tmp_path, path)
+    return path
+
+
+def png_data_url(array, compress_level=1):
+    '''
+    Like `dash_canvas.utils.array_to_data_url`, with a fast zlib level:
+    level 1 encodes several times faster than Pillow's default for
+    slightly bigger files.
+    '''
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format='png',
+                                compress_level=compress_level)
+    return 'data:image/png;base64,' + \
+        base64.b64encode(buffer.getvalue()).decode('utf-8')
+
+
+def overlay(labels, gray, alpha=0.3):
+    '''
+    Color `labels` over the `gray` image (floats in [0, 1]) like
+    `skimage.color.label2rgb(labels, image=gray)`, except that the color
+    of a label depends only on its value, so parts of the image can be
+    colored separately. Returns RGB `uint8`.
+    '''
+    colors = PALETTE[(labels - 1) % len(PALETTE)]
+    return ((alpha * colors + (1 - alpha) * gray[..., None]) * 255).astype(
+        np.uint8)
+
+
+def stroke_paths(string):
+    '''
+    `(key, path, scale)` for each path object of a `DashCanvas`
+    `json_data` string, in drawing order, where `key` identifies the
+    object. Scales are the ones `dash_canvas.utils.parse_jsonstring` uses.
+    '''
+    try:
+        data = json.loads(string)
+    except ValueError:
+        return []
+    scale = 1
+    paths = []
+    for obj in data['objects']:
+        if obj['type'] == 'image':
+            scale = obj['scaleX']
+        elif obj['type'] == 'path':
+            key = hashlib.sha1(
+                json.dumps(obj, sort_keys=True).encode('utf-8')).hexdigest()
+            paths.append((key, obj, scale))
+    return paths
+
+
+def rasterize(obj, scale, shape):
+    '''
+    Pixels painted by one path object, as in `parse_jsonstring`, but only
+    drawn and dilated inside the path's bounding box.
+
+    Returns `(box, stroke)`: a pair of slices into an array of `shape` and
+    the boolean stroke inside it, with a margin of one pixel so that the
+    pixels touching the stroke are inside the box too.
+    '''
+    path = obj['path']
+    factor = scale / obj['scaleX']
+    rows, cols = [], []
+    for q1, q2 in zip(path[:-2], path[1:-1]):
+        rr, cc = draw.bezier_curve(
+            int(round(q1[-1] / factor)), int(round(q1[-2] / factor)),
+            int(round(q2[2] / factor)), int(round(q2[1] / factor)),
+            int(round(q2[4] / factor)), int(round(q2[3] / factor)), 1)
+        rows.append(rr)
+        cols.append(cc)
+    radius = int(round(obj['strokeWidth'] / 2. / scale))
+    if not rows:
+        return None, None
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    inside = ((rows >= 0) & (rows < shape[0]) &
+              (cols >= 0) & (cols < shape[1]))
+    rows, cols = rows[inside], cols[inside]
+    if not len(rows):
+        return None, None
+
+    margin = radius + 1
+    top, left = max(rows.min() - margin, 0), max(cols.min() - margin, 0)
+    bottom = min(rows.max() + margin + 1, shape[0])
+    right = min(cols.max() + margin + 1, shape[1])
+    stroke = np.zeros((bottom - top, right - left), dtype=bool)
+    stroke[rows - top, cols - left] = True
+    stroke = ndimage.binary_dilation(stroke, morphology.disk(radius))
+    return (slice(top, bottom), slice(left, right)), stroke
+
+
+def prepare_image(image, sigma=4):
+    '''
+    `(gray, gradient)` for an image: the gray image used for display and
+    the watershed landscape of `dash_canvas.utils.watershed_segmentation`.
+    '''
+    if image.ndim > 2:
+        image = color.rgb2gray(image)
+    gray = image.astype(np.float64)
+    if gray.max() > 1:
+        gray /= 255.
+    return gray, -ndimage.gaussian_gradient_magnitude(image, sigma)
+
+
+class SegmentationSession(object):
+    '''
+    Watershed segmentation of one image that follows the annotations of a
+    `DashCanvas` as they are drawn, for one user.
+
+    The image gradient is computed once. On each `update`, only the
+    strokes that were not seen before are rasterized, into the stored
+    mask and markers, and the watershed is recomputed only in the regions
+    whose label a new stroke touched; the other labels are reused. Undoing
+    or deleting strokes starts again from the current annotations.
+    '''
+
+    def __init__(self, gray, gradient, alpha=0.3):
+        self.gray = gray
+        self.gradient = gradient
+        self.alpha = alpha
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.strokes = []
+        self.markers = np.zeros(self.gray.shape, dtype=np.int32)
+        self.marker_count = 0
+        self.labels = None
+        self.rendered = (np.repeat(self.gray[..., None], 3, axis=2) *
+                         255).astype(np.uint8)
+
+    def update(self, string):
+        '''Apply the `json_data` string; returns the overlay as RGB.'''
+        paths = stroke_paths(string)
+        keys = [key for key, _, _ in paths]
+        with self.lock:
+            if keys[:len(self.strokes)] != self.strokes:
+                self._reset()
+            affected = set()
+            for _, obj, scale in paths[len(self.strokes):]:
+                affected |= self._add_stroke(obj, scale)
+            self.strokes = keys
+            if affected:
+                self._segment(affected)
+            return self.rendered
+
+    def _add_stroke(self, obj, scale):
+        box, stroke = rasterize(obj, scale, self.markers.shape)
+        if box is None:
+            return set()
+        # markers are the 8-connected components of the mask, as with
+        # `measure.label`. A stroke that leaves the image can be in
+        # several pieces; each joins the markers it touches.
+        connectivity = np.ones((3, 3))
+        pieces, count = ndimage.label(stroke, connectivity)
+        affected = set()
+        for piece in range(1, count + 1):
+            affected |= self._add_piece(box, pieces == piece, connectivity)
+        return affected
+
+    def _add_piece(self, box, stroke, connectivity):
+        markers = self.markers[box]
+        touching = ndimage.binary_dilation(stroke, connectivity)
+        touched = np.unique(markers[touching])
+        touched = touched[touched > 0]
+        if not len(touched):
+            self.marker_count += 1
+            marker = self.marker_count
+        else:
+            marker = touched[0]
+            if len(touched) > 1:
+                self.markers[np.isin(self.markers, touched)] = marker
+        if len(touched) < 2 and (markers[stroke] == marker).all():
+            return set()
+        markers[stroke] = marker
+
+        affected = set(touched.tolist()) | {marker}
+        if self.labels is not None:
+            affected |= set(np.unique(self.labels[box][stroke]).tolist())
+        return affected
+
+    def _segment(self, affected):
+        if self.labels is None:
+            self.labels = segmentation.watershed(self.gradient, self.markers)
+            self.rendered = overlay(self.labels, self.gray, self.alpha)
+            return
+        region = np.isin(self.labels, list(affected))
+        box = ndimage.find_objects(region.astype(np.int8))[0]
+        region = region[box]
+        labels = segmentation.watershed(
+            self.gradient[box], np.where(region, self.markers[box], 0),
+            mask=region)
+        self.labels[box][region] = labels[region]
+        rendered = overlay(self.labels[box], self.gray[box], self.alpha)
+        self.rendered[box][region] = rendered[region]
+
+
+class SegmentationSessions(object):
+    '''
+    Per-user `SegmentationSession`s, keeping the `max_entries` most
+    recently used. Images are prepared once and shared by the sessions
+    that use them.
+    '''
+
+    def __init__(self, max_entries=32, sigma=4):
+        self.max_entries = max_entries
+        self.sigma = sigma
+        self._sessions = OrderedDict()
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id, image_key, load_image):
+        '''
+        The session of `session_id` for the image `image_key`;
+        `load_image()` returns the image array the first time it is used.
+        '''
+        key = (session_id, image_key)
+        with self._lock:
+            if key in self._sessions:
+                self._sessions[key] = self._sessions.pop(key)
+                return self._sessions[key]
+            prepared = self._images.get(image_key)
+        if prepared is None:
+            prepared = prepare_image(load_image(), self.sigma)
+        with self._lock:
+            self._images.setdefault(image_key, prepared)
+            session = self._sessions.setdefault(
+                key, SegmentationSession(*self._images[image_key]))
+            while len(self._sessions) > self.max_entries:
+                self._sessions.popitem(last=False)
+            return session
@@ -0,0 +1,229 @@
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Protocol 5 (Python 3.8+) hands large buffers like numpy arrays to a
+# callback instead of copying them into the pickle stream.
+PickleBuffer = getattr(pickle, 'PickleBuffer', None)
+
+
+class MemoryBackend(object):
+    '''
+    Keeps frames as live objects in this process: reads cost nothing, but
+    the data isn't shared between gunicorn workers.
+
+    Frames are saved and read as shallow copies, so callbacks can add or
+    replace columns, but the values themselves are shared: treat them as
+    read-only.
+    '''
+
+    def save(self, key, df):
+        return df.copy(deep=False), int(df.memory_usage(deep=True).sum())
+
+    def find(self, key):
+        return None
+
+    def load(self, handle):
+        return handle.copy(deep=False)
+
+    def delete(self, handle):
+        pass
+
+
+class FileSystemBackend(object):
+    '''
+    Writes frames to `directory` and memory-maps them back on read.
+
+    With pyarrow installed frames are stored in the Arrow IPC file format.
+    Otherwise they are pickled with protocol 5 and their array buffers
+    written out-of-band after the pickle stream, so loading wraps the
+    mapped pages instead of copying them. On Pythons without protocol 5
+    this falls back to a plain pickle.
+
+    Frames saved by other processes with the same `directory` are found
+    too, so gunicorn workers share them.
+    '''
+
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def save(self, key, df):
+        path = self._path(key)
+        tmp_path = '{}.{}.tmp'.format(path, threading.current_thread().ident)
+        with open(tmp_path, 'wb') as f:
+            if pa is not None:
+                table = pa.Table.from_pandas(df)
+                writer = pa.ipc.new_file(f, table.schema)
+                writer.write_table(table)
+                writer.close()
+            elif PickleBuffer is not None:
+                _write_out_of_band(f, df)
+            else:
+                pickle.dump(df, f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_path, path)
+        return path, os.path.getsize(path)
+
+    def find(self, key):
+        # (path, size, creation time) of a frame saved by another process
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return path, stat.st_size, stat.st_mtime
+
+    def load(self, path):
+        if pa is not None:
+            return pa.ipc.open_file(pa.memory_map(path)).read_pandas()
+        if PickleBuffer is not None:
+            return _read_out_of_band(path)
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def delete(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # already removed by another process
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{}.frame'.format(key))
+
+
+def _write_out_of_band(f, df):
+    buffers = []
+    data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+    views = [b.raw() for b in buffers]
+    f.write(struct.pack('<QQ', len(data), len(views)))
+    f.write(struct.pack('<{}Q'.format(len(views)), *[v.nbytes for v in views]))
+    f.write(data)
+    for view in views:
+        f.write(view)
+
+
+def _read_out_of_band(path):
+    with open(path, 'rb') as f:
+        # copy-on-write so that callbacks can still modify the frame
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    view = memoryview(mapped)
+    length, count = struct.unpack_from('<QQ', mapped, 0)
+    offset = 16
+    sizes = struct.unpack_from('<{}Q'.format(count), mapped, offset)
+    offset += 8 * count
+    data = view[offset:offset + length]
+    offset += length
+    buffers = []
+    for size in sizes:
+        buffers.append(view[offset:offset + size])
+        offset += size
+    return pickle.loads(data, buffers=buffers)
+
+
+class SessionDatasetStore(object):
+    '''
+    Caches one or more DataFrames per session.
+
+    `get(session_id, name, compute)` returns the cached frame or calls
+    `compute()` to create it. Concurrent callers asking for the same
+    (session, name) wait on a shared lock, so the computation runs once.
+    Entries are evicted least-recently-used first once there are more
+    than `max_entries` of them or they take more than `max_bytes`, and
+    expire `timeout` seconds after they were computed. With a
+    `FileSystemBackend` these limits apply to the frames each process
+    knows of; a frame removed by another process is computed again.
+    '''
+
+    def __init__(self, backend=None, max_entries=200,
+                 max_bytes=2 * 1024 ** 3, timeout=None):
+        self.backend = backend or MemoryBackend()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._computing = {}
+
+    def get(self, session_id, name, compute):
+        key = (session_id, name)
+        df = self._load(key)
+        if df is not None:
+            return df
+
+        with self._lock:
+            key_lock = self._computing.setdefault(key, threading.Lock())
+        with key_lock:
+            df = self._load(key)
+            if df is None:
+                try:
+                    df = compute()
+                    handle, size = self.backend.save(self._name(key), df)
+                    with self._lock:
+                        self._insert(key, handle, size, time.time())
+                finally:
+                    with self._lock:
+                        self._computing.pop(key, None)
+        return df
+
+    def delete(self, session_id, name=None):
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == session_id and name in (None, key[1]):
+                    self._evict(key)
+
+    def _name(self, key):
+        return '{}-{}'.format(*key)
+
+    def _load(self, key):
+        with self._lock:
+            handle = self._lookup(key)
+        if handle is None:
+            return None
+        try:
+            return self.backend.load(handle)
+        except (IOError, OSError):
+            # evicted since the lookup, by this or another process
+            return None
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self.backend.find(self._name(key))
+            if entry is None:
+                return None
+            self._insert(key, *entry)
+        handle, size, created = entry
+        if self.timeout is not None and time.time() - created > self.timeout:
+            self._evict(key)
+            return None
+        self._entries[key] = self._entries.pop(key)
+        return handle
+
+    def _insert(self, key, handle, size, created):
+        if key in self._entries:
+            # backends store entries by name, so the new save already
+            # replaced the old data
+            self._evict(key, delete=False)
+        self._entries[key] = (handle, size, created)
+        self._bytes += size
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or
+                self._bytes > self.max_bytes):
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key, delete=True):
+        handle, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        if delete:
+            self.backend.delete(handle)
@@ -1,10 +1,54 @@
+import importlib
+import json
+import threading
+from collections import OrderedDict
+from textwrap import dedent as s
+
 import dash_core_components as dcc
 import dash_html_components as html
+from six import string_types
 
-from tutorial import styles
-from textwrap import dedent as s
+from tutorial.utils.component_block import example_block
 
-from tutorial.utils.component_block import ComponentBlock
+_sections = {}
+_lock = threading.Lock()
+
+
+def python_source(value, indent=''):
+    '''
+    Source of a literal `value` (numbers, strings, booleans, `None`, lists
+    and dicts of them), with one item per line for non-empty dicts.
+    '''
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        inner = indent + '  '
+        return '{\n' + ',\n'.join(
+            '{}{}: {}'.format(inner, python_source(key),
+                              python_source(value[key], inner))
+            for key in value
+        ) + '\n' + indent + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ', '.join(
+            python_source(item, indent) for item in value) + ']'
+    if isinstance(value, string_types):
+        return "'{}'".format(
+            value.replace('\\', '\\\\').replace("'", "\\'")
+            .replace('\n', '\\n'))
+    return repr(value)
+
+
+def example_source(component_name, library_name, library_short, props):
+    '''The example that creates `component_name` with `props`.'''
+    lines = ['  {}={}'.format(key, python_source(value, '  '))
+             for key, value in props.items()]
+    return '''import {} as {}
+
+{}.{}({})'''.format(library_name.replace('-', '_'),
+                    library_short,
+                    library_short,
+                    component_name,
+                    '\n' + ',\n'.join(lines) + '\n' if lines else '')
 
 
 def generate_code_container(
@@ -17,7 +61,10 @@ def generate_code_container(
 ):
     '''
     Generates a section for the component specified, including pretty-printed 
-    code containing top-level props (not dicts) and style dictionaries.
+    code containing its props and the component itself, both made from the
+    same props: the example is not executed.
+
+    Sections are cached per version of the library.
 
     :param (str) component_name: The component name in camelcase with the first 
                                  letter also capitalized. 
@@ -27,47 +74,28 @@ def generate_code_container(
     :param (bool) default_id: Whether or not to generate an id for the
                               component. Can be useful for custom styling. 
     :param (dict) props: A dictionary of the component's keys and the values 
-                         corresponding to those keys. 
+                         corresponding to those keys, as Python values. 
     :param (dict) style: A dictionary that determines the styling of the 
                          component, if 'style' is a property of that component.
                          (Will fail if this is not true.) 
     '''
-    propString = '\n  '
-    if(default_id):
-        propString += 'id=\'my-{}-{}\', '.format(
-            library_short,
-            component_name.lower())
-
-    if props is not None:
-        for key in props.keys():
-            propString += '{}={}, '.format(key, props[key])
-
+    library = importlib.import_module(library_name.replace('-', '_'))
+    key = (library_name, getattr(library, '__version__', None),
+           component_name, default_id, description,
+           json.dumps([props, style], sort_keys=True))
+    with _lock:
+        if key in _sections:
+            return list(_sections[key])
+
+    all_props = OrderedDict()
+    if default_id:
+        all_props['id'] = 'my-{}-{}'.format(
+            library_short, component_name.lower())
+    all_props.update(props or {})
     if style is not None:
-        styleString = 'style={\n  '
-        for key in style.keys():
-            styleString += '  \'{}\': \'{}\', '.format(
-                key,
-                str(style[key])
-            )
-        styleString = styleString[:-2]
-        styleString += '\n  }, '
-        propString += styleString
- 
-    propString = propString.replace(', ', ',\n  ')
-
-    if(len(propString) > 4): 
-        propString = propString[:-4] + '\n'
-    else:
-        propString = ''
-
-    example_string = '''import {} as {}
+        all_props['style'] = style
 
-{}.{}({})'''.format(library_name.replace('-', '_'),
-                    library_short,
-                    library_short, 
-                    component_name,
-                    propString)
-    return [
+    section = [
 
         html.Hr(),
 
@@ -79,8 +107,10 @@ def generate_code_container(
         
         dcc.Markdown(s(description)),
         
-        ComponentBlock(
-            example_string
+        example_block(
+            example_source(component_name, library_name, library_short,
+                           all_props),
+            getattr(library, component_name)(**all_props)
         ),
 
         html.Br(), 
@@ -90,6 +120,9 @@ def generate_code_container(
                      library_name,
                      component_name.lower()))
     ]
+    with _lock:
+        _sections[key] = section
+    return list(section)
 
 
 def generate_docs(
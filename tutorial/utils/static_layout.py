@@ -0,0 +1,171 @@
+import json
+
+import dash
+import flask
+import plotly
+from dash.dash import _create_callback_id
+from dash.development.base_component import Component
+from dash.exceptions import PreventUpdate
+
+from tutorial.utils.interning import dumps_with_fragments
+
+UPDATE_PATH = '_dash-update-component'
+
+
+def callback_ids(app):
+    '''The ids of the components used by the callbacks of `app`.'''
+    ids = set()
+    for callback_id, callback in app.callback_map.items():
+        if callback_id.startswith('..'):
+            outputs = callback_id[2:-2].split('...')
+        else:
+            outputs = [callback_id]
+        ids.update(output.rsplit('.', 1)[0] for output in outputs)
+        ids.update(dependency['id'] for dependency in
+                   callback['inputs'] + callback['state'])
+    return ids
+
+
+def _components(value):
+    # the components of a `children` value, in nested lists too
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            for component in _components(item):
+                yield component
+    elif isinstance(value, Component):
+        yield value
+
+
+class StaticLayout(object):
+    '''
+    Serializes layouts made of fragments that are compiled ahead of time.
+
+    `compile` finds the static subtrees of a layout, the ones in which no
+    component has an id in `dynamic_ids` (usually `callback_ids(app)`).
+    `dumps` encodes each of them once and afterwards splices its JSON
+    into the output as it is, so that only the dynamic components around
+    them, and whatever is not compiled (e.g. a wrapper made per request),
+    are encoded again.
+
+    Compiled layouts must not be modified afterwards.
+    '''
+
+    def __init__(self, dynamic_ids=()):
+        self.dynamic_ids = set(dynamic_ids)
+        # the roots of the static subtrees, by id
+        self._static = {}
+        self._json = {}
+
+    def compile(self, tree):
+        static = {}
+        self._find_static(tree, static)
+        for component in _components(tree):
+            self._add_roots(component, static)
+        return tree
+
+    def _find_static(self, value, static):
+        # whether `value` is static, recording it for each component
+        if isinstance(value, (list, tuple)):
+            return all([self._find_static(item, static) for item in value])
+        if not isinstance(value, Component):
+            return True
+        is_static = self._find_static(
+            getattr(value, 'children', None), static
+        ) and getattr(value, 'id', None) not in self.dynamic_ids
+        static[id(value)] = is_static
+        return is_static
+
+    def _add_roots(self, component, static):
+        if static[id(component)]:
+            self._static[id(component)] = component
+        else:
+            for child in _components(getattr(component, 'children', None)):
+                self._add_roots(child, static)
+
+    def dumps(self, value):
+        '''`value` serialized like Dash's `PlotlyJSONEncoder` would.'''
+        return dumps_with_fragments(value, self._static, self._fragment)
+
+    def _fragment(self, component):
+        fragment = self._json.get(id(component))
+        if fragment is None:
+            fragment = self._json[id(component)] = json.dumps(
+                component.to_plotly_json(),
+                cls=plotly.utils.PlotlyJSONEncoder)
+        return fragment
+
+    def report(self):
+        return {
+            'static subtrees': len(self._static),
+            'encoded subtrees': len(self._json),
+            'encoded bytes': sum(len(text) for text in self._json.values())
+        }
+
+
+class _UpdateView(object):
+    # Dash's `_dash-update-component` view, except for the callbacks of
+    # `callback`, whose responses are serialized with their `StaticLayout`
+
+    def __init__(self, app):
+        self.app = app
+        # layout and output, by callback id
+        self.callbacks = {}
+        endpoint = app.config['routes_pathname_prefix'] + UPDATE_PATH
+        self.dispatch = app.server.view_functions[endpoint]
+        app.server.view_functions[endpoint] = self
+
+    def __call__(self):
+        body = flask.request.get_json()
+        registered = self.callbacks.get(body['output'])
+        if registered is None:
+            return self.dispatch()
+        layout, output, func = registered
+
+        # the arguments and the context, as `Dash.dispatch` sets them
+        values = {}
+        for name in ['inputs', 'state']:
+            values[name] = dict(
+                ('{}.{}'.format(c['id'], c['property']), c.get('value'))
+                for c in body.get(name, [])
+            )
+        flask.g.input_values = values['inputs']
+        flask.g.state_values = values['state']
+        flask.g.triggered_inputs = [
+            {'prop_id': prop_id, 'value': values['inputs'][prop_id]}
+            for prop_id in body.get('changedPropIds') or []
+        ]
+        registration = self.app.callback_map[body['output']]
+        args = [
+            values[name]['{}.{}'.format(c['id'], c['property'])]
+            for name in ['inputs', 'state'] for c in registration[name]
+        ]
+
+        value = func(*args)
+        if value is dash.no_update:
+            raise PreventUpdate
+        return flask.Response(
+            '{{"response": {{"props": {{{}: {}}}}}}}'.format(
+                json.dumps(output.component_property), layout.dumps(value)),
+            mimetype='application/json')
+
+
+def callback(app, layout, output, inputs=[], state=[]):
+    '''
+    `app.callback` for a single `output`, whose responses are serialized
+    with `layout.dumps`, a `StaticLayout`, so that the compiled fragments
+    they contain aren't encoded again on every call.
+
+    The callback is registered with Dash as usual; the
+    `_dash-update-component` view of `app` is taken over to answer it.
+    '''
+    view = app.server.view_functions.get(
+        app.config['routes_pathname_prefix'] + UPDATE_PATH)
+    if not isinstance(view, _UpdateView):
+        view = _UpdateView(app)
+
+    def wrap_func(func):
+        app.callback(output, inputs, state)(func)
+        view.callbacks[_create_callback_id(output)] = (layout, output, func)
+        return func
+
+    return wrap_func
@@ -0,0 +1,335 @@
+import base64
+import hashlib
+import io
+import mimetypes
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+import flask
+import pandas as pd
+from PIL import Image
+
+# base64 decodes 4 characters into 3 bytes, so chunk boundaries must fall
+# on a multiple of 4 characters.
+DECODE_CHUNK = 4 * 256 * 1024
+CSV_CHUNK_ROWS = 50000
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+IMAGE_STORE_DIR = os.path.join(tempfile.gettempdir(), 'dash-docs-images')
+
+SIGNATURES = [
+    (b'PK\x03\x04', 'xlsx'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'xls'),
+]
+
+
+def spool_contents(contents, chunk=DECODE_CHUNK):
+    '''
+    Decode the base64 data URL supplied by `dcc.Upload` into a spooled
+    temporary file, `chunk` characters at a time.
+
+    Only one decoded chunk is held in memory at once; files larger than
+    `SPOOL_MAX_SIZE` are rolled over to disk. The returned file is
+    positioned at the start; close it, e.g. with `with`, to free it.
+    '''
+    start = contents.index(',') + 1
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    for i in range(start, len(contents), chunk):
+        spool.write(base64.b64decode(contents[i:i + chunk]))
+    spool.seek(0)
+    return spool
+
+
+def sniff_format(f, filename=''):
+    '''
+    Guess the format of an uploaded file from its leading bytes, falling
+    back to the filename extension. Returns 'csv', 'xls' or 'xlsx'.
+    '''
+    head = f.read(8)
+    f.seek(0)
+    for signature, file_format in SIGNATURES:
+        if head.startswith(signature):
+            return file_format
+    if filename.lower().endswith(('.xls', '.xlsx')):
+        return filename.lower().rsplit('.', 1)[-1]
+    return 'csv'
+
+
+def iter_csv(f, chunksize=CSV_CHUNK_ROWS, encoding='utf-8'):
+    '''
+    Yield DataFrames of at most `chunksize` rows.
+
+    The column dtypes are inferred from the first chunk and enforced on
+    the rest, so every chunk has the same schema and the parser skips
+    per-chunk type inference. If a later chunk doesn't fit the inferred
+    types (e.g. missing values in an integer column) the file is re-read
+    with per-chunk inference from where the typed read stopped.
+    '''
+    dtypes = pd.read_csv(f, nrows=chunksize, encoding=encoding).dtypes
+    f.seek(0)
+    rows = 0
+    try:
+        for chunk in pd.read_csv(f, dtype=dtypes.to_dict(),
+                                 chunksize=chunksize, encoding=encoding):
+            rows += len(chunk)
+            yield chunk
+        return
+    except ValueError:
+        pass
+    f.seek(0)
+    for chunk in pd.read_csv(f, skiprows=range(1, rows + 1),
+                             chunksize=chunksize, encoding=encoding):
+        yield chunk
+
+
+def read_upload(contents, filename='', chunksize=CSV_CHUNK_ROWS):
+    '''
+    Parse a `dcc.Upload` `contents` string into a DataFrame without
+    materializing the decoded file as a single bytes or str object.
+    '''
+    with spool_contents(contents) as f:
+        file_format = sniff_format(f, filename)
+        if file_format == 'csv':
+            chunks = list(iter_csv(f, chunksize=chunksize))
+            if len(chunks) == 1:
+                return chunks[0]
+            return pd.concat(chunks, ignore_index=True)
+        return pd.read_excel(f)
+
+
+def decoded_size(contents):
+    '''
+    Size in bytes of the file encoded in a `dcc.Upload` data URL, computed
+    without decoding it.
+    '''
+    start = contents.index(',') + 1
+    padding = contents.count('=', len(contents) - 2)
+    return (len(contents) - start) * 3 // 4 - padding
+
+
+class UploadError(Exception):
+    pass
+
+
+class BatchUploadProcessor(object):
+    '''
+    Processes the files of a `multiple=True` upload concurrently.
+
+    Tabular files are parsed in a process pool (`parse`) and images are
+    handled in a thread pool (`images`; PIL releases the GIL while it
+    decodes and resamples). Results come back in the order the files were
+    given; a file that is larger than `max_bytes`, fails, or isn't done
+    `timeout` seconds after its batch was dispatched is returned as an
+    `UploadError` in its slot instead of failing the whole batch.
+
+    The pools are created on first use, so that a server that imports
+    this before forking its workers doesn't fork running pools, and are
+    shared by all the callbacks of the process. A pool that had a file
+    time out is terminated and replaced by a new one for the next batch:
+    its processes are killed, while stuck threads, which can't be, are
+    left to finish on their own without taking a slot in the new pool.
+    '''
+
+    def __init__(self, processes=None, threads=4,
+                 max_bytes=50 * 1024 * 1024, timeout=30):
+        self.processes = processes or min(multiprocessing.cpu_count(), 4)
+        self.threads = threads
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def parse(self, list_of_contents, list_of_names):
+        '''The DataFrames of the uploaded files, see `read_upload`.'''
+        return self._run('processes', read_upload,
+                         list(zip(list_of_contents, list_of_names)),
+                         list_of_names)
+
+    def images(self, func, list_of_contents, list_of_names):
+        '''`func(contents)` for each uploaded image.'''
+        return self._run('threads', func,
+                         [(contents,) for contents in list_of_contents],
+                         list_of_names)
+
+    def close(self):
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.terminate()
+
+    def _pool(self, kind):
+        with self._lock:
+            pool = self._pools.get(kind)
+            if pool is None:
+                if kind == 'processes':
+                    pool = multiprocessing.Pool(self.processes)
+                else:
+                    pool = ThreadPool(self.threads)
+                self._pools[kind] = pool
+            return pool
+
+    def _recycle(self, kind, pool):
+        with self._lock:
+            if self._pools.get(kind) is pool:
+                del self._pools[kind]
+        pool.terminate()
+
+    def _run(self, kind, func, list_of_args, list_of_names):
+        pool = self._pool(kind)
+        pending = []
+        for args, name in zip(list_of_args, list_of_names):
+            if decoded_size(args[0]) > self.max_bytes:
+                pending.append(UploadError(
+                    '{} is larger than {} bytes'.format(name, self.max_bytes)
+                ))
+            else:
+                pending.append(pool.apply_async(func, args))
+
+        deadline = time.time() + self.timeout
+        results = []
+        timed_out = False
+        for result, name in zip(pending, list_of_names):
+            if isinstance(result, UploadError):
+                results.append(result)
+                continue
+            try:
+                results.append(
+                    result.get(max(deadline - time.time(), 0)))
+            except multiprocessing.TimeoutError:
+                timed_out = True
+                results.append(UploadError(
+                    '{} took longer than {} seconds'.format(
+                        name, self.timeout)
+                ))
+            except Exception as e:
+                results.append(UploadError(
+                    'There was an error processing {}: {}'.format(name, e)
+                ))
+        if timed_out:
+            self._recycle(kind, pool)
+        return results
+
+
+class ImageStore(object):
+    '''
+    Uploaded images and their thumbnails, kept as files in `directory` so
+    that every worker process of the server can serve them (`serve`).
+
+    Files are named by a hash of the original image. The store keeps a
+    running total of the bytes it wrote; once that goes over `max_bytes`
+    it rescans the directory, which other processes write to as well, and
+    removes the least recently used images (by modification time, which
+    `serve` refreshes) until it fits again. Images larger than
+    `max_image_bytes` are refused up front with an `UploadError`, so the
+    image just saved is never the one removed.
+    '''
+
+    NAME = re.compile(r'^[0-9a-f]{40}(-thumbnail)?\.\w+$')
+
+    def __init__(self, directory=IMAGE_STORE_DIR,
+                 max_bytes=100 * 1024 * 1024, max_image_bytes=20 * 1024 * 1024,
+                 thumbnail_size=(400, 400)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_image_bytes = max_image_bytes
+        self.thumbnail_size = thumbnail_size
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        self._lock = threading.Lock()
+        self._bytes = sum(size for _, size, _ in self._files())
+
+    def save_upload(self, contents):
+        '''
+        Store the image of a `dcc.Upload` data URL and a JPEG thumbnail of
+        it, and return the names of both.
+        '''
+        size = decoded_size(contents)
+        if size > self.max_image_bytes:
+            raise UploadError('The image is larger than {} bytes'.format(
+                self.max_image_bytes))
+        header, data = contents.split(',', 1)
+        data = base64.b64decode(data)
+        key = hashlib.sha1(data).hexdigest()
+
+        image = Image.open(io.BytesIO(data))
+        extension = mimetypes.guess_extension(
+            header[len('data:'):].split(';')[0]) or '.img'
+        image.thumbnail(self.thumbnail_size)
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        thumbnail = io.BytesIO()
+        image.save(thumbnail, 'JPEG')
+
+        name = key + extension
+        thumbnail_name = key + '-thumbnail.jpg'
+        self._put(name, data)
+        self._put(thumbnail_name, thumbnail.getvalue())
+        return name, thumbnail_name
+
+    def serve(self, name):
+        '''The Flask response for the file `name`, cached for good.'''
+        path = os.path.join(self.directory, name)
+        if not self.NAME.match(name) or not os.path.exists(path):
+            flask.abort(404)
+        os.utime(path, None)
+        response = flask.send_file(
+            path, mimetype=mimetypes.guess_type(name)[0], conditional=False)
+        # the name is a hash of the image, so its contents never change
+        response.headers['Cache-Control'] = \
+            'public, max-age=31536000, immutable'
+        response.set_etag(name)
+        return response.make_conditional(flask.request)
+
+    def _files(self):
+        # (path, size, last use) of the stored files
+        files = []
+        for name in os.listdir(self.directory):
+            if self.NAME.match(name):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue  # removed by another process
+                files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _put(self, name, data):
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            os.utime(path, None)
+            return
+        tmp_path = '{}.{}.tmp'.format(path, threading.current_thread().ident)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.rename(tmp_path, path)
+        with self._lock:
+            self._bytes += len(data)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # an image and its thumbnail are removed together
+        images = {}
+        for path, size, last_use in self._files():
+            key = os.path.basename(path)[:40]
+            paths, total, used = images.get(key, ([], 0, 0))
+            images[key] = (paths + [path], total + size, max(used, last_use))
+        self._bytes = sum(total for _, total, _ in images.values())
+        for paths, total, _ in sorted(images.values(), key=lambda i: i[2]):
+            if self._bytes <= self.max_bytes:
+                break
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._bytes -= total
+
+
+# Shared by the upload examples
+batch_processor = BatchUploadProcessor()